@@ -5,7 +5,7 @@ from alembic import context
 
 # This import is needed to register the models with SQLAlchemy
 from backend.app.models import User, Task  # noqa
-from backend.app.database import SQLModel
+from sqlmodel import SQLModel
 from backend.app.config import settings
 
 # this is the Alembic Config object
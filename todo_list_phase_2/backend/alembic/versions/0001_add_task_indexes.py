@@ -0,0 +1,79 @@
+"""add composite indexes to task
+
+Revision ID: 0001_add_task_indexes
+Revises: 
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '0001_add_task_indexes'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+TASK_INDEXES = {
+    "ix_task_user_id_completed_created_at": ["user_id", "completed", "created_at"],
+    "ix_task_user_id_created_at_id": ["user_id", "created_at", "id"],
+    "ix_task_user_id_id": ["user_id", "id"],
+}
+
+
+def _has_table(name: str) -> bool:
+    # Tables are also created by SQLModel.metadata.create_all() on app startup,
+    # so only create the ones that are missing.
+    # Offline (--sql) mode has no connection to inspect; emit everything.
+    if context.is_offline_mode():
+        return False
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def _existing_indexes() -> set:
+    # create_all() already includes these indexes, so only touch the ones
+    # that differ.
+    if context.is_offline_mode():
+        return set()
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes("task")}
+
+
+def _create_base_tables() -> None:
+    """Create the user and task tables as they were before any migration."""
+    if not _has_table("user"):
+        op.create_table(
+            "user",
+            sa.Column("email", sa.String(length=255), nullable=False, unique=True),
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+    if not _has_table("task"):
+        op.create_table(
+            "task",
+            sa.Column("title", sa.String(length=255), nullable=False),
+            sa.Column("description", sa.String(), nullable=True),
+            sa.Column("completed", sa.Boolean(), nullable=False),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id"), nullable=False),
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+
+def upgrade() -> None:
+    _create_base_tables()
+    existing = _existing_indexes()
+    for name, columns in TASK_INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "task", columns)
+
+
+def downgrade() -> None:
+    existing = _existing_indexes()
+    for name in TASK_INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name="task")
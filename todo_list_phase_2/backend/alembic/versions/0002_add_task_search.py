@@ -0,0 +1,63 @@
+"""add sort indexes and full-text search to task
+
+Revision ID: 0002_add_task_search
+Revises: 0001_add_task_indexes
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+from backend.app.models.task import TASK_SEARCH_DDL
+
+
+# revision identifiers
+revision = '0002_add_task_search'
+down_revision = '0001_add_task_indexes'
+branch_labels = None
+depends_on = None
+
+
+TASK_INDEXES = {
+    "ix_task_user_id_updated_at_id": ["user_id", "updated_at", "id"],
+    "ix_task_user_id_title_id": ["user_id", "title", "id"],
+}
+
+
+def _existing_indexes() -> set:
+    # See 0001: create_all() may already have created these on startup.
+    if context.is_offline_mode():
+        return set()
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes("task")}
+
+
+def upgrade() -> None:
+    existing = _existing_indexes()
+    for name, columns in TASK_INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "task", columns)
+
+    # The search DDL is idempotent (IF NOT EXISTS), so it is safe to run on
+    # databases whose task table was created with it.
+    dialect_name = op.get_context().dialect.name
+    for statement in TASK_SEARCH_DDL.get(dialect_name, []):
+        op.execute(statement)
+    if dialect_name == "sqlite":
+        # Index the rows that existed before the FTS table
+        op.execute("INSERT INTO task_fts(task_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect_name = op.get_context().dialect.name
+    if dialect_name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_task_search")
+    elif dialect_name == "sqlite":
+        for trigger in ("task_fts_ai", "task_fts_ad", "task_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS task_fts")
+
+    existing = _existing_indexes()
+    for name in TASK_INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name="task")
@@ -0,0 +1,46 @@
+"""add per-user task counters
+
+Revision ID: 0003_add_task_stats
+Revises: 0002_add_task_search
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '0003_add_task_stats'
+down_revision = '0002_add_task_search'
+branch_labels = None
+depends_on = None
+
+
+def _has_table() -> bool:
+    # See 0001: create_all() may already have created the table on startup.
+    if context.is_offline_mode():
+        return False
+    return sa.inspect(op.get_bind()).has_table("task_stats")
+
+
+def upgrade() -> None:
+    if not _has_table():
+        op.create_table(
+            "task_stats",
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id"), primary_key=True),
+            sa.Column("total", sa.Integer(), nullable=False),
+            sa.Column("completed", sa.Integer(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+    # Seed the counters from the existing tasks
+    op.execute("DELETE FROM task_stats")
+    op.execute(
+        "INSERT INTO task_stats (user_id, total, completed, updated_at) "
+        "SELECT user_id, COUNT(id), SUM(CASE WHEN completed THEN 1 ELSE 0 END), CURRENT_TIMESTAMP "
+        "FROM task GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("task_stats")
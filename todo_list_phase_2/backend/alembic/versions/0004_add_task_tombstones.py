@@ -0,0 +1,41 @@
+"""add deleted task records for delta sync
+
+Revision ID: 0004_add_task_tombstones
+Revises: 0003_add_task_stats
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '0004_add_task_tombstones'
+down_revision = '0003_add_task_stats'
+branch_labels = None
+depends_on = None
+
+
+def _has_table() -> bool:
+    # See 0001: create_all() may already have created the table on startup.
+    if context.is_offline_mode():
+        return False
+    return sa.inspect(op.get_bind()).has_table("task_tombstone")
+
+
+def upgrade() -> None:
+    if _has_table():
+        return
+    op.create_table(
+        "task_tombstone",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_task_tombstone_user_id_deleted_at", "task_tombstone", ["user_id", "deleted_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_tombstone_user_id_deleted_at", table_name="task_tombstone")
+    op.drop_table("task_tombstone")
@@ -6,6 +6,48 @@ class Settings(BaseSettings):
     jwt_secret: str
     jwt_algorithm: str
     access_token_expire_minutes: int
+    jwt_cache_max_entries: int = 10000
+    # Connection pool and query logging
+    database_echo: bool = False
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_pre_ping: bool = True
+    database_pool_recycle: int = 1800
+    database_statement_timeout_ms: Optional[int] = None
+    database_slow_query_ms: Optional[int] = None
+    # Request metrics served at /metrics; server_timing_enabled adds a
+    # Server-Timing header with app and database time to every response
+    metrics_enabled: bool = True
+    server_timing_enabled: bool = True
+    # Encode task responses with orjson straight from the rows, skipping
+    # response_model validation (requires the orjson package)
+    fast_json_responses: bool = False
+    task_page_size: int = 100
+    task_page_size_max: int = 1000
+    task_bulk_max_size: int = 500
+    task_export_batch_size: int = 1000
+    task_import_batch_size: int = 1000
+    # Task list cache: "none" or "memory" (per-process LRU). Each uvicorn
+    # worker has its own memory cache, so other workers may serve a list
+    # up to task_cache_ttl_seconds old after a write.
+    task_cache_backend: str = "none"
+    task_cache_max_entries: int = 10000
+    task_cache_ttl_seconds: float = 30.0
+    # Delta sync: tokens trail the clock by task_sync_lag_seconds so writes
+    # still committing when a token is issued are included in the next
+    # sync; deletions are reported for task_tombstone_retention_days.
+    task_sync_lag_seconds: float = 5.0
+    task_tombstone_retention_days: int = 30
+    # Server-Sent Events: "none" or "local" (in-process; each worker only
+    # reaches its own connections). Connections whose queue of pending
+    # events fills up are closed with an overflow event.
+    task_events_backend: str = "local"
+    task_events_queue_size: int = 100
+    task_events_heartbeat_seconds: float = 15.0
+    # Serve requests through an AsyncEngine instead of the blocking engine.
+    # async_database_url defaults to database_url with an async driver.
+    use_async_database: bool = False
+    async_database_url: Optional[str] = None
 
     class Config:
         env_file = ".env"
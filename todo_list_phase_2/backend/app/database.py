@@ -1,6 +1,17 @@
 from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
 from .config import settings
-import os
+from .metrics import record_db_statement
+import logging
+import time
+
+slow_query_logger = logging.getLogger(__name__ + ".slow_query")
 
 
 def get_session():
@@ -8,6 +19,128 @@ def get_session():
         yield session
 
 
+async def get_async_session():
+    async with async_session_factory() as session:
+        yield session
+
+
+@asynccontextmanager
+async def stream_session():
+    """Open a session owned by a streaming response rather than the request.
+
+    The body of a StreamingResponse is produced after the handler returns,
+    so it cannot rely on the request-scoped session from get_session.
+    """
+    if settings.use_async_database:
+        async with async_session_factory() as session:
+            yield session
+    else:
+        with Session(engine) as session:
+            yield session
+
+
+def to_async_url(database_url: str) -> str:
+    """Swap the driver of a sync database URL for its asyncio counterpart."""
+    if database_url.startswith(("postgresql://", "postgres://")):
+        url = "postgresql+asyncpg://" + database_url.split("://", 1)[1]
+        # asyncpg spells libpq's sslmode option as ssl
+        return url.replace("sslmode=", "ssl=")
+    if database_url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + database_url.split("://", 1)[1]
+    return database_url
+
+
+def _engine_options(database_url: str, poolclass: Optional[type]) -> Dict[str, Any]:
+    """Build create_engine keyword arguments for the given URL from settings."""
+    options: Dict[str, Any] = {"echo": settings.database_echo}
+    connect_args: Dict[str, Any] = {}
+
+    if database_url.startswith("sqlite"):
+        # SQLite connections may be handed between threadpool workers
+        connect_args["check_same_thread"] = False
+    else:
+        options["pool_pre_ping"] = settings.database_pool_pre_ping
+        options["pool_recycle"] = settings.database_pool_recycle
+        if poolclass is None:
+            options["pool_size"] = settings.database_pool_size
+            options["max_overflow"] = settings.database_max_overflow
+        if settings.database_statement_timeout_ms:
+            timeout = str(settings.database_statement_timeout_ms)
+            if "+asyncpg" in database_url:
+                connect_args["server_settings"] = {"statement_timeout": timeout}
+            else:
+                connect_args["options"] = f"-c statement_timeout={timeout}"
+
+    if poolclass is not None:
+        options["poolclass"] = poolclass
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def _log_slow_queries(sync_engine: Engine, threshold_ms: int) -> None:
+    """Log statements that take at least threshold_ms to execute."""
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start_time"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop("query_start_time", None)
+        if start is None:
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= threshold_ms:
+            slow_query_logger.warning("Slow query (%.1f ms): %s", elapsed_ms, statement)
+
+
+def _count_queries(sync_engine: Engine) -> None:
+    """Feed statement counts and durations to the request metrics."""
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["metrics_start_time"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop("metrics_start_time", None)
+        if start is not None:
+            record_db_statement(time.perf_counter() - start)
+
+
+def create_db_engine(database_url: str, poolclass: Optional[type] = None) -> Engine:
+    """Create the blocking engine configured from settings.
+
+    Pass poolclass to override the pool, e.g. StaticPool for an in-memory
+    SQLite database shared across a test session.
+    """
+    db_engine = create_engine(database_url, **_engine_options(database_url, poolclass))
+    if settings.database_slow_query_ms is not None:
+        _log_slow_queries(db_engine, settings.database_slow_query_ms)
+    if settings.metrics_enabled:
+        _count_queries(db_engine)
+    return db_engine
+
+
+def create_async_db_engine(database_url: str, poolclass: Optional[type] = None) -> AsyncEngine:
+    """Create the async engine configured from settings."""
+    db_engine = create_async_engine(database_url, **_engine_options(database_url, poolclass))
+    if settings.database_slow_query_ms is not None:
+        _log_slow_queries(db_engine.sync_engine, settings.database_slow_query_ms)
+    if settings.metrics_enabled:
+        _count_queries(db_engine.sync_engine)
+    return db_engine
+
+
 # Use the configured database URL from .env file
 # This will connect to your Neon PostgreSQL database
-engine = create_engine(settings.database_url, echo=True)
\ No newline at end of file
+engine = create_db_engine(settings.database_url)
+
+# The async engine is only built when enabled, so the asyncpg/aiosqlite
+# drivers are not needed by deployments that stay on the sync engine.
+async_engine = None
+async_session_factory = None
+if settings.use_async_database:
+    async_engine = create_async_db_engine(settings.async_database_url or to_async_url(settings.database_url))
+    async_session_factory = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
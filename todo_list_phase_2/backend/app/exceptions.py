@@ -22,4 +22,36 @@ class DatabaseOperationException(HTTPException):
         super().__init__(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database operation {operation} failed: {details}"
+        )
+
+
+class InvalidCursorException(HTTPException):
+    def __init__(self, cursor: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid pagination cursor: {cursor}"
+        )
+
+
+class InvalidSyncTokenException(HTTPException):
+    def __init__(self, token: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid sync token: {token}"
+        )
+
+
+class SyncTokenExpiredException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync token is older than the deletion history; reload all tasks"
+        )
+
+
+class BatchTooLargeException(HTTPException):
+    def __init__(self, size: int, max_size: int):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch of {size} items exceeds the maximum of {max_size}"
         )
\ No newline at end of file
@@ -1,7 +1,13 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
+from .config import settings
+from .metrics import metrics
+from .middleware import MetricsMiddleware
 from .routers import tasks_router
+from .routers.tasks import task_list_cache, task_event_broker
 from .database import engine
 from .models import User, Task  # Import models to register them
+from .models.task import create_task_search
 from sqlmodel import SQLModel
 
 
@@ -9,18 +15,33 @@ from sqlmodel import SQLModel
 app = FastAPI(
     title="Todo App API",
     description="REST API for multi-user todo application with JWT authentication",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse if settings.fast_json_responses else JSONResponse
 )
 
 
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware, server_timing=settings.server_timing_enabled)
+
+
 # Include the task router
 app.include_router(tasks_router)
 
 
 @app.on_event("startup")
-def on_startup():
-    """Create database tables on startup."""
+async def on_startup():
+    """Create database tables and start the task event broker on startup."""
     SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        create_task_search(connection)
+    if task_event_broker is not None:
+        await task_event_broker.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    if task_event_broker is not None:
+        await task_event_broker.stop()
 
 
 @app.get("/")
@@ -28,6 +49,28 @@ def read_root():
     return {"message": "Welcome to the Todo App API"}
 
 
+@app.get("/cache/stats")
+def read_cache_stats():
+    """Hit/miss counters of the task list cache."""
+    if task_list_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **task_list_cache.stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def read_metrics():
+    """Request and database metrics in the Prometheus text format."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/events/stats")
+def read_event_stats():
+    """Subscriber and delivery counters of the task event broker."""
+    if task_event_broker is None:
+        return {"enabled": False}
+    return {"enabled": True, **task_event_broker.stats()}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
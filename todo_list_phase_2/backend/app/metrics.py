@@ -0,0 +1,176 @@
+import threading
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric:
+    """A labelled metric rendered in the Prometheus text exposition format."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float]):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket..., sum, total count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for labels, state in sorted(self._values.items()):
+                for bound, count in zip(self.buckets, state):
+                    bucket_labels = _format_labels(self.label_names, labels, f'le="{_format_value(bound)}"')
+                    lines.append(f"{self.name}_bucket{bucket_labels} {_format_value(count)}")
+                inf_labels = _format_labels(self.label_names, labels, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{inf_labels} {_format_value(state[-1])}")
+                label_text = _format_labels(self.label_names, labels)
+                lines.append(f"{self.name}_sum{label_text} {_format_value(state[-2])}")
+                lines.append(f"{self.name}_count{label_text} {_format_value(state[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """The metrics recorded by MetricsMiddleware and the database hooks."""
+
+    def __init__(self):
+        self.requests_in_progress = Gauge(
+            "http_requests_in_progress", "HTTP requests currently being served.", ["method"]
+        )
+        self.request_duration = Histogram(
+            "http_request_duration_seconds", "HTTP request latency, including streaming the body.",
+            ["method", "route", "status"], LATENCY_BUCKETS
+        )
+        self.response_size = Histogram(
+            "http_response_size_bytes", "HTTP response body size.", ["method", "route"], SIZE_BUCKETS
+        )
+        self.request_db_statements = Histogram(
+            "http_request_db_statements", "Database statements executed per HTTP request.",
+            ["method", "route"], QUERY_COUNT_BUCKETS
+        )
+        self.request_db_duration = Histogram(
+            "http_request_db_duration_seconds", "Time spent in database statements per HTTP request.",
+            ["method", "route"], LATENCY_BUCKETS
+        )
+        self.db_statements = Counter("db_statements_total", "Database statements executed.")
+        self.db_duration = Counter("db_statement_duration_seconds_total", "Time spent in database statements.")
+
+    def render(self) -> str:
+        metrics = (
+            self.requests_in_progress, self.request_duration, self.response_size,
+            self.request_db_statements, self.request_db_duration, self.db_statements, self.db_duration
+        )
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+
+class RequestDatabaseStats:
+    """Database statements and time attributed to the current request."""
+
+    def __init__(self):
+        self.statements = 0
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, duration: float) -> None:
+        # Statements of one request may run on several threadpool threads
+        with self._lock:
+            self.statements += 1
+            self.duration += duration
+
+
+metrics = MetricsRegistry()
+
+# Set by MetricsMiddleware for each request. The stats object is shared
+# (not copied) with the threadpool and greenlet contexts the request's
+# database work runs in, so statements executed there are counted too.
+_request_db_stats: ContextVar[Optional[RequestDatabaseStats]] = ContextVar("request_db_stats", default=None)
+
+
+def start_request_db_stats() -> RequestDatabaseStats:
+    stats = RequestDatabaseStats()
+    _request_db_stats.set(stats)
+    return stats
+
+
+def end_request_db_stats() -> None:
+    _request_db_stats.set(None)
+
+
+def record_db_statement(duration: float) -> None:
+    """Count a finished statement globally and for the current request."""
+    metrics.db_statements.inc()
+    metrics.db_duration.inc(amount=duration)
+    stats = _request_db_stats.get()
+    if stats is not None:
+        stats.record(duration)
@@ -1,3 +1,4 @@
-from .jwt_middleware import JWTBearer
+from .jwt_middleware import JWTBearer, get_token_payload
+from .metrics import MetricsMiddleware
 
-__all__ = ["JWTBearer"]
\ No newline at end of file
+__all__ = ["JWTBearer", "get_token_payload", "MetricsMiddleware"]
@@ -1,32 +1,89 @@
-from fastapi import HTTPException, Security
+from fastapi import HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from typing import Optional
+import hashlib
+import threading
+import time
 import jwt
 from ..config import settings
 
 
+class VerifiedTokenCache:
+    """Bounded LRU of verified token payloads, keyed by token hash.
+
+    Each entry expires at the token's exp claim, so a cached token stops
+    being accepted exactly when jwt.decode would start rejecting it.
+    """
+
+    # Tokens without an exp claim are re-verified at least this often
+    DEFAULT_TTL_SECONDS = 300
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(payload)
+
+    def set(self, token: str, payload: dict) -> None:
+        expires_at = payload.get("exp", time.time() + self.DEFAULT_TTL_SECONDS)
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+verified_token_cache = VerifiedTokenCache(settings.jwt_cache_max_entries)
+
+
 class JWTBearer(HTTPBearer):
     def __init__(self, auto_error: bool = True):
         super(JWTBearer, self).__init__(auto_error=auto_error)
 
-    async def __call__(self, credentials: HTTPAuthorizationCredentials = Security(HTTPBearer())):
+    async def __call__(self, request: Request):
+        credentials: Optional[HTTPAuthorizationCredentials] = await super(JWTBearer, self).__call__(request)
         if credentials:
             if not credentials.scheme == "Bearer":
                 raise HTTPException(status_code=403, detail="Invalid authentication scheme.")
-            if not self.verify_jwt(credentials.credentials):
+            payload = decode_access_token(credentials.credentials)
+            if payload is None:
                 raise HTTPException(status_code=403, detail="Invalid token or expired token.")
+            # Handlers read the verified claims from here instead of decoding again
+            request.state.jwt_payload = payload
             return credentials.credentials
         else:
             raise HTTPException(status_code=403, detail="Invalid authorization code.")
 
     def verify_jwt(self, jwt_token: str) -> bool:
-        try:
-            payload = jwt.decode(jwt_token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-            return True
-        except jwt.ExpiredSignatureError:
-            return False
-        except jwt.InvalidTokenError:
-            return False
+        return decode_access_token(jwt_token) is not None
+
+
+def get_token_payload(request: Request) -> dict:
+    """Dependency returning the claims verified by JWTBearer for this request."""
+    return request.state.jwt_payload
 
 
 def create_access_token(data: dict):
@@ -38,10 +95,14 @@ def create_access_token(data: dict):
 
 
 def decode_access_token(token: str):
+    payload = verified_token_cache.get(token)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-        return payload
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
-        return None
\ No newline at end of file
+        return None
+    verified_token_cache.set(token, payload)
+    return payload
@@ -1,4 +1,6 @@
 from .user import User
 from .task import Task
+from .task_stats import TaskStats
+from .task_tombstone import TaskTombstone
 
-__all__ = ["User", "Task"]
\ No newline at end of file
+__all__ = ["User", "Task", "TaskStats", "TaskTombstone"]
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import DDL, Index, event, inspect
 from datetime import datetime
 from typing import Optional
 
@@ -11,6 +12,65 @@ class TaskBase(SQLModel):
 
 
 class Task(TaskBase, table=True):
+    __table_args__ = (
+        # Listing, optionally filtered by completion status, in creation order
+        Index("ix_task_user_id_completed_created_at", "user_id", "completed", "created_at"),
+        # Keyset pagination over (created_at, id) within a user
+        Index("ix_task_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Point lookups, updates and deletes scoped to a user
+        Index("ix_task_user_id_id", "user_id", "id"),
+        # Keyset pagination for the other sort orders
+        Index("ix_task_user_id_updated_at_id", "user_id", "updated_at", "id"),
+        Index("ix_task_user_id_title_id", "user_id", "title", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow})
\ No newline at end of file
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow})
+
+
+# Full-text search over title and description (see services/search.py).
+# Postgres indexes the same tsvector expression the search query uses;
+# SQLite keeps an FTS5 external-content table in sync through triggers.
+TASK_SEARCH_DDL = {
+    "postgresql": [
+        "CREATE INDEX IF NOT EXISTS ix_task_search ON task USING GIN ("
+        "to_tsvector('simple'::regconfig, coalesce(title, '') || ' ' || coalesce(description, '')))",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS task_fts USING fts5("
+        "title, description, content='task', content_rowid='id')",
+        "CREATE TRIGGER IF NOT EXISTS task_fts_ai AFTER INSERT ON task BEGIN "
+        "INSERT INTO task_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+        "CREATE TRIGGER IF NOT EXISTS task_fts_ad AFTER DELETE ON task BEGIN "
+        "INSERT INTO task_fts(task_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); END",
+        "CREATE TRIGGER IF NOT EXISTS task_fts_au AFTER UPDATE OF title, description ON task BEGIN "
+        "INSERT INTO task_fts(task_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); "
+        "INSERT INTO task_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    ],
+}
+
+for _dialect, _statements in TASK_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+
+event.listen(
+    Task.__table__, "after_drop", DDL("DROP TABLE IF EXISTS task_fts").execute_if(dialect="sqlite")
+)
+
+
+def create_task_search(connection) -> None:
+    """Create the search index (or FTS5 table and triggers) if it is missing.
+
+    The after_create DDL above only runs when create_all() creates the task
+    table, so this is also called on startup for databases that predate
+    search. An FTS5 table created here is rebuilt from the existing rows.
+    """
+    dialect_name = connection.dialect.name
+    fts_missing = dialect_name == "sqlite" and not inspect(connection).has_table("task_fts")
+    for statement in TASK_SEARCH_DDL.get(dialect_name, []):
+        connection.exec_driver_sql(statement)
+    if fts_missing:
+        connection.exec_driver_sql("INSERT INTO task_fts(task_fts) VALUES ('rebuild')")
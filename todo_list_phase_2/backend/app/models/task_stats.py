@@ -0,0 +1,13 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+
+
+class TaskStats(SQLModel, table=True):
+    """Per-user task counters, maintained by TaskService on every write."""
+
+    __tablename__ = "task_stats"
+
+    user_id: int = Field(foreign_key="user.id", primary_key=True)
+    total: int = Field(default=0, nullable=False)
+    completed: int = Field(default=0, nullable=False)
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow})
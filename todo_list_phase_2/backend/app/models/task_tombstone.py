@@ -0,0 +1,18 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from datetime import datetime
+from typing import Optional
+
+
+class TaskTombstone(SQLModel, table=True):
+    """Record of a deleted task, kept so delta sync can report deletions."""
+
+    __tablename__ = "task_tombstone"
+    __table_args__ = (
+        Index("ix_task_tombstone_user_id_deleted_at", "user_id", "deleted_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    task_id: int = Field(nullable=False)
+    user_id: int = Field(foreign_key="user.id")
+    deleted_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
@@ -0,0 +1,37 @@
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from typing import Any, Dict, List, Union
+from .config import settings
+from .models import Task
+
+
+def task_to_dict(task: Task) -> Dict[str, Any]:
+    """Serialize a Task row to the fields of the Task response schema."""
+    return {
+        "title": task.title,
+        "description": task.description,
+        "completed": task.completed,
+        "user_id": task.user_id,
+        "id": task.id,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+    }
+
+
+def task_response(content: Union[Task, List[Task]], response: Response, status_code: int = 200) -> Any:
+    """Return task content from an endpoint.
+
+    By default the content is returned unchanged, so FastAPI validates it
+    against the route's response_model and encodes it. With
+    fast_json_responses enabled the rows are converted to dicts directly
+    and encoded with orjson, skipping both steps; headers already set on
+    response are carried over.
+    """
+    if not settings.fast_json_responses:
+        return content
+    if isinstance(content, list):
+        body = [task_to_dict(task) for task in content]
+    else:
+        body = task_to_dict(content)
+    headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return ORJSONResponse(body, status_code=status_code, headers=headers)
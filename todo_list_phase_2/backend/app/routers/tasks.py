@@ -1,11 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
-from typing import List
-from ..database import get_session
-from ..models import Task
-from ..schemas import Task as TaskSchema, TaskCreate, TaskUpdate
-from ..services import TaskService
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from datetime import datetime, timedelta
+from typing import List, Optional
+from ..config import settings
+from ..database import get_session, get_async_session, stream_session
+from ..exceptions import (
+    InvalidCursorException, InvalidSyncTokenException, SyncTokenExpiredException, BatchTooLargeException
+)
+from ..schemas import (
+    Task as TaskSchema, TaskCreate, TaskUpdate, TaskBulkUpdate, TaskBulkResult, TaskFilters, TaskStats, TaskChanges,
+    TaskImportResult
+)
+from ..services import AsyncTaskService, build_task_list_cache, build_task_event_broker
+from ..services.events import stream_events
+from ..services.pagination import encode_sync_token, decode_sync_token
+from ..services.export import EXPORT_MEDIA_TYPES, encode_export
+from ..services.importer import import_tasks as import_task_stream
 from ..middleware.jwt_middleware import JWTBearer
+from ..responses import task_response
 
 router = APIRouter(
     prefix="/api/{user_id}/tasks",
@@ -14,11 +26,63 @@ router = APIRouter(
 )
 
 
+task_list_cache = build_task_list_cache(
+    settings.task_cache_backend,
+    settings.task_cache_max_entries,
+    settings.task_cache_ttl_seconds
+)
+task_event_broker = build_task_event_broker(settings.task_events_backend, settings.task_events_queue_size)
+
+
+async def get_task_service(
+    session=Depends(get_async_session if settings.use_async_database else get_session)
+) -> AsyncTaskService:
+    """Provide the task service on the session type selected in settings."""
+    return AsyncTaskService(session, task_list_cache, task_event_broker)
+
+
+def make_etag(*parts) -> str:
+    """Build a weak ETag from values that change whenever the resource does."""
+    return 'W/"' + "-".join(
+        format(part.timestamp(), ".6f") if isinstance(part, datetime) else str(part)
+        for part in parts
+    ) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:]
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def set_validator_headers(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    # Let browsers keep the body but revalidate it on every use
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def check_batch_size(items: list) -> None:
+    if len(items) > settings.task_bulk_max_size:
+        raise BatchTooLargeException(len(items), settings.task_bulk_max_size)
+
+
 @router.post("/", response_model=TaskSchema, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def create_task(
     user_id: int,
     task_data: TaskCreate,
-    session: Session = Depends(get_session)
+    response: Response,
+    task_service: AsyncTaskService = Depends(get_task_service)
 ):
     """Create a new task for the specified user."""
     # Ensure the user_id in the path matches the one in the token
@@ -26,41 +90,259 @@ def create_task(
 
     # For now, we'll trust the user_id in the path, but in a real implementation
     # we'd verify this against the JWT token
-    task_service = TaskService(session)
 
     # Override user_id to ensure the task belongs to the correct user
     task_data.user_id = user_id
 
     try:
-        task = task_service.create_task(task_data)
-        return task
+        task = await task_service.create_task(task_data)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error creating task: {str(e)}"
         )
+    return task_response(task, response, status.HTTP_201_CREATED)
 
 
 @router.get("/", response_model=List[TaskSchema])
-def get_tasks(
+async def get_tasks(
+    user_id: int,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=settings.task_page_size_max),
+    cursor: Optional[str] = None,
+    completed: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    updated_after: Optional[datetime] = None,
+    updated_before: Optional[datetime] = None,
+    q: Optional[str] = Query(None, max_length=200),
+    sort: str = Query("created_at", pattern="^(created_at|updated_at|title)$"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    if_none_match: Optional[str] = Header(None),
+    task_service: AsyncTaskService = Depends(get_task_service)
+):
+    """Get the tasks of the specified user, oldest first by default.
+
+    Tasks can be filtered by completion status, created_at/updated_at
+    ranges (after is inclusive, before exclusive) and a text search q over
+    title and description, and ordered by created_at, updated_at or title
+    in either direction. All of it is evaluated by the database.
+
+    Without limit or cursor every matching task is returned. Passing
+    either one returns a page (limit defaults to TASK_PAGE_SIZE); when more
+    tasks are available, the cursor for the next page is returned in the
+    X-Next-Cursor header. Pass it back as the cursor query param together
+    with the same filters and sort.
+
+    The weak ETag is derived from the user's task count and latest
+    updated_at, so a matching If-None-Match is answered with 304 without
+    loading any tasks.
+    """
+    count, last_updated = await task_service.get_tasks_version(user_id)
+    etag = make_etag(user_id, count, last_updated or 0)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    filters = TaskFilters(
+        completed=completed,
+        created_after=created_after,
+        created_before=created_before,
+        updated_after=updated_after,
+        updated_before=updated_before,
+        q=q
+    )
+    sort_key = f"-{sort}" if order == "desc" else sort
+    if limit is None and cursor is not None:
+        limit = settings.task_page_size
+    try:
+        tasks, next_cursor = await task_service.get_tasks_page(user_id, limit, cursor, filters, sort_key)
+    except ValueError:
+        raise InvalidCursorException(cursor)
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    set_validator_headers(response, etag)
+    return task_response(tasks, response)
+
+
+# Fixed-path routes (stats, changes, events, export, import, bulk) are registered
+# before the /{task_id} routes so that their names are not captured as a task ID.
+@router.get("/stats", response_model=TaskStats)
+async def get_task_stats(
+    user_id: int,
+    task_service: AsyncTaskService = Depends(get_task_service)
+):
+    """Get the total, completed and pending task counts for the user.
+
+    Served from the per-user counters kept up to date on every write, so it
+    does not scan the user's tasks.
+    """
+    return await task_service.get_task_stats(user_id)
+
+
+@router.get("/changes", response_model=TaskChanges)
+async def get_task_changes(
+    user_id: int,
+    since: Optional[str] = None,
+    task_service: AsyncTaskService = Depends(get_task_service)
+):
+    """Get the tasks created or updated, and the IDs deleted, since a sync token.
+
+    Without since every task is returned. Pass next_token back as since on
+    the next poll. Apply deleted before tasks; a task may be reported again
+    on the following poll, so updates must be idempotent. A token older
+    than the deletion history is answered with 410 and the client must
+    reload the full list.
+    """
+    since_time = None
+    if since is not None:
+        try:
+            since_time = decode_sync_token(since)
+        except ValueError:
+            raise InvalidSyncTokenException(since)
+        retention = timedelta(days=settings.task_tombstone_retention_days)
+        if since_time < datetime.utcnow() - retention:
+            raise SyncTokenExpiredException()
+
+    tasks, deleted, synced_at = await task_service.get_changes(
+        user_id, since_time, timedelta(seconds=settings.task_sync_lag_seconds)
+    )
+    return {"tasks": tasks, "deleted": deleted, "next_token": encode_sync_token(synced_at)}
+
+
+@router.get("/events")
+async def task_events(user_id: int, request: Request):
+    """Stream the user's task changes as Server-Sent Events.
+
+    Events are task.created, task.updated, task.completed, task.deleted and
+    tasks.imported. A client that falls behind receives an overflow event
+    and is disconnected; after any reconnect it should catch up through
+    /changes.
+    """
+    if task_event_broker is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task events are disabled")
+
+    async def body():
+        with task_event_broker.subscribe(user_id) as subscription:
+            async for chunk in stream_events(
+                subscription, request.is_disconnected, settings.task_events_heartbeat_seconds
+            ):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/export")
+async def export_tasks(
+    user_id: int,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$")
+):
+    """Stream all tasks of the specified user as NDJSON or CSV."""
+    async def chunks():
+        async with stream_session() as session:
+            batches = AsyncTaskService(session).iter_task_rows(user_id, settings.task_export_batch_size)
+            async for chunk in encode_export(batches, export_format):
+                yield chunk
+
+    return StreamingResponse(
+        chunks(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format}"'}
+    )
+
+
+@router.post("/import", response_model=TaskImportResult)
+async def import_tasks(
+    user_id: int,
+    request: Request,
+    import_format: Optional[str] = Query(None, alias="format", pattern="^(ndjson|csv)$"),
+    task_service: AsyncTaskService = Depends(get_task_service)
+):
+    """Import tasks for the specified user from an NDJSON or CSV body.
+
+    The body is parsed as it streams in and valid rows are inserted in
+    batches of TASK_IMPORT_BATCH_SIZE. The format defaults to CSV for a
+    text/csv Content-Type and NDJSON otherwise; CSV needs a header row
+    naming the title, description and completed columns.
+    """
+    if import_format is None:
+        content_type = request.headers.get("content-type", "")
+        import_format = "csv" if content_type.startswith("text/csv") else "ndjson"
+
+    return await import_task_stream(
+        request.stream(),
+        import_format,
+        user_id,
+        task_service.insert_tasks_batch,
+        settings.task_import_batch_size
+    )
+
+
+@router.post("/bulk", response_model=List[TaskBulkResult], status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk(
+    user_id: int,
+    tasks_data: List[TaskCreate],
+    task_service: AsyncTaskService = Depends(get_task_service)
+):
+    """Create several tasks for the specified user in one transaction."""
+    check_batch_size(tasks_data)
+    for task_data in tasks_data:
+        task_data.user_id = user_id
+
+    tasks = await task_service.create_tasks(tasks_data)
+    return [
+        TaskBulkResult(index=index, id=task.id, success=True, task=task)
+        for index, task in enumerate(tasks)
+    ]
+
+
+@router.patch("/bulk", response_model=List[TaskBulkResult])
+async def update_tasks_bulk(
+    user_id: int,
+    updates: List[TaskBulkUpdate],
+    task_service: AsyncTaskService = Depends(get_task_service)
+):
+    """Update several tasks for the specified user in one transaction."""
+    check_batch_size(updates)
+    updated_tasks = await task_service.update_tasks(user_id, updates)
+    return [
+        TaskBulkResult(index=index, id=update.id, success=True, task=updated_tasks[update.id])
+        if update.id in updated_tasks else
+        TaskBulkResult(index=index, id=update.id, success=False, error="Task not found")
+        for index, update in enumerate(updates)
+    ]
+
+
+@router.delete("/bulk", response_model=List[TaskBulkResult])
+async def delete_tasks_bulk(
     user_id: int,
-    session: Session = Depends(get_session)
+    task_ids: List[int],
+    task_service: AsyncTaskService = Depends(get_task_service)
 ):
-    """Get all tasks for the specified user."""
-    task_service = TaskService(session)
-    tasks = task_service.get_tasks_by_user(user_id)
-    return tasks
+    """Delete several tasks for the specified user in one statement."""
+    check_batch_size(task_ids)
+    deleted_ids = await task_service.delete_tasks(user_id, task_ids)
+    return [
+        TaskBulkResult(index=index, id=task_id, success=task_id in deleted_ids,
+                       error=None if task_id in deleted_ids else "Task not found")
+        for index, task_id in enumerate(task_ids)
+    ]
 
 
 @router.get("/{task_id}", response_model=TaskSchema)
-def get_task(
+async def get_task(
     user_id: int,
     task_id: int,
-    session: Session = Depends(get_session)
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    task_service: AsyncTaskService = Depends(get_task_service)
 ):
     """Get a specific task by ID for the specified user."""
-    task_service = TaskService(session)
-    task = task_service.get_task_by_id(task_id, user_id)
+    task = await task_service.get_task_by_id(task_id, user_id)
 
     if not task:
         raise HTTPException(
@@ -68,19 +350,23 @@ def get_task(
             detail="Task not found"
         )
 
-    return task
+    etag = make_etag(task.id, task.updated_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_validator_headers(response, etag)
+    return task_response(task, response)
 
 
 @router.put("/{task_id}", response_model=TaskSchema)
-def update_task(
+async def update_task(
     user_id: int,
     task_id: int,
     task_update: TaskUpdate,
-    session: Session = Depends(get_session)
+    response: Response,
+    task_service: AsyncTaskService = Depends(get_task_service)
 ):
     """Update a specific task for the specified user."""
-    task_service = TaskService(session)
-    updated_task = task_service.update_task(task_id, user_id, task_update)
+    updated_task = await task_service.update_task(task_id, user_id, task_update)
 
     if not updated_task:
         raise HTTPException(
@@ -88,18 +374,17 @@ def update_task(
             detail="Task not found"
         )
 
-    return updated_task
+    return task_response(updated_task, response)
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
+async def delete_task(
     user_id: int,
     task_id: int,
-    session: Session = Depends(get_session)
+    task_service: AsyncTaskService = Depends(get_task_service)
 ):
     """Delete a specific task for the specified user."""
-    task_service = TaskService(session)
-    success = task_service.delete_task(task_id, user_id)
+    success = await task_service.delete_task(task_id, user_id)
 
     if not success:
         raise HTTPException(
@@ -111,15 +396,15 @@ def delete_task(
 
 
 @router.patch("/{task_id}/complete", response_model=TaskSchema)
-def update_task_completion(
+async def update_task_completion(
     user_id: int,
     task_id: int,
     completed: bool,
-    session: Session = Depends(get_session)
+    response: Response,
+    task_service: AsyncTaskService = Depends(get_task_service)
 ):
     """Update the completion status of a specific task for the specified user."""
-    task_service = TaskService(session)
-    updated_task = task_service.update_task_completion_status(task_id, user_id, completed)
+    updated_task = await task_service.update_task_completion_status(task_id, user_id, completed)
 
     if not updated_task:
         raise HTTPException(
@@ -127,4 +412,4 @@ def update_task_completion(
             detail="Task not found"
         )
 
-    return updated_task
\ No newline at end of file
+    return task_response(updated_task, response)
\ No newline at end of file
@@ -1,4 +1,10 @@
 from .user import User, UserCreate
-from .task import Task, TaskCreate, TaskUpdate
+from .task import (
+    Task, TaskCreate, TaskUpdate, TaskBulkUpdate, TaskBulkResult, TaskFilters, TaskStats, TaskChanges,
+    TaskImportError, TaskImportResult
+)
 
-__all__ = ["User", "UserCreate", "Task", "TaskCreate", "TaskUpdate"]
\ No newline at end of file
+__all__ = [
+    "User", "UserCreate", "Task", "TaskCreate", "TaskUpdate", "TaskBulkUpdate", "TaskBulkResult",
+    "TaskFilters", "TaskStats", "TaskChanges", "TaskImportError", "TaskImportResult"
+]
\ No newline at end of file
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 class TaskBase(BaseModel):
@@ -22,10 +22,54 @@ class TaskUpdate(BaseModel):
     completed: Optional[bool] = None
 
 
+class TaskBulkUpdate(TaskUpdate):
+    id: int
+
+
+class TaskFilters(BaseModel):
+    completed: Optional[bool] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    updated_after: Optional[datetime] = None
+    updated_before: Optional[datetime] = None
+    q: Optional[str] = None
+
+
 class Task(TaskBase):
     id: int
     created_at: datetime
     updated_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class TaskBulkResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    success: bool
+    task: Optional[Task] = None
+    error: Optional[str] = None
+
+
+class TaskStats(BaseModel):
+    total: int
+    completed: int
+    pending: int
+
+
+class TaskChanges(BaseModel):
+    tasks: List[Task]
+    deleted: List[int]
+    next_token: str
+
+
+class TaskImportError(BaseModel):
+    line: int
+    error: str
+
+
+class TaskImportResult(BaseModel):
+    accepted: int
+    rejected: int
+    errors: List[TaskImportError]
\ No newline at end of file
@@ -1,3 +1,9 @@
 from .task_service import TaskService
+from .async_task_service import AsyncTaskService
+from .cache import TaskListCache, LRUTaskListCache, build_task_list_cache
+from .events import EventBackend, LocalEventBackend, TaskEventBroker, build_task_event_broker
 
-__all__ = ["TaskService"]
\ No newline at end of file
+__all__ = [
+    "TaskService", "AsyncTaskService", "TaskListCache", "LRUTaskListCache", "build_task_list_cache",
+    "EventBackend", "LocalEventBackend", "TaskEventBroker", "build_task_event_broker"
+]
\ No newline at end of file
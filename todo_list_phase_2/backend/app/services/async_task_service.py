@@ -0,0 +1,120 @@
+from sqlmodel import Session
+from datetime import datetime, timedelta
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set, Tuple, TypeVar, Union
+from ..models import Task
+from ..schemas import TaskCreate, TaskUpdate, TaskBulkUpdate, TaskFilters, TaskStats as TaskStatsSchema
+from .cache import TaskListCache
+from .events import TaskEventBroker
+from .task_service import TaskService
+
+T = TypeVar("T")
+
+
+class AsyncTaskService:
+    """Awaitable TaskService for use from async request handlers.
+
+    With an AsyncSession the TaskService queries run through
+    AsyncSession.run_sync, so database I/O goes through the async driver
+    without blocking the event loop. With a plain Session they run in the
+    threadpool, as sync endpoints would.
+    """
+
+    def __init__(
+        self,
+        session: Union[AsyncSession, Session],
+        cache: Optional[TaskListCache] = None,
+        events: Optional[TaskEventBroker] = None
+    ):
+        self.session = session
+        self.cache = cache
+        self.events = events
+
+    async def _run(self, operation: Callable[[TaskService], T]) -> T:
+        if isinstance(self.session, AsyncSession):
+            return await self.session.run_sync(lambda session: operation(TaskService(session, self.cache, self.events)))
+        return await run_in_threadpool(operation, TaskService(self.session, self.cache, self.events))
+
+    async def create_task(self, task_data: TaskCreate) -> Task:
+        """Create a new task for a user."""
+        return await self._run(lambda service: service.create_task(task_data))
+
+    async def get_tasks_by_user(self, user_id: int) -> List[Task]:
+        """Get all tasks for a specific user."""
+        return await self._run(lambda service: service.get_tasks_by_user(user_id))
+
+    async def get_tasks_page(
+        self,
+        user_id: int,
+        limit: Optional[int],
+        cursor: Optional[str] = None,
+        filters: Optional[TaskFilters] = None,
+        sort: str = "created_at"
+    ) -> Tuple[List[Task], Optional[str]]:
+        """Get one page of a user's tasks matching filters, ordered by (sort, id)."""
+        return await self._run(lambda service: service.get_tasks_page(user_id, limit, cursor, filters, sort))
+
+    async def get_tasks_version(self, user_id: int) -> Tuple[int, Optional[datetime]]:
+        """Get the task count and latest updated_at for a user."""
+        return await self._run(lambda service: service.get_tasks_version(user_id))
+
+    async def get_task_stats(self, user_id: int) -> TaskStatsSchema:
+        """Get a user's total, completed and pending task counts."""
+        return await self._run(lambda service: service.get_task_stats(user_id))
+
+    async def reconcile_task_stats(self, user_id: Optional[int] = None) -> int:
+        """Rebuild the task counters from the task table."""
+        return await self._run(lambda service: service.reconcile_task_stats(user_id))
+
+    async def get_changes(
+        self,
+        user_id: int,
+        since: Optional[datetime] = None,
+        lag: timedelta = timedelta(0)
+    ) -> Tuple[List[Task], List[int], datetime]:
+        """Get a user's tasks changed, and IDs deleted, since a time."""
+        return await self._run(lambda service: service.get_changes(user_id, since, lag))
+
+    async def iter_task_rows(self, user_id: int, batch_size: int = 1000) -> AsyncIterator[List[dict]]:
+        """Stream a user's tasks as batches of column dicts."""
+        if isinstance(self.session, AsyncSession):
+            result = await self.session.stream(TaskService.export_statement(user_id))
+            async for partition in result.mappings().partitions(batch_size):
+                yield [dict(row) for row in partition]
+        else:
+            rows = TaskService(self.session).iter_task_rows(user_id, batch_size)
+            async for partition in iterate_in_threadpool(rows):
+                yield partition
+
+    async def get_task_by_id(self, task_id: int, user_id: int) -> Optional[Task]:
+        """Get a specific task by ID for a specific user."""
+        return await self._run(lambda service: service.get_task_by_id(task_id, user_id))
+
+    async def update_task(self, task_id: int, user_id: int, task_update: TaskUpdate) -> Optional[Task]:
+        """Update a task for a specific user."""
+        return await self._run(lambda service: service.update_task(task_id, user_id, task_update))
+
+    async def update_task_completion_status(self, task_id: int, user_id: int, completed: bool) -> Optional[Task]:
+        """Update the completion status of a task."""
+        return await self._run(lambda service: service.update_task_completion_status(task_id, user_id, completed))
+
+    async def delete_task(self, task_id: int, user_id: int) -> bool:
+        """Delete a task for a specific user."""
+        return await self._run(lambda service: service.delete_task(task_id, user_id))
+
+    async def create_tasks(self, tasks_data: List[TaskCreate]) -> List[Task]:
+        """Create several tasks in one transaction."""
+        return await self._run(lambda service: service.create_tasks(tasks_data))
+
+    async def insert_tasks_batch(self, tasks_data: List[TaskCreate]) -> int:
+        """Insert tasks with one multi-row INSERT and commit."""
+        return await self._run(lambda service: service.insert_tasks_batch(tasks_data))
+
+    async def update_tasks(self, user_id: int, updates: List[TaskBulkUpdate]) -> Dict[int, Task]:
+        """Update several of a user's tasks in one transaction."""
+        return await self._run(lambda service: service.update_tasks(user_id, updates))
+
+    async def delete_tasks(self, user_id: int, task_ids: List[int]) -> Set[int]:
+        """Delete several of a user's tasks in one statement."""
+        return await self._run(lambda service: service.delete_tasks(user_id, task_ids))
@@ -0,0 +1,120 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class TaskListCache(ABC):
+    """Cache for per-user task list results.
+
+    Entries are keyed by user, a per-user version and the query parameters.
+    Writers call invalidate(), which moves the user to a new version; readers
+    take the version before querying the database, so a result computed
+    before a write is never served after it. The operations map directly
+    onto a shared store (e.g. Redis GET/SETEX/INCR) for multi-worker setups.
+    """
+
+    @abstractmethod
+    def version(self, user_id: int) -> int:
+        """Return the current cache version for a user."""
+
+    @abstractmethod
+    def get(self, user_id: int, version: int, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on a miss."""
+
+    @abstractmethod
+    def set(self, user_id: int, version: int, key: Hashable, value: Any) -> None:
+        """Store a value computed at the given version."""
+
+    @abstractmethod
+    def invalidate(self, user_id: int) -> None:
+        """Discard everything cached for a user."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and size counters."""
+
+
+class LRUTaskListCache(TaskListCache):
+    """In-process LRU cache with a per-entry TTL and a maximum entry count."""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # Versions are LRU-bounded like the entries. Users without one are at
+        # _base_version, which moves past every issued version whenever a
+        # version is evicted, so an evicted user never gets an old one back.
+        self._versions: "OrderedDict[int, int]" = OrderedDict()
+        self._base_version = 0
+        self._next_version = 1
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def version(self, user_id: int) -> int:
+        with self._lock:
+            version = self._versions.get(user_id)
+            if version is None:
+                version = self._base_version
+            self._set_version(user_id, version)
+            return version
+
+    def _set_version(self, user_id: int, version: int) -> None:
+        self._versions[user_id] = version
+        self._versions.move_to_end(user_id)
+        if len(self._versions) > self.max_entries:
+            self._versions.popitem(last=False)
+            self._base_version = self._next_version
+            self._next_version += 1
+
+    def get(self, user_id: int, version: int, key: Hashable) -> Optional[Any]:
+        entry_key = (user_id, version, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[entry_key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, user_id: int, version: int, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if self._versions.get(user_id, self._base_version) != version:
+                return
+            self._entries[(user_id, version, key)] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end((user_id, version, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            # Versions come from a global counter so a user's version never
+            # repeats; entries of old versions are unreachable and age out.
+            version = self._next_version
+            self._next_version += 1
+            self._set_version(user_id, version)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+
+def build_task_list_cache(backend: str, max_entries: int, ttl_seconds: float) -> Optional[TaskListCache]:
+    """Create the cache for a task_cache_backend setting ("none" or "memory")."""
+    if backend == "memory":
+        return LRUTaskListCache(max_entries, ttl_seconds)
+    if backend == "none":
+        return None
+    raise ValueError(f"Unknown task cache backend: {backend}")
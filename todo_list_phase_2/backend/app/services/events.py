@@ -0,0 +1,192 @@
+import asyncio
+import json
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Set
+
+
+def format_event(event_type: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events message."""
+    payload = json.dumps(data, default=lambda value: value.isoformat() if isinstance(value, datetime) else str(value))
+    return f"event: {event_type}\ndata: {payload}\n\n"
+
+
+OVERFLOW_MESSAGE = format_event("overflow", {"reason": "client too slow; reconnect and sync changes"})
+
+
+class EventBackend(ABC):
+    """Transport that fans task events out to every worker's broker.
+
+    publish() sends a formatted message for a user; the backend calls the
+    deliver callback given to start() for every message published by any
+    worker, including this one. A multi-worker backend maps onto a shared
+    pub/sub channel (e.g. Redis PUBLISH/SUBSCRIBE or Postgres NOTIFY).
+    """
+
+    @abstractmethod
+    async def start(self, deliver: Callable[[int, str], None]) -> None:
+        """Start receiving messages and pass them to deliver(user_id, message)."""
+
+    @abstractmethod
+    async def publish(self, user_id: int, message: str) -> None:
+        """Send a message to the subscribers of a user on all workers."""
+
+    async def stop(self) -> None:
+        """Stop receiving messages."""
+
+
+class LocalEventBackend(EventBackend):
+    """In-process backend: messages only reach subscribers of this worker."""
+
+    def __init__(self):
+        self._deliver: Optional[Callable[[int, str], None]] = None
+
+    async def start(self, deliver: Callable[[int, str], None]) -> None:
+        self._deliver = deliver
+
+    async def publish(self, user_id: int, message: str) -> None:
+        if self._deliver is not None:
+            self._deliver(user_id, message)
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+
+class Subscription:
+    """One connection's bounded queue of messages for a user."""
+
+    def __init__(self, user_id: int, queue_size: int):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def offer(self, message: str) -> None:
+        """Queue a message without blocking the publisher.
+
+        When the queue is full the subscriber is too slow to keep up: its
+        backlog is dropped and replaced by a final overflow message, which
+        tells the client to reconnect and catch up through delta sync.
+        """
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW_MESSAGE)
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+
+class TaskEventBroker:
+    """Asyncio pub/sub of task events, keyed by user.
+
+    publish() may be called from any thread (TaskService runs in the
+    threadpool); delivery to subscriber queues always happens on the event
+    loop the broker was started on. Events published before start() or
+    after stop() are dropped.
+    """
+
+    def __init__(self, backend: EventBackend, queue_size: int = 100):
+        self.backend = backend
+        self.queue_size = queue_size
+        self._subscriptions: Dict[int, Set[Subscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Set["asyncio.Task[None]"] = set()
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+        self.overflows = 0
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        await self.backend.start(self._deliver)
+
+    async def stop(self) -> None:
+        self._loop = None
+        await self.backend.stop()
+
+    def publish(self, user_id: int, event_type: str, data: Dict[str, Any]) -> None:
+        """Publish an event to the user's subscribers on every worker."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        message = format_event(event_type, data)
+        with self._lock:
+            self.published += 1
+        loop.call_soon_threadsafe(self._schedule, user_id, message)
+
+    def _schedule(self, user_id: int, message: str) -> None:
+        task = asyncio.ensure_future(self.backend.publish(user_id, message))
+        # Keep a reference until done so the task is not garbage collected
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _deliver(self, user_id: int, message: str) -> None:
+        for subscription in tuple(self._subscriptions.get(user_id, ())):
+            if subscription.overflowed:
+                continue
+            subscription.offer(message)
+            if subscription.overflowed:
+                self.overflows += 1
+            else:
+                self.delivered += 1
+
+    @contextmanager
+    def subscribe(self, user_id: int) -> Iterator[Subscription]:
+        """Register a subscription for a user for the duration of the block."""
+        subscription = Subscription(user_id, self.queue_size)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscriptions.get(user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[user_id]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "subscribers": sum(len(subscribers) for subscribers in self._subscriptions.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "overflows": self.overflows,
+        }
+
+
+async def stream_events(
+    subscription: Subscription,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat_seconds: float = 15.0,
+    retry_ms: int = 3000
+) -> AsyncIterator[str]:
+    """Yield the Server-Sent Events body for a subscription.
+
+    Sends a comment every heartbeat_seconds while idle so proxies keep the
+    connection open and disconnects are noticed; ends after an overflow.
+    """
+    yield f"retry: {retry_ms}\n\n"
+    while not await is_disconnected():
+        try:
+            message = await asyncio.wait_for(subscription.get(), heartbeat_seconds)
+        except asyncio.TimeoutError:
+            yield ": keep-alive\n\n"
+            continue
+        yield message
+        if message is OVERFLOW_MESSAGE:
+            return
+
+
+def build_task_event_broker(backend: str, queue_size: int) -> Optional[TaskEventBroker]:
+    """Create the broker for a task_events_backend setting ("none" or "local")."""
+    if backend == "local":
+        return TaskEventBroker(LocalEventBackend(), queue_size)
+    if backend == "none":
+        return None
+    raise ValueError(f"Unknown task events backend: {backend}")
@@ -0,0 +1,51 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, List
+
+EXPORT_COLUMNS = ["id", "title", "description", "completed", "user_id", "created_at", "updated_at"]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_ndjson(rows: List[dict]) -> bytes:
+    """Encode rows as newline-delimited JSON objects."""
+    return "".join(
+        json.dumps({column: row[column] for column in EXPORT_COLUMNS}, default=_json_default) + "\n"
+        for row in rows
+    ).encode()
+
+
+def encode_csv(rows: List[dict]) -> bytes:
+    """Encode rows as CSV lines without a header."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            row[column].isoformat() if isinstance(row[column], datetime) else row[column]
+            for column in EXPORT_COLUMNS
+        ])
+    return buffer.getvalue().encode()
+
+
+async def encode_export(batches: AsyncIterator[List[dict]], export_format: str) -> AsyncIterator[bytes]:
+    """Encode batches of task rows into response chunks, one chunk per batch."""
+    if export_format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue().encode()
+        encode = encode_csv
+    else:
+        encode = encode_ndjson
+    async for rows in batches:
+        yield encode(rows)
@@ -0,0 +1,130 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+from pydantic import ValidationError
+from ..models import Task
+from ..schemas import TaskCreate, TaskImportError, TaskImportResult
+
+IMPORT_FIELDS = ("title", "description", "completed")
+TITLE_MAX_LENGTH = Task.__table__.c.title.type.length
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into text lines as the chunks arrive."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """Yield (line number, record, error) for each non-blank NDJSON line."""
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, record, None
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """Yield (line number, record, error) for each CSV row after the header.
+
+    A quoted field may span lines; since quotes inside fields are doubled,
+    a record is complete once it contains an even number of quotes.
+    """
+    header: Optional[List[str]] = None
+    record_lines: List[str] = []
+    line_number = start_line = 0
+    async for line in lines:
+        line_number += 1
+        if not record_lines:
+            start_line = line_number
+        record_lines.append(line)
+        text = "\n".join(record_lines)
+        if text.count('"') % 2:
+            continue
+        record_lines = []
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [column.strip() for column in values]
+            continue
+        if len(values) != len(header):
+            yield start_line, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        # Empty cells mean "not set"
+        yield start_line, {column: value for column, value in zip(header, values) if value != ""}, None
+
+    if record_lines:
+        yield start_line, None, "Unterminated quoted field"
+
+
+def build_task(record: dict, user_id: int) -> TaskCreate:
+    """Validate an imported record into a TaskCreate for the user.
+
+    Raises:
+        ValueError: If the record is not a valid task.
+    """
+    data = {field: record[field] for field in IMPORT_FIELDS if field in record}
+    task_data = TaskCreate(**data, user_id=user_id)
+    if not task_data.title.strip():
+        raise ValueError("title must not be empty")
+    if len(task_data.title) > TITLE_MAX_LENGTH:
+        raise ValueError(f"title is longer than {TITLE_MAX_LENGTH} characters")
+    task_data.completed = bool(task_data.completed)
+    return task_data
+
+
+async def import_tasks(
+    chunks: AsyncIterator[bytes],
+    import_format: str,
+    user_id: int,
+    insert_batch: Callable[[List[TaskCreate]], Awaitable[int]],
+    batch_size: int,
+    max_errors: int = 100
+) -> TaskImportResult:
+    """Parse an NDJSON or CSV byte stream and insert valid tasks in batches.
+
+    Invalid records are counted as rejected; the first max_errors of them
+    are reported with their line numbers.
+    """
+    iter_records = iter_csv_records if import_format == "csv" else iter_ndjson_records
+    result = TaskImportResult(accepted=0, rejected=0, errors=[])
+    batch: List[TaskCreate] = []
+
+    async for line_number, record, error in iter_records(iter_lines(chunks)):
+        if record is not None:
+            try:
+                batch.append(build_task(record, user_id))
+            except (ValidationError, ValueError, TypeError) as e:
+                error = str(e)
+        if error is not None:
+            result.rejected += 1
+            if len(result.errors) < max_errors:
+                result.errors.append(TaskImportError(line=line_number, error=error))
+            continue
+        if len(batch) >= batch_size:
+            result.accepted += await insert_batch(batch)
+            batch = []
+
+    if batch:
+        result.accepted += await insert_batch(batch)
+    return result
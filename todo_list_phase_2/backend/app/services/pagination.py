@@ -0,0 +1,55 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple, Union
+
+SortValue = Union[datetime, str]
+
+
+def encode_cursor(sort_value: SortValue, task_id: int, sort: str = "created_at") -> str:
+    """Encode the (sort value, id) keyset position of a task into an opaque cursor.
+
+    sort names the ordering the cursor belongs to, e.g. "created_at" or
+    "-updated_at" for descending order.
+    """
+    value = sort_value.isoformat() if isinstance(sort_value, datetime) else sort_value
+    raw = json.dumps([sort, value, task_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str = "created_at") -> Tuple[SortValue, int]:
+    """Decode a cursor produced by encode_cursor for the same sort.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, task_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if cursor_sort != sort:
+            raise ValueError(f"cursor was issued for sort {cursor_sort!r}")
+        if sort.lstrip("-") != "title":
+            value = datetime.fromisoformat(value)
+        elif not isinstance(value, str):
+            raise ValueError("title cursor value must be a string")
+        return value, int(task_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def encode_sync_token(synced_at: datetime) -> str:
+    """Encode the point in time a delta sync covers up to into an opaque token."""
+    return base64.urlsafe_b64encode(synced_at.isoformat().encode()).decode().rstrip("=")
+
+
+def decode_sync_token(token: str) -> datetime:
+    """Decode a token produced by encode_sync_token.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        return datetime.fromisoformat(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid sync token: {token!r}") from e
@@ -0,0 +1,30 @@
+from sqlalchemy import or_, text
+from ..models import Task
+
+
+def fts5_query(q: str) -> str:
+    """Quote each word of q as an FTS5 string so that all must match.
+
+    Quoting keeps FTS5 operators and punctuation in user input literal.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in q.split())
+
+
+def search_condition(dialect_name: str, q: str):
+    """Build a WHERE condition matching tasks whose title or description contains q.
+
+    Postgres uses the GIN-indexed tsvector expression and SQLite the
+    task_fts FTS5 table, both declared in models/task.py; other dialects
+    fall back to a case-insensitive substring match.
+    """
+    if dialect_name == "postgresql":
+        return text(
+            "to_tsvector('simple'::regconfig, coalesce(task.title, '') || ' ' || coalesce(task.description, ''))"
+            " @@ plainto_tsquery('simple'::regconfig, :search_q)"
+        ).bindparams(search_q=q)
+    if dialect_name == "sqlite":
+        return text(
+            "task.id IN (SELECT rowid FROM task_fts WHERE task_fts MATCH :search_q)"
+        ).bindparams(search_q=fts5_query(q))
+    pattern = f"%{q}%"
+    return or_(Task.title.ilike(pattern), Task.description.ilike(pattern))
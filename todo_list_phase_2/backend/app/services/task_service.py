@@ -1,76 +1,559 @@
-from sqlmodel import Session, select, and_
-from typing import List, Optional
-from ..models import Task
-from ..schemas import TaskCreate, TaskUpdate
+from sqlmodel import Session, select, and_, or_
+from sqlalchemy import bindparam, case, func, literal, text
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import datetime, timedelta
+from collections import Counter
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+from ..models import Task, TaskStats, TaskTombstone
+from ..schemas import TaskCreate, TaskUpdate, TaskBulkUpdate, TaskFilters, TaskStats as TaskStatsSchema
+from .cache import TaskListCache
+from .events import TaskEventBroker
+from .pagination import encode_cursor, decode_cursor
+from .search import search_condition
+
+
+SORT_FIELDS = ("created_at", "updated_at", "title")
 
 
 class TaskService:
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        cache: Optional[TaskListCache] = None,
+        events: Optional[TaskEventBroker] = None
+    ):
         self.session = session
+        self.cache = cache
+        self.events = events
+
+    def _cached_list(self, user_id: int, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Return a cached list result for a user, loading it on a miss."""
+        if self.cache is None:
+            return load()
+        # Take the version before querying so a write that lands while the
+        # query runs leaves this result unreachable.
+        version = self.cache.version(user_id)
+        value = self.cache.get(user_id, version, key)
+        if value is None:
+            value = load()
+            self.cache.set(user_id, version, key, value)
+        return value
+
+    def _detach(self, tasks: Iterable[Task]) -> Tuple[Task, ...]:
+        """Detach loaded tasks from the session so they can be shared via the cache."""
+        tasks = tuple(tasks)
+        for task in tasks:
+            self.session.expunge(task)
+        return tasks
+
+    def _invalidate(self, *user_ids: int) -> None:
+        if self.cache is not None:
+            for user_id in set(user_ids):
+                self.cache.invalidate(user_id)
+
+    def _publish(self, user_id: int, event_type: str, data: Dict[str, Any]) -> None:
+        """Publish a task event; call only after the change is committed."""
+        if self.events is not None:
+            self.events.publish(user_id, event_type, data)
+
+    def _publish_task(self, event_type: str, task: Task) -> None:
+        self._publish(task.user_id, event_type, {"task": task.dict()})
 
     def create_task(self, task_data: TaskCreate) -> Task:
         """Create a new task for a user."""
         db_task = Task.from_orm(task_data) if hasattr(Task, 'from_orm') else Task(**task_data.model_dump())
         self.session.add(db_task)
+        self.session.flush()
+        self._apply_stats_delta(db_task.user_id, 1, int(bool(db_task.completed)))
         self.session.commit()
         self.session.refresh(db_task)
+        self._invalidate(db_task.user_id)
+        self._publish_task("task.created", db_task)
         return db_task
 
+    def _apply_stats_delta(self, user_id: int, total: int, completed: int) -> None:
+        """Adjust a user's counters inside the current transaction.
+
+        The first write for a user without a counter row seeds it from the
+        task table, which at that point already includes the write itself.
+        """
+        if not total and not completed:
+            return
+        table = TaskStats.__table__
+        now = datetime.utcnow()
+        result = self.session.execute(
+            table.update()
+            .where(table.c.user_id == user_id)
+            .values(total=table.c.total + total, completed=table.c.completed + completed, updated_at=now)
+        )
+        if result.rowcount:
+            return
+
+        counts = select(
+            literal(user_id), func.count(Task.id), func.coalesce(func.sum(case((Task.completed, 1), else_=0)), 0),
+            literal(now)
+        ).where(Task.user_id == user_id)
+        dialect_name = self.session.get_bind().dialect.name
+        insert = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}.get(dialect_name)
+        if insert is None:
+            self.session.execute(table.insert().from_select(list(table.c.keys()), counts))
+            return
+        statement = insert(table).from_select(
+            ["user_id", "total", "completed", "updated_at"], counts
+        ).on_conflict_do_nothing(index_elements=["user_id"])
+        if self.session.execute(statement).rowcount == 0:
+            # A concurrent transaction seeded the row first; its counts do
+            # not include this write, so apply the delta on top.
+            self._apply_stats_delta(user_id, total, completed)
+
+    def _apply_stats_deltas(self, tasks: Iterable[Tuple[int, Optional[bool]]]) -> None:
+        """Count newly inserted (user_id, completed) pairs into the counters."""
+        deltas: Dict[int, List[int]] = {}
+        for user_id, completed in tasks:
+            delta = deltas.setdefault(user_id, [0, 0])
+            delta[0] += 1
+            delta[1] += int(bool(completed))
+        for user_id, (total, completed) in deltas.items():
+            self._apply_stats_delta(user_id, total, completed)
+
+    def get_task_stats(self, user_id: int) -> TaskStatsSchema:
+        """Get a user's total, completed and pending task counts.
+
+        Reads the counter row; users without one (no writes since the
+        counters were introduced) are counted from the task table.
+        """
+        row = self.session.execute(
+            select(TaskStats.total, TaskStats.completed).where(TaskStats.user_id == user_id)
+        ).first()
+        if row is not None:
+            total, completed = row
+        else:
+            total, completed = self.session.execute(
+                select(func.count(Task.id), func.coalesce(func.sum(case((Task.completed, 1), else_=0)), 0))
+                .where(Task.user_id == user_id)
+            ).one()
+        return TaskStatsSchema(total=total, completed=completed, pending=total - completed)
+
+    def reconcile_task_stats(self, user_id: Optional[int] = None) -> int:
+        """Rebuild the counters from the task table and commit.
+
+        Rebuilds every user's counters, or only user_id's. On Postgres the
+        task table is locked against writes until the rebuild commits, so
+        no in-flight write is missed. Returns the number of counter rows
+        written.
+        """
+        table = TaskStats.__table__
+        if self.session.get_bind().dialect.name == "postgresql":
+            self.session.execute(text("LOCK TABLE task IN SHARE MODE"))
+
+        counts = select(
+            Task.user_id, func.count(Task.id), func.sum(case((Task.completed, 1), else_=0)),
+            literal(datetime.utcnow())
+        ).group_by(Task.user_id)
+        delete = table.delete()
+        if user_id is not None:
+            counts = counts.where(Task.user_id == user_id)
+            delete = delete.where(table.c.user_id == user_id)
+
+        self.session.execute(delete)
+        result = self.session.execute(
+            table.insert().from_select(["user_id", "total", "completed", "updated_at"], counts)
+        )
+        self.session.commit()
+        return result.rowcount
+
     def get_tasks_by_user(self, user_id: int) -> List[Task]:
         """Get all tasks for a specific user."""
+        if self.cache is None:
+            return self._load_tasks_by_user(user_id)
+        tasks = self._cached_list(user_id, ("all",), lambda: self._detach(self._load_tasks_by_user(user_id)))
+        return list(tasks)
+
+    def _load_tasks_by_user(self, user_id: int) -> List[Task]:
         statement = select(Task).where(Task.user_id == user_id)
         results = self.session.exec(statement)
         return results.all()
 
+    def get_tasks_page(
+        self,
+        user_id: int,
+        limit: Optional[int],
+        cursor: Optional[str] = None,
+        filters: Optional[TaskFilters] = None,
+        sort: str = "created_at"
+    ) -> Tuple[List[Task], Optional[str]]:
+        """Get one page of a user's tasks matching filters, ordered by (sort, id).
+
+        sort is one of SORT_FIELDS, prefixed with "-" for descending order.
+        Filters, text search and ordering are all applied in SQL.
+
+        Uses keyset pagination: the cursor encodes the position of the last
+        task of the previous page, so every page is an index range scan
+        regardless of how deep it is. A limit of None returns every matching
+        task in one page.
+
+        Returns:
+            The tasks of the page and the cursor for the next page, or None
+            if this is the last page.
+
+        Raises:
+            ValueError: If the sort is unknown or the cursor is malformed or
+                was issued for a different sort.
+        """
+        if sort.lstrip("-") not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field: {sort}")
+        if self.cache is None:
+            return self._load_tasks_page(user_id, limit, cursor, filters, sort)
+
+        def load():
+            tasks, next_cursor = self._load_tasks_page(user_id, limit, cursor, filters, sort)
+            return self._detach(tasks), next_cursor
+
+        filter_key = tuple(sorted(filters.dict(exclude_none=True).items())) if filters else ()
+        key = ("page", limit, cursor, filter_key, sort)
+        tasks, next_cursor = self._cached_list(user_id, key, load)
+        return list(tasks), next_cursor
+
+    def _filter_conditions(self, filters: TaskFilters) -> list:
+        conditions = []
+        if filters.completed is not None:
+            conditions.append(Task.completed == filters.completed)
+        if filters.created_after is not None:
+            conditions.append(Task.created_at >= filters.created_after)
+        if filters.created_before is not None:
+            conditions.append(Task.created_at < filters.created_before)
+        if filters.updated_after is not None:
+            conditions.append(Task.updated_at >= filters.updated_after)
+        if filters.updated_before is not None:
+            conditions.append(Task.updated_at < filters.updated_before)
+        if filters.q and filters.q.strip():
+            dialect_name = self.session.get_bind().dialect.name
+            conditions.append(search_condition(dialect_name, filters.q))
+        return conditions
+
+    def _load_tasks_page(
+        self,
+        user_id: int,
+        limit: Optional[int],
+        cursor: Optional[str],
+        filters: Optional[TaskFilters] = None,
+        sort: str = "created_at"
+    ) -> Tuple[List[Task], Optional[str]]:
+        descending = sort.startswith("-")
+        field = sort.lstrip("-")
+        column = getattr(Task, field)
+
+        statement = select(Task).where(Task.user_id == user_id)
+        if filters is not None:
+            for condition in self._filter_conditions(filters):
+                statement = statement.where(condition)
+        if cursor is not None:
+            value, task_id = decode_cursor(cursor, sort)
+            if descending:
+                statement = statement.where(or_(column < value, and_(column == value, Task.id < task_id)))
+            else:
+                statement = statement.where(or_(column > value, and_(column == value, Task.id > task_id)))
+        if descending:
+            statement = statement.order_by(column.desc(), Task.id.desc())
+        else:
+            statement = statement.order_by(column, Task.id)
+        if limit is None:
+            return self.session.exec(statement).all(), None
+        tasks = self.session.exec(statement.limit(limit + 1)).all()
+
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = encode_cursor(getattr(tasks[-1], field), tasks[-1].id, sort)
+        return tasks, next_cursor
+
+    def get_tasks_version(self, user_id: int) -> Tuple[int, Optional[datetime]]:
+        """Get the task count and latest updated_at for a user.
+
+        Any create, update or delete changes at least one of the two, which
+        makes them a cheap validator for the user's task list.
+        """
+        def load():
+            statement = select(func.count(Task.id), func.max(Task.updated_at)).where(Task.user_id == user_id)
+            count, last_updated = self.session.execute(statement).one()
+            return count, last_updated
+
+        return self._cached_list(user_id, ("version",), load)
+
+    def get_changes(
+        self,
+        user_id: int,
+        since: Optional[datetime] = None,
+        lag: timedelta = timedelta(0)
+    ) -> Tuple[List[Task], List[int], datetime]:
+        """Get a user's tasks created or updated, and IDs deleted, since a time.
+
+        Without since, every task is returned. The returned sync time trails
+        the clock by lag and the since bound is inclusive, so writes that
+        were still committing are picked up by the next call; clients must
+        apply changes idempotently, deletions first.
+
+        Returns:
+            The changed tasks ordered by (updated_at, id), the deleted task
+            IDs, and the time to pass as since on the next call.
+        """
+        synced_at = datetime.utcnow() - lag
+        statement = select(Task).where(Task.user_id == user_id)
+        if since is None:
+            return self.session.exec(statement.order_by(Task.updated_at, Task.id)).all(), [], synced_at
+
+        tasks = self.session.exec(
+            statement.where(Task.updated_at >= since).order_by(Task.updated_at, Task.id)
+        ).all()
+        deleted = self.session.exec(
+            select(TaskTombstone.task_id)
+            .where(and_(TaskTombstone.user_id == user_id, TaskTombstone.deleted_at >= since))
+            .order_by(TaskTombstone.deleted_at, TaskTombstone.id)
+        ).all()
+        return tasks, list(dict.fromkeys(deleted)), synced_at
+
+    def prune_tombstones(self, before: datetime) -> int:
+        """Delete the records of tasks deleted before a time and commit.
+
+        Returns the number of records removed.
+        """
+        table = TaskTombstone.__table__
+        result = self.session.execute(table.delete().where(table.c.deleted_at < before))
+        self.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def export_statement(user_id: int):
+        """Select all of a user's task columns in creation order, for export."""
+        table = Task.__table__
+        return select(table).where(table.c.user_id == user_id).order_by(table.c.created_at, table.c.id)
+
+    def iter_task_rows(self, user_id: int, batch_size: int = 1000) -> Iterator[List[dict]]:
+        """Stream a user's tasks as batches of column dicts.
+
+        Uses a server-side cursor where the driver supports one, so memory
+        stays bounded by batch_size however many tasks the user has.
+        """
+        statement = self.export_statement(user_id).execution_options(
+            stream_results=True, max_row_buffer=batch_size
+        )
+        result = self.session.execute(statement)
+        for partition in result.mappings().partitions(batch_size):
+            yield [dict(row) for row in partition]
+
     def get_task_by_id(self, task_id: int, user_id: int) -> Optional[Task]:
         """Get a specific task by ID for a specific user."""
         statement = select(Task).where(and_(Task.id == task_id, Task.user_id == user_id))
         result = self.session.exec(statement)
         return result.first()
 
-    def update_task(self, task_id: int, user_id: int, task_update: TaskUpdate) -> Optional[Task]:
-        """Update a task for a specific user."""
-        statement = select(Task).where(and_(Task.id == task_id, Task.user_id == user_id))
-        result = self.session.exec(statement)
-        db_task = result.first()
+    def _supports_returning(self, statement_type: str) -> bool:
+        """Whether the dialect supports RETURNING on "update" or "delete"."""
+        dialect = self.session.get_bind().dialect
+        # SQLAlchemy 2.0 has per-statement flags (update_returning, ...); 1.4
+        # only enables RETURNING for Postgres-like dialects via full_returning
+        # (not SQLite, even 3.35+).
+        return bool(getattr(dialect, f"{statement_type}_returning", getattr(dialect, "full_returning", False)))
 
-        if not db_task:
-            return None
+    def _update_owned_task(
+        self, task_id: int, user_id: int, values: dict, event_type: str = "task.updated"
+    ) -> Optional[Task]:
+        """Apply values to a user's task in a single UPDATE and return the new row.
 
-        # Update the task with provided fields
-        update_data = task_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_task, field, value)
+        A completion change is applied by _set_completed, which also keeps
+        the counters exact; the main UPDATE only runs for the other fields,
+        and only matches if one of them differs. The event is published only
+        when the row actually changed.
+        """
+        table = Task.__table__
+        changed = False
+        if values.get("completed") is not None:
+            values = dict(values)
+            changed = self._set_completed(user_id, [task_id], values.pop("completed")) > 0
 
-        self.session.add(db_task)
+        task = None
+        if values:
+            statement = table.update().where(and_(
+                table.c.id == task_id,
+                table.c.user_id == user_id,
+                or_(*(table.c[field].is_distinct_from(value) for field, value in values.items()))
+            )).values(**values)
+            if self._supports_returning("update"):
+                row = self.session.execute(statement.returning(*table.columns)).first()
+                if row is not None:
+                    task, changed = Task(**row._mapping), True
+            else:
+                changed = self.session.execute(statement).rowcount > 0 or changed
         self.session.commit()
-        self.session.refresh(db_task)
-        return db_task
+        if changed:
+            self._invalidate(user_id)
+        if task is None:
+            # Unchanged, or a dialect without RETURNING
+            task = self.get_task_by_id(task_id, user_id)
+
+        if task is not None and changed:
+            self._publish_task(event_type, task)
+        return task
+
+    def _set_completed(self, user_id: int, task_ids: Iterable[int], completed: bool) -> int:
+        """Set completed on the tasks whose status differs, count the flips and return their number.
+
+        Only rows that actually change match the UPDATE, so its rowcount is
+        the exact change to the completed counter even under concurrency.
+        """
+        table = Task.__table__
+        result = self.session.execute(
+            table.update()
+            .where(and_(table.c.user_id == user_id, table.c.id.in_(set(task_ids)), table.c.completed != completed))
+            .values(completed=completed)
+        )
+        if result.rowcount:
+            self._apply_stats_delta(user_id, 0, result.rowcount if completed else -result.rowcount)
+        return result.rowcount
+
+    def _delete_owned(self, user_id: int, condition) -> Set[int]:
+        """Delete the user's tasks matching condition and update the counters."""
+        table = Task.__table__
+        if self._supports_returning("delete"):
+            rows = self.session.execute(
+                table.delete().where(condition).returning(table.c.id, table.c.completed)
+            ).all()
+        else:
+            rows = self.session.execute(
+                select(table.c.id, table.c.completed).where(condition).with_for_update()
+            ).all()
+            if rows:
+                self.session.execute(table.delete().where(condition))
+        self._apply_stats_delta(user_id, -len(rows), -sum(1 for row in rows if row.completed))
+        if rows:
+            now = datetime.utcnow()
+            self.session.execute(TaskTombstone.__table__.insert(), [
+                {"task_id": row.id, "user_id": user_id, "deleted_at": now} for row in rows
+            ])
+        return {row.id for row in rows}
+
+    def update_task(self, task_id: int, user_id: int, task_update: TaskUpdate) -> Optional[Task]:
+        """Update a task for a specific user."""
+        update_data = task_update.dict(exclude_unset=True)
+        return self._update_owned_task(task_id, user_id, update_data)
 
     def update_task_completion_status(self, task_id: int, user_id: int, completed: bool) -> Optional[Task]:
         """Update the completion status of a task."""
-        statement = select(Task).where(and_(Task.id == task_id, Task.user_id == user_id))
-        result = self.session.exec(statement)
-        db_task = result.first()
+        return self._update_owned_task(task_id, user_id, {"completed": completed}, "task.completed")
 
-        if not db_task:
-            return None
+    def delete_task(self, task_id: int, user_id: int) -> bool:
+        """Delete a task for a specific user."""
+        table = Task.__table__
+        deleted_ids = self._delete_owned(user_id, and_(table.c.id == task_id, table.c.user_id == user_id))
+        self.session.commit()
+        self._invalidate(user_id)
+        self._publish_deleted(user_id, deleted_ids)
+        return bool(deleted_ids)
 
-        db_task.completed = completed
-        self.session.add(db_task)
+    def _publish_deleted(self, user_id: int, task_ids: Iterable[int]) -> None:
+        for task_id in task_ids:
+            self._publish(user_id, "task.deleted", {"id": task_id})
+
+    def create_tasks(self, tasks_data: List[TaskCreate]) -> List[Task]:
+        """Create several tasks in one transaction.
+
+        The inserts are flushed together, which SQLAlchemy batches into
+        multi-row statements where the driver allows it.
+        """
+        db_tasks = [Task.from_orm(task_data) for task_data in tasks_data]
+        self.session.add_all(db_tasks)
+        self.session.flush()
+        self._apply_stats_deltas((db_task.user_id, db_task.completed) for db_task in db_tasks)
+        # Detach before committing so the new rows are not expired and
+        # re-selected one by one when they are read back.
+        for db_task in db_tasks:
+            self.session.expunge(db_task)
         self.session.commit()
-        self.session.refresh(db_task)
-        return db_task
+        self._invalidate(*(db_task.user_id for db_task in db_tasks))
+        for db_task in db_tasks:
+            self._publish_task("task.created", db_task)
+        return db_tasks
 
-    def delete_task(self, task_id: int, user_id: int) -> bool:
-        """Delete a task for a specific user."""
-        statement = select(Task).where(and_(Task.id == task_id, Task.user_id == user_id))
-        result = self.session.exec(statement)
-        db_task = result.first()
+    def insert_tasks_batch(self, tasks_data: List[TaskCreate]) -> int:
+        """Insert tasks with one multi-row INSERT and commit.
+
+        Unlike create_tasks, no Task objects are built or returned, which
+        keeps large imports cheap. Returns the number of rows inserted.
+        """
+        if not tasks_data:
+            return 0
+        now = datetime.utcnow()
+        rows = [
+            {**task_data.dict(include={"title", "description", "completed", "user_id"}),
+             "created_at": now, "updated_at": now}
+            for task_data in tasks_data
+        ]
+        self.session.execute(Task.__table__.insert().values(rows))
+        self._apply_stats_deltas((row["user_id"], row["completed"]) for row in rows)
+        self.session.commit()
+        self._invalidate(*(row["user_id"] for row in rows))
+        # The inserted IDs are not known here, so subscribers are told how
+        # many tasks arrived and refresh through delta sync
+        imported = Counter(row["user_id"] for row in rows)
+        for user_id, count in imported.items():
+            self._publish(user_id, "tasks.imported", {"count": count})
+        return len(rows)
+
+    def update_tasks(self, user_id: int, updates: List[TaskBulkUpdate]) -> Dict[int, Task]:
+        """Update several of a user's tasks in one transaction.
+
+        Updates that set the same fields share one executemany UPDATE.
+
+        Returns:
+            The updated tasks keyed by ID; requested IDs missing from the
+            result do not exist or belong to another user.
+        """
+        if not updates:
+            return {}
+        table = Task.__table__
+        groups: Dict[Tuple[str, ...], List[dict]] = {}
+        for update in updates:
+            values = update.dict(exclude_unset=True, exclude={"id"})
+            if not values:
+                continue
+            fields = tuple(sorted(values))
+            groups.setdefault(fields, []).append({"task_id": update.id, "owner_id": user_id, **values})
+
+        for completed in (True, False):
+            task_ids = [params["task_id"] for params in chain.from_iterable(groups.values())
+                        if params.get("completed") is completed]
+            if task_ids:
+                self._set_completed(user_id, task_ids, completed)
+        for fields, params in groups.items():
+            statement = table.update().where(and_(
+                table.c.id == bindparam("task_id"),
+                table.c.user_id == bindparam("owner_id")
+            )).values({field: bindparam(field) for field in fields})
+            self.session.execute(statement, params)
+        self.session.commit()
+        self._invalidate(user_id)
+
+        task_ids = {update.id for update in updates}
+        statement = select(Task).where(and_(Task.user_id == user_id, Task.id.in_(task_ids)))
+        updated = {task.id: task for task in self.session.exec(statement).all()}
+        for task in updated.values():
+            self._publish_task("task.updated", task)
+        return updated
+
+    def delete_tasks(self, user_id: int, task_ids: List[int]) -> Set[int]:
+        """Delete several of a user's tasks in one statement.
 
-        if not db_task:
-            return False
+        Returns:
+            The IDs that were deleted.
+        """
+        if not task_ids:
+            return set()
+        table = Task.__table__
+        condition = and_(table.c.user_id == user_id, table.c.id.in_(set(task_ids)))
 
-        self.session.delete(db_task)
+        deleted_ids = self._delete_owned(user_id, condition)
         self.session.commit()
-        return True
\ No newline at end of file
+        self._invalidate(user_id)
+        self._publish_deleted(user_id, deleted_ids)
+        return deleted_ids
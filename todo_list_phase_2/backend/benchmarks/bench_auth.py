@@ -0,0 +1,73 @@
+"""
+Microbenchmark of JWT authentication overhead per request.
+
+Compares a full jwt.decode (HMAC verification and claim checks) with a
+lookup in the verified token cache, and measures JWTBearer end to end on
+a bare request for both a cold and a warm cache.
+
+Usage (from the backend directory, with the JWT settings in .env):
+    python -m benchmarks.bench_auth
+    python -m benchmarks.bench_auth --iterations 100000
+"""
+
+import argparse
+import asyncio
+import time
+
+import jwt
+from starlette.requests import Request
+
+from app.config import settings
+from app.middleware import jwt_middleware
+from app.middleware.jwt_middleware import JWTBearer, create_access_token, decode_access_token
+
+
+def per_call_us(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def make_request(token: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    })
+
+
+def run(iterations: int):
+    token = create_access_token({"sub": "1"})
+    bearer = JWTBearer()
+    loop = asyncio.new_event_loop()
+
+    def full_decode():
+        jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+
+    def cold_bearer():
+        jwt_middleware.verified_token_cache.clear()
+        loop.run_until_complete(bearer(make_request(token)))
+
+    def warm_bearer():
+        loop.run_until_complete(bearer(make_request(token)))
+
+    decode_access_token(token)
+    results = {
+        "jwt.decode": per_call_us(full_decode, iterations),
+        "cached decode_access_token": per_call_us(lambda: decode_access_token(token), iterations),
+        "JWTBearer, cold cache": per_call_us(cold_bearer, iterations),
+        "JWTBearer, warm cache": per_call_us(warm_bearer, iterations),
+    }
+    loop.close()
+
+    for name, microseconds in results.items():
+        print(f"{name:<28} {microseconds:>8.2f} us/request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.iterations)
@@ -0,0 +1,81 @@
+"""
+Benchmark task list response serialization.
+
+Compares the default path, where FastAPI validates the Task rows against
+List[TaskSchema] and encodes the result with JSONResponse, with the
+fast_json_responses path, which converts rows to dicts and encodes them
+with orjson.
+
+Usage (from the backend directory, with settings in .env):
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --sizes 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+
+from app.main import app
+from app.models import Task
+from app.responses import task_to_dict
+
+DEFAULT_SIZES = [100, 1_000, 10_000]
+
+
+def make_tasks(count: int):
+    base = datetime(2024, 1, 1)
+    return [
+        Task(id=i, title=f"Task {i}", description="Some description" if i % 2 else None,
+             completed=i % 3 == 0, user_id=1,
+             created_at=base + timedelta(seconds=i), updated_at=base + timedelta(seconds=i))
+        for i in range(1, count + 1)
+    ]
+
+
+def list_response_field():
+    for route in app.routes:
+        if getattr(route, "name", None) == "get_tasks":
+            return route.secure_cloned_response_field or route.response_field
+    raise RuntimeError("get_tasks route not found")
+
+
+def median_ms(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def run(sizes, repeat: int):
+    field = list_response_field()
+    loop = asyncio.new_event_loop()
+
+    def default_path(tasks):
+        content = loop.run_until_complete(serialize_response(field=field, response_content=tasks))
+        return JSONResponse(content).body
+
+    def fast_path(tasks):
+        return ORJSONResponse([task_to_dict(task) for task in tasks]).body
+
+    print(f"{'tasks':>7} {'default ms':>11} {'fast ms':>9} {'speedup':>8}")
+    for size in sizes:
+        tasks = make_tasks(size)
+        default_ms = median_ms(lambda: default_path(tasks), repeat)
+        fast_ms = median_ms(lambda: fast_path(tasks), repeat)
+        print(f"{size:>7} {default_ms:>11.2f} {fast_ms:>9.2f} {default_ms / fast_ms:>7.1f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
@@ -0,0 +1,116 @@
+"""
+Benchmark list and point lookups on the task table, with and without the
+composite indexes declared on the Task model.
+
+Seeds a SQLite database per size with a fixed number of tasks per user, so
+the per-user result stays constant while the table grows. With indexes,
+lookup latency should stay flat as the table grows; without them every
+query is a full table scan.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_task_indexes
+    python -m benchmarks.bench_task_indexes --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlmodel import SQLModel, Session
+
+from app.models import User, Task
+from app.services.task_service import TaskService
+
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+BATCH_SIZE = 10_000
+
+
+def seed(engine, total_tasks: int, tasks_per_user: int) -> int:
+    """Insert users and tasks in batches. Returns the number of users."""
+    user_count = max(1, total_tasks // tasks_per_user)
+    base = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"id": i, "email": f"user{i}@example.com", "created_at": base, "updated_at": base}
+            for i in range(1, user_count + 1)
+        ])
+        batch = []
+        for i in range(total_tasks):
+            created_at = base + timedelta(seconds=i)
+            batch.append({
+                "title": f"Task {i}",
+                "description": None,
+                "completed": i % 3 == 0,
+                "user_id": i % user_count + 1,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+            if len(batch) == BATCH_SIZE:
+                conn.execute(Task.__table__.insert(), batch)
+                batch = []
+        if batch:
+            conn.execute(Task.__table__.insert(), batch)
+    return user_count
+
+
+def drop_task_indexes(engine):
+    with engine.begin() as conn:
+        for index in Task.__table__.indexes:
+            index.drop(conn)
+
+
+def time_queries(engine, user_count: int, total_tasks: int, repeat: int) -> dict:
+    """Return median milliseconds for a first-page list and a point lookup."""
+    rng = random.Random(0)
+    list_times, lookup_times = [], []
+    with Session(engine) as session:
+        task_service = TaskService(session)
+        for _ in range(repeat):
+            user_id = rng.randint(1, user_count)
+            start = time.perf_counter()
+            task_service.get_tasks_page(user_id, 50)
+            list_times.append(time.perf_counter() - start)
+
+            task_id = rng.randint(1, total_tasks)
+            owner_id = (task_id - 1) % user_count + 1
+            start = time.perf_counter()
+            task_service.get_task_by_id(task_id, owner_id)
+            lookup_times.append(time.perf_counter() - start)
+            session.expunge_all()
+    return {
+        "list_ms": statistics.median(list_times) * 1000,
+        "lookup_ms": statistics.median(lookup_times) * 1000,
+    }
+
+
+def run(sizes, tasks_per_user: int, repeat: int):
+    print(f"{'tasks':>10} {'indexes':>8} {'list p50 ms':>12} {'lookup p50 ms':>14}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            SQLModel.metadata.create_all(engine)
+            user_count = seed(engine, size, tasks_per_user)
+
+            for indexed in (True, False):
+                if not indexed:
+                    drop_task_indexes(engine)
+                result = time_queries(engine, user_count, size, repeat)
+                print(f"{size:>10} {'yes' if indexed else 'no':>8} "
+                      f"{result['list_ms']:>12.3f} {result['lookup_ms']:>14.3f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Total task counts to benchmark")
+    parser.add_argument("--tasks-per-user", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200, help="Queries per measurement")
+    args = parser.parse_args()
+    run(args.sizes, args.tasks_per_user, args.repeat)
@@ -0,0 +1,307 @@
+"""
+Concurrent load test of every task route, reported as JSON.
+
+Seeds a fresh SQLite database with --users users and --tasks tasks spread
+evenly across them, mints a JWT per user with create_access_token, and
+drives the app in-process through an ASGI client from --concurrency
+workers for --requests requests. Each request picks a route from a fixed
+weighted mix with a seeded RNG, so runs are reproducible and the JSON
+output can be diffed between commits.
+
+The event stream (/events) never completes and is left out of the mix.
+
+Usage (from the backend directory, with the JWT settings in .env):
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --users 100 --tasks 100000 --concurrency 32 --requests 20000
+    python -m benchmarks.load_test --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+
+BATCH_SIZE = 10_000
+
+# Relative weight of each operation in the request mix
+ROUTE_WEIGHTS = {
+    "POST /tasks": 8,
+    "GET /tasks": 20,
+    "GET /tasks?completed&sort": 6,
+    "GET /tasks?q": 4,
+    "GET /tasks/stats": 6,
+    "GET /tasks/changes": 6,
+    "GET /tasks/export": 1,
+    "POST /tasks/import": 1,
+    "POST /tasks/bulk": 2,
+    "PATCH /tasks/bulk": 2,
+    "DELETE /tasks/bulk": 2,
+    "GET /tasks/{id}": 20,
+    "PUT /tasks/{id}": 8,
+    "PATCH /tasks/{id}/complete": 8,
+    "DELETE /tasks/{id}": 6,
+}
+
+WORDS = ["buy", "milk", "call", "report", "fix", "bike", "plan", "trip", "read", "book", "pay", "rent"]
+
+
+def seed(engine, users: int, tasks: int, rng: random.Random) -> dict:
+    """Insert users and tasks in batches. Returns the task IDs of each user."""
+    from sqlmodel import Session
+    from app.models import User, Task
+    from app.services.task_service import TaskService
+
+    base = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"id": i, "email": f"user{i}@example.com", "created_at": base, "updated_at": base}
+            for i in range(1, users + 1)
+        ])
+        rows = []
+        for i in range(tasks):
+            created_at = base + timedelta(seconds=i)
+            rows.append({
+                "title": " ".join(rng.choices(WORDS, k=3)),
+                "description": None,
+                "completed": rng.random() < 0.3,
+                "user_id": i % users + 1,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+            if len(rows) == BATCH_SIZE:
+                conn.execute(Task.__table__.insert(), rows)
+                rows = []
+        if rows:
+            conn.execute(Task.__table__.insert(), rows)
+
+    with Session(engine) as session:
+        # Build the counters the stats endpoint reads
+        TaskService(session).reconcile_task_stats()
+        task_ids = defaultdict(list)
+        for task_id, user_id in session.execute(select(Task.id, Task.user_id)):
+            task_ids[user_id].append(task_id)
+    return task_ids
+
+
+class Worker:
+    """One concurrent client issuing requests as a random seeded user."""
+
+    def __init__(self, client, rng: random.Random, tokens: dict, task_ids: dict, recorder: dict, sync_tokens: dict):
+        self.client = client
+        self.sync_tokens = sync_tokens
+        self.rng = rng
+        self.tokens = tokens
+        self.task_ids = task_ids
+        self.recorder = recorder
+        # Tasks this worker created and may delete, per user
+        self.created = defaultdict(list)
+
+    async def request(self, name: str, method: str, url: str, user_id: int, **kwargs):
+        headers = {"Authorization": f"Bearer {self.tokens[user_id]}", **kwargs.pop("headers", {})}
+        start = time.perf_counter()
+        response = await self.client.request(method, url, headers=headers, **kwargs)
+        elapsed = time.perf_counter() - start
+        latencies, errors = self.recorder[name]
+        latencies.append(elapsed)
+        if response.status_code >= 400:
+            errors.append(response.status_code)
+        return response
+
+    def existing_task(self, user_id: int) -> int:
+        return self.rng.choice(self.task_ids[user_id])
+
+    def take_created(self, user_id: int, count: int) -> list:
+        created = self.created[user_id]
+        taken, self.created[user_id] = created[:count], created[count:]
+        return taken
+
+    async def create(self, user_id: int, name: str = "POST /tasks") -> None:
+        response = await self.request(name, "POST", f"/api/{user_id}/tasks/", user_id, json={
+            "title": " ".join(self.rng.choices(WORDS, k=3)), "user_id": user_id
+        })
+        if response.status_code == 201:
+            self.created[user_id].append(response.json()["id"])
+
+    async def run_one(self, name: str) -> None:
+        user_id = self.rng.choice(list(self.tokens))
+        base = f"/api/{user_id}/tasks"
+        if name == "POST /tasks":
+            await self.create(user_id)
+        elif name == "GET /tasks":
+            await self.request(name, "GET", f"{base}/", user_id, params={"limit": 50})
+        elif name == "GET /tasks?completed&sort":
+            await self.request(name, "GET", f"{base}/", user_id, params={
+                "limit": 50, "completed": "false", "sort": "updated_at", "order": "desc"
+            })
+        elif name == "GET /tasks?q":
+            await self.request(name, "GET", f"{base}/", user_id, params={"limit": 50, "q": self.rng.choice(WORDS)})
+        elif name == "GET /tasks/stats":
+            await self.request(name, "GET", f"{base}/stats", user_id)
+        elif name == "GET /tasks/changes":
+            since = self.sync_tokens.get(user_id)
+            response = await self.request(
+                name, "GET", f"{base}/changes", user_id, params={"since": since} if since else {}
+            )
+            if response.status_code == 200:
+                self.sync_tokens[user_id] = response.json()["next_token"]
+        elif name == "GET /tasks/export":
+            await self.request(name, "GET", f"{base}/export", user_id)
+        elif name == "POST /tasks/import":
+            body = "".join(json.dumps({"title": f"imported {i}"}) + "\n" for i in range(20))
+            await self.request(name, "POST", f"{base}/import", user_id, content=body,
+                               headers={"Content-Type": "application/x-ndjson"})
+        elif name == "POST /tasks/bulk":
+            response = await self.request(name, "POST", f"{base}/bulk", user_id, json=[
+                {"title": f"bulk {i}", "user_id": user_id} for i in range(10)
+            ])
+            if response.status_code == 201:
+                self.created[user_id].extend(result["id"] for result in response.json())
+        elif name == "PATCH /tasks/bulk":
+            await self.request(name, "PATCH", f"{base}/bulk", user_id, json=[
+                {"id": self.existing_task(user_id), "completed": self.rng.random() < 0.5} for _ in range(10)
+            ])
+        elif name == "DELETE /tasks/bulk":
+            task_ids = self.take_created(user_id, 10)
+            if task_ids:
+                await self.request(name, "DELETE", f"{base}/bulk", user_id, json=task_ids)
+        elif name == "GET /tasks/{id}":
+            await self.request(name, "GET", f"{base}/{self.existing_task(user_id)}", user_id)
+        elif name == "PUT /tasks/{id}":
+            await self.request(name, "PUT", f"{base}/{self.existing_task(user_id)}", user_id, json={
+                "title": " ".join(self.rng.choices(WORDS, k=3))
+            })
+        elif name == "PATCH /tasks/{id}/complete":
+            await self.request(name, "PATCH", f"{base}/{self.existing_task(user_id)}/complete", user_id, params={
+                "completed": str(self.rng.random() < 0.5).lower()
+            })
+        elif name == "DELETE /tasks/{id}":
+            task_ids = self.take_created(user_id, 1)
+            if not task_ids:
+                # Keep the seeded data set intact: only delete what was created
+                await self.create(user_id)
+                task_ids = self.take_created(user_id, 1)
+            if task_ids:
+                await self.request(name, "DELETE", f"{base}/{task_ids[0]}", user_id)
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: list, errors: list, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": len(errors),
+        "throughput_rps": round(len(ordered) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def drive(args, task_ids: dict) -> dict:
+    import httpx
+    from app.main import app
+    from app.middleware.jwt_middleware import create_access_token
+
+    tokens = {user_id: create_access_token({"sub": str(user_id)}) for user_id in task_ids}
+    names = list(ROUTE_WEIGHTS)
+    weights = [ROUTE_WEIGHTS[name] for name in names]
+    plan_rng = random.Random(args.seed)
+    plan = plan_rng.choices(names, weights=weights, k=args.requests)
+    recorder = defaultdict(lambda: ([], []))
+
+    # The ASGI transport does not run lifespan events
+    await app.router.startup()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+        sync_tokens = {}
+        workers = [
+            Worker(client, random.Random(args.seed + i + 1), tokens, task_ids, recorder, sync_tokens)
+            for i in range(args.concurrency)
+        ]
+        queue = iter(plan)
+
+        async def run_worker(worker: Worker):
+            for name in queue:
+                await worker.run_one(name)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(run_worker(worker) for worker in workers))
+        elapsed = time.perf_counter() - start
+    await app.router.shutdown()
+
+    all_latencies = [latency for latencies, _ in recorder.values() for latency in latencies]
+    all_errors = [error for _, errors in recorder.values() for error in errors]
+    return {
+        "commit": git_commit(),
+        "config": {
+            "users": args.users, "tasks": args.tasks, "concurrency": args.concurrency,
+            "requests": args.requests, "seed": args.seed,
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        "total": summarize(all_latencies, all_errors, elapsed),
+        "routes": {
+            name: summarize(*recorder[name], elapsed)
+            for name in names if recorder[name][0]
+        },
+    }
+
+
+def run(args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        # The app builds its engine from settings on import, so point it at
+        # the seeded database before importing anything from app.
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'loadtest.db')}"
+        from sqlmodel import SQLModel
+        from app import models  # noqa: F401 - registers the tables
+        from app.database import engine
+
+        SQLModel.metadata.create_all(engine)
+        task_ids = seed(engine, args.users, args.tasks, random.Random(args.seed))
+        results = asyncio.run(drive(args, task_ids))
+        engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+    if args.tasks < args.users:
+        parser.error("--tasks must be at least --users so every user has tasks")
+
+    report = json.dumps(run(args), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
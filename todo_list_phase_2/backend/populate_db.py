@@ -1,116 +1,261 @@
 """
-Script to populate the database with sample users and tasks
+Script to populate the database with synthetic users and tasks
+
+Generates any volume of data, from a handful of rows up to millions:
+users are appended after the existing ones and their tasks are streamed
+into the database in batches, with COPY on PostgreSQL and multi-row
+INSERT statements on SQLite. The same --seed always produces the same
+data. Task counters are rebuilt at the end so /tasks/stats is correct.
+
+Usage (from the backend directory):
+    python populate_db.py
+    python populate_db.py --users 1000000 --tasks-per-user 20 --distribution pareto --seed 7
 """
 
-from datetime import datetime
+import argparse
+import csv
+import io
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from sqlalchemy import func, select, text
+from sqlmodel import SQLModel
+
 from app.database import Session, engine
-from app.models import User, Task
+from app.models import User
 from app.services.task_service import TaskService
-from sqlmodel import SQLModel
 
 
-def create_sample_data():
-    """Create sample users and tasks in the database."""
+DISTRIBUTIONS = ("fixed", "uniform", "pareto")
+# Pareto shape: a heavy tail where a few users own most of the tasks
+PARETO_ALPHA = 1.5
+USER_COLUMNS = ("id", "email", "created_at", "updated_at")
+TASK_COLUMNS = ("title", "description", "completed", "user_id", "created_at", "updated_at")
+# SQLite allows 32766 bound parameters per statement
+SQLITE_ROWS_PER_STATEMENT = 32766 // len(TASK_COLUMNS)
+
+VERBS = ["Buy", "Call", "Write", "Review", "Plan", "Book", "Fix", "Update", "Prepare", "Schedule", "Pay", "Clean"]
+OBJECTS = [
+    "groceries", "report", "dentist appointment", "presentation", "insurance", "resume", "weekend trip",
+    "car service", "rent", "kitchen", "quarterly numbers", "birthday gift", "flight", "newsletter"
+]
+DETAILS = ["before Friday", "with the team", "for next week", "again", "online", "after lunch", "today"]
+
+
+def task_count(rng: random.Random, distribution: str, mean: float, maximum: int) -> int:
+    """Draw the number of tasks of one user."""
+    if distribution == "fixed":
+        count = round(mean)
+    elif distribution == "uniform":
+        count = rng.randint(0, round(2 * mean))
+    else:
+        # paretovariate has minimum 1 and mean alpha / (alpha - 1)
+        count = int(mean * (PARETO_ALPHA - 1) / PARETO_ALPHA * rng.paretovariate(PARETO_ALPHA))
+    return min(count, maximum)
+
+
+def generate_users(first_id: int, count: int, now: datetime) -> Iterator[Tuple]:
+    for user_id in range(first_id, first_id + count):
+        yield (user_id, f"user{user_id}@example.com", now, now)
+
+
+def generate_tasks(
+    rng: random.Random,
+    counts: Sequence[Tuple[int, int]],
+    completed_ratio: float,
+    now: datetime,
+    history_days: int
+) -> Iterator[Tuple]:
+    """Yield task rows for (user_id, task count) pairs."""
+    history_seconds = history_days * 86400
+    for user_id, count in counts:
+        for _ in range(count):
+            created_at = now - timedelta(seconds=rng.randrange(history_seconds))
+            updated_at = created_at + timedelta(seconds=rng.randrange(int((now - created_at).total_seconds()) + 1))
+            description = f"{rng.choice(OBJECTS).capitalize()} {rng.choice(DETAILS)}" if rng.random() < 0.5 else None
+            yield (
+                f"{rng.choice(VERBS)} {rng.choice(OBJECTS)}",
+                description,
+                rng.random() < completed_ratio,
+                user_id,
+                created_at,
+                updated_at,
+            )
+
+
+def batches(rows: Iterable[Tuple], size: int) -> Iterator[List[Tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Progress:
+    """Print rows written so far and the write rate."""
+
+    def __init__(self, label: str, total: int):
+        self.label = label
+        self.total = total
+        self.done = 0
+        self.start = time.perf_counter()
+
+    def update(self, rows: int) -> None:
+        self.done += rows
+        elapsed = time.perf_counter() - self.start
+        rate = self.done / elapsed if elapsed else 0
+        print(f"[PROGRESS] {self.label}: {self.done:,} / {self.total:,} ({rate:,.0f} rows/sec)", flush=True)
+
+
+def copy_rows(raw_connection, table: str, columns: Sequence[str], rows: List[Tuple]) -> None:
+    """Load rows with COPY ... FROM STDIN (psycopg2)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        # NULL is an unquoted empty field in CSV COPY, so write None as ""
+        writer.writerow(["" if value is None else value for value in row])
+    buffer.seek(0)
+    with raw_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f'COPY "{table}" ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)', buffer
+        )
+
+
+def insert_rows(raw_connection, table: str, columns: Sequence[str], rows: List[Tuple], rows_per_statement: int) -> None:
+    """Load rows with multi-row INSERT statements, reusing one prepared statement."""
+    row_placeholder = "(" + ", ".join("?" for _ in columns) + ")"
+    head = f'INSERT INTO "{table}" ({", ".join(columns)}) VALUES '
+    cursor = raw_connection.cursor()
+    full = len(rows) - len(rows) % rows_per_statement
+    if full:
+        statement = head + ", ".join([row_placeholder] * rows_per_statement)
+        cursor.executemany(statement, (
+            [value for row in rows[i:i + rows_per_statement] for value in row]
+            for i in range(0, full, rows_per_statement)
+        ))
+    if full < len(rows):
+        remainder = rows[full:]
+        cursor.execute(head + ", ".join([row_placeholder] * len(remainder)), [v for row in remainder for v in row])
+    cursor.close()
+
+
+def sqlite_value(value):
+    # Store datetimes in the format SQLAlchemy writes and compares against
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f") if isinstance(value, datetime) else value
+
+
+def load(raw_connection, method: str, table: str, columns: Sequence[str], rows: List[Tuple]) -> None:
+    """Write one batch of rows with the given method and commit."""
+    if method == "copy":
+        copy_rows(raw_connection, table, columns, rows)
+    elif method == "insert":
+        rows = [tuple(sqlite_value(value) for value in row) for row in rows]
+        insert_rows(raw_connection, table, columns, rows, min(SQLITE_ROWS_PER_STATEMENT, len(rows)))
+    else:
+        # Other drivers: executemany through SQLAlchemy's generic insert
+        with Session(engine) as session:
+            target = SQLModel.metadata.tables[table]
+            session.execute(target.insert(), [dict(zip(columns, row)) for row in rows])
+            session.commit()
+    raw_connection.commit()
+
+
+def load_method(raw_connection, dialect_name: str) -> str:
+    if dialect_name == "postgresql" and hasattr(raw_connection.cursor(), "copy_expert"):
+        return "copy"
+    if dialect_name == "sqlite":
+        return "insert"
+    return "executemany"
+
+
+def create_sample_data(
+    users: int,
+    tasks_per_user: float,
+    distribution: str,
+    max_tasks_per_user: int,
+    completed_ratio: float,
+    history_days: int,
+    batch_size: int,
+    seed: int
+):
+    """Append generated users and their tasks to the database."""
 
     # Create tables if they don't exist
     SQLModel.metadata.create_all(engine)
+    dialect_name = engine.dialect.name
+
+    with Session(engine) as session:
+        first_user_id = (session.execute(select(func.max(User.id))).scalar() or 0) + 1
+
+    rng = random.Random(seed)
+    counts = [
+        (user_id, task_count(rng, distribution, tasks_per_user, max_tasks_per_user))
+        for user_id in range(first_user_id, first_user_id + users)
+    ]
+    total_tasks = sum(count for _, count in counts)
+    now = datetime.utcnow().replace(microsecond=0)
+    print(f"[PLAN] {users:,} users (from ID {first_user_id}) and {total_tasks:,} tasks, seed {seed}")
+
+    raw_connection = engine.raw_connection()
+    try:
+        method = load_method(raw_connection, dialect_name)
+        print(f"[PLAN] Loading with {method} in batches of {batch_size:,} rows")
+        if dialect_name == "sqlite":
+            # Seed data can be regenerated, so skip fsyncs during the load
+            raw_connection.execute("PRAGMA synchronous = OFF")
+
+        progress = Progress("users", users)
+        for batch in batches(generate_users(first_user_id, users, now), batch_size):
+            load(raw_connection, method, "user", USER_COLUMNS, batch)
+            progress.update(len(batch))
+
+        progress = Progress("tasks", total_tasks)
+        task_rows = generate_tasks(rng, counts, completed_ratio, now, history_days)
+        for batch in batches(task_rows, batch_size):
+            load(raw_connection, method, "task", TASK_COLUMNS, batch)
+            progress.update(len(batch))
+    finally:
+        raw_connection.close()
 
     with Session(engine) as session:
-        # Create sample users
-        print("Creating sample users...")
-
-        # Check if users already exist
-        existing_users = session.query(User).all()
-        if existing_users:
-            print(f"Found {len(existing_users)} existing users. Skipping user creation.")
-        else:
-            user1 = User(email="alice@example.com")
-            user2 = User(email="bob@example.com")
-
-            session.add(user1)
-            session.add(user2)
+        if dialect_name == "postgresql":
+            # User IDs were assigned here, so move the sequence past them
+            session.execute(text(
+                "SELECT setval(pg_get_serial_sequence('\"user\"', 'id'), (SELECT MAX(id) FROM \"user\"))"
+            ))
+            session.execute(text("ANALYZE \"user\", task"))
             session.commit()
+        print("[STATS] Rebuilding task counters...")
+        TaskService(session).reconcile_task_stats()
 
-            # Refresh to get the IDs
-            session.refresh(user1)
-            session.refresh(user2)
-
-            print(f"Created users: {user1.email} (ID: {user1.id}), {user2.email} (ID: {user2.id})")
-
-        # Get all users to assign tasks to them
-        users = session.query(User).all()
-
-        if not users:
-            print("No users found in the database!")
-            return
-
-        # Create sample tasks for the users
-        print("Creating sample tasks...")
-
-        # Get the service to handle task creation
-        task_service = TaskService(session)
-
-        # Sample tasks for user 1
-        sample_tasks_user1 = [
-            {"title": "Complete project proposal", "description": "Finish the project proposal document and submit to manager", "completed": False},
-            {"title": "Buy groceries", "description": "Milk, bread, eggs, fruits", "completed": True},
-            {"title": "Schedule dentist appointment", "description": "Call Dr. Smith's office to schedule checkup", "completed": False},
-            {"title": "Review quarterly reports", "description": "Analyze Q4 financial reports with team", "completed": False}
-        ]
-
-        # Sample tasks for user 2
-        sample_tasks_user2 = [
-            {"title": "Prepare presentation slides", "description": "Create slides for Monday meeting", "completed": False},
-            {"title": "Call insurance company", "description": "Renew car insurance policy", "completed": True},
-            {"title": "Update resume", "description": "Add new skills and experiences", "completed": False},
-            {"title": "Plan weekend trip", "description": "Book hotel and plan itinerary", "completed": False}
-        ]
-
-        # Add tasks for user 1
-        for task_data in sample_tasks_user1:
-            task = Task(
-                title=task_data["title"],
-                description=task_data["description"],
-                completed=task_data["completed"],
-                user_id=users[0].id  # Assign to first user
-            )
-            session.add(task)
-
-        # Add tasks for user 2 (if there's a second user)
-        if len(users) > 1:
-            for task_data in sample_tasks_user2:
-                task = Task(
-                    title=task_data["title"],
-                    description=task_data["description"],
-                    completed=task_data["completed"],
-                    user_id=users[1].id  # Assign to second user
-                )
-                session.add(task)
-
-        session.commit()
-
-        # Count and display created tasks
-        total_tasks = session.query(Task).count()
-        user1_tasks = session.query(Task).filter(Task.user_id == users[0].id).count()
-        user2_tasks = session.query(Task).filter(Task.user_id == users[1].id).count() if len(users) > 1 else 0
-
-        print(f"\n[STATS] Database populated successfully!")
-        print(f"   Users created: {len(users)}")
-        print(f"   Total tasks created: {total_tasks}")
-        print(f"   Tasks for {users[0].email}: {user1_tasks}")
-        if len(users) > 1:
-            print(f"   Tasks for {users[1].email}: {user2_tasks}")
-
-        # Show all tasks
-        print(f"\n[TASKS] All Tasks in Database:")
-        all_tasks = session.query(Task).all()
-        for task in all_tasks:
-            user_email = next((u.email for u in users if u.id == task.user_id), "Unknown")
-            status = "[DONE]" if task.completed else "[TODO]"
-            print(f"   {status} [User: {user_email}] {task.title}")
+    print("\n[STATS] Database populated successfully!")
+    print(f"   Users created: {users:,}")
+    print(f"   Total tasks created: {total_tasks:,}")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=10, help="Users to create (default: 10)")
+    parser.add_argument("--tasks-per-user", type=float, default=10, help="Mean tasks per user (default: 10)")
+    parser.add_argument(
+        "--distribution", choices=DISTRIBUTIONS, default="uniform",
+        help="Tasks per user: exactly the mean, uniform between 0 and twice the mean, or heavy-tailed pareto"
+    )
+    parser.add_argument("--max-tasks-per-user", type=int, default=100_000)
+    parser.add_argument("--completed-ratio", type=float, default=0.3, help="Share of completed tasks (default: 0.3)")
+    parser.add_argument("--history-days", type=int, default=365, help="Spread created_at over this many days")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows per COPY/INSERT batch and commit")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
     print("[START] Starting database population...")
-    create_sample_data()
-    print("\n[DONE] Database population completed!")
\ No newline at end of file
+    create_sample_data(
+        args.users, args.tasks_per_user, args.distribution, args.max_tasks_per_user,
+        args.completed_ratio, args.history_days, args.batch_size, args.seed
+    )
+    print("\n[DONE] Database population completed!")
@@ -0,0 +1,32 @@
+"""
+Delete records of deleted tasks that are older than the sync retention.
+
+Delta sync reports deletions from these records; clients holding a token
+older than TASK_TOMBSTONE_RETENTION_DAYS are asked to reload instead, so
+older records are no longer needed. Run periodically.
+"""
+
+import argparse
+from datetime import datetime, timedelta
+from app.config import settings
+from app.database import Session, engine
+from app.services.task_service import TaskService
+
+
+def prune_task_tombstones(retention_days):
+    """Delete the records of tasks deleted more than retention_days ago."""
+
+    before = datetime.utcnow() - timedelta(days=retention_days)
+    with Session(engine) as session:
+        pruned = TaskService(session).prune_tombstones(before)
+    print(f"[SUCCESS] Pruned {pruned} deleted task record(s) older than {before.isoformat()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--retention-days", type=int, default=settings.task_tombstone_retention_days,
+        help="Keep records of tasks deleted within this many days"
+    )
+    args = parser.parse_args()
+    prune_task_tombstones(args.retention_days)
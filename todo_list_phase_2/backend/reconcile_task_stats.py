@@ -0,0 +1,30 @@
+"""
+Rebuild the per-user task counters from the task table.
+
+The counters are kept up to date by TaskService on every write; run this
+after writing to the task table outside the API, or periodically as a
+safety net.
+"""
+
+import argparse
+from app.database import Session, engine
+from app.services.task_service import TaskService
+from sqlmodel import SQLModel
+
+
+def reconcile_task_stats(user_id=None):
+    """Rebuild the counters of one user, or of every user."""
+
+    # Create the counter table if the database predates it
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        rebuilt = TaskService(session).reconcile_task_stats(user_id)
+    print(f"[SUCCESS] Rebuilt task counters for {rebuilt} user(s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=int, help="Only rebuild this user's counters")
+    args = parser.parse_args()
+    reconcile_task_stats(args.user_id)
@@ -1,7 +1,7 @@
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from backend.app.database import get_session
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session
+from backend.app.database import get_session, create_db_engine
 from backend.app.main import app
 
 
@@ -15,4 +15,14 @@ def test_app():
 def client(test_app):
     """Create a test client."""
     from fastapi.testclient import TestClient
-    return TestClient(test_app)
\ No newline at end of file
+    return TestClient(test_app)
+
+
+@pytest.fixture
+def db_session():
+    """Create a session bound to a fresh in-memory SQLite database."""
+    engine = create_db_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
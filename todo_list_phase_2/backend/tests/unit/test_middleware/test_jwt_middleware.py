@@ -0,0 +1,70 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+from starlette.requests import Request
+from backend.app.middleware import jwt_middleware
+from backend.app.middleware.jwt_middleware import (
+    JWTBearer, VerifiedTokenCache, create_access_token, decode_access_token
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    jwt_middleware.verified_token_cache.clear()
+    yield
+    jwt_middleware.verified_token_cache.clear()
+
+
+def _request(token: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    })
+
+
+def test_token_is_decoded_once():
+    """Test that repeated verification of a token hits the cache."""
+    token = create_access_token({"sub": "1"})
+
+    with patch.object(jwt_middleware.jwt, "decode", wraps=jwt_middleware.jwt.decode) as decode:
+        assert decode_access_token(token)["sub"] == "1"
+        assert decode_access_token(token)["sub"] == "1"
+
+    assert decode.call_count == 1
+
+
+def test_invalid_token_is_not_cached():
+    """Test that tokens failing verification are rejected every time."""
+    assert decode_access_token("invalid-token") is None
+    assert jwt_middleware.verified_token_cache.get("invalid-token") is None
+
+
+def test_cache_entry_expires_at_token_exp():
+    """Test that a cached token is dropped once its exp has passed."""
+    cache = VerifiedTokenCache()
+    cache.set("token", {"sub": "1", "exp": time.time() - 1})
+
+    assert cache.get("token") is None
+
+
+def test_cache_is_bounded():
+    """Test that the least recently used token is evicted when full."""
+    cache = VerifiedTokenCache(max_entries=1)
+    exp = time.time() + 60
+    cache.set("first", {"exp": exp})
+    cache.set("second", {"exp": exp})
+
+    assert cache.get("first") is None
+    assert cache.get("second") == {"exp": exp}
+
+
+def test_bearer_attaches_payload_to_request_state():
+    """Test that JWTBearer exposes the verified claims on request.state."""
+    token = create_access_token({"sub": "42"})
+    request = _request(token)
+
+    assert asyncio.run(JWTBearer()(request)) == token
+    assert request.state.jwt_payload["sub"] == "42"
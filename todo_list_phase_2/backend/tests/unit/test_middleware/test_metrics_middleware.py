@@ -0,0 +1,71 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session
+from backend.app.database import create_db_engine
+from backend.app.metrics import Histogram, MetricsRegistry
+from backend.app.middleware import MetricsMiddleware
+
+
+def make_client(registry):
+    engine = create_db_engine("sqlite://", poolclass=StaticPool)
+
+    def get_session():
+        with Session(engine) as session:
+            yield session
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, registry=registry)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int, session: Session = Depends(get_session)):
+        # One statement per item, like an N+1 loop
+        for _ in range(item_id):
+            session.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    return TestClient(app)
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test the Prometheus text format of a histogram."""
+    histogram = Histogram("latency_seconds", "Latency.", ["route"], (0.1, 1))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+
+    assert histogram.render() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 1',
+        'latency_seconds_bucket{route="/a",le="1"} 2',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 2',
+        'latency_seconds_sum{route="/a"} 0.55',
+        'latency_seconds_count{route="/a"} 2',
+    ]
+
+
+def test_server_timing_counts_request_statements():
+    """Test that statements run in the threadpool are attributed to the request."""
+    client = make_client(MetricsRegistry())
+
+    server_timing = client.get("/items/3").headers["Server-Timing"]
+
+    assert server_timing.startswith("app;dur=")
+    assert 'desc="3 queries"' in server_timing
+
+
+def test_metrics_are_labelled_by_route_template():
+    """Test that requests are recorded per route, not per concrete path."""
+    registry = MetricsRegistry()
+    client = make_client(registry)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    rendered = registry.render()
+
+    assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 2' in rendered
+    assert 'http_request_duration_seconds_count{method="GET",route="<unmatched>",status="404"} 1' in rendered
+    assert 'http_request_db_statements_sum{method="GET",route="/items/{item_id}"} 3' in rendered
+    assert 'http_requests_in_progress{method="GET"} 0' in rendered
@@ -0,0 +1,21 @@
+import os
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect
+from backend.app.config import settings
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_upgrade_builds_schema_on_empty_database(tmp_path, monkeypatch):
+    """Test that the migrations alone create every table, without create_all()."""
+    database_url = f"sqlite:///{tmp_path / 'empty.db'}"
+    monkeypatch.setattr(settings, "database_url", database_url)
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+
+    command.upgrade(config, "head")
+
+    inspector = inspect(create_engine(database_url))
+    assert {"user", "task", "task_fts", "task_stats", "task_tombstone"} <= set(inspector.get_table_names())
+    assert "ix_task_user_id_created_at_id" in {index["name"] for index in inspector.get_indexes("task")}
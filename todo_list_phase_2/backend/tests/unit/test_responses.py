@@ -0,0 +1,37 @@
+import json
+from datetime import datetime
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from backend.app import responses
+from backend.app.models import Task
+from backend.app.responses import task_response
+from backend.app.schemas import Task as TaskSchema
+
+
+def _task():
+    return Task(id=1, title="Task", description=None, completed=True, user_id=2,
+                created_at=datetime(2024, 1, 1, 8, 30), updated_at=datetime(2024, 1, 2, 9, 45, 0, 123456))
+
+
+def test_task_response_passes_content_through_by_default(monkeypatch):
+    """Test that without the fast path FastAPI gets the rows to validate."""
+    monkeypatch.setattr(responses.settings, "fast_json_responses", False)
+    tasks = [_task()]
+
+    assert task_response(tasks, Response()) is tasks
+
+
+def test_fast_task_response_matches_schema_encoding(monkeypatch):
+    """Test that the fast path produces the same JSON as the response model."""
+    monkeypatch.setattr(responses.settings, "fast_json_responses", True)
+    task = _task()
+    sub_response = Response()
+    sub_response.headers["ETag"] = 'W/"1"'
+
+    response = task_response([task], sub_response, 200)
+
+    assert isinstance(response, ORJSONResponse)
+    assert response.headers["etag"] == 'W/"1"'
+    expected = jsonable_encoder([TaskSchema(**task.dict())])
+    assert json.loads(response.body) == expected
@@ -0,0 +1,47 @@
+from datetime import datetime
+from backend.app.models import Task
+from backend.app.routers.tasks import make_etag, etag_matches
+from backend.app.services import TaskService
+
+
+def test_make_etag_is_weak_and_stable():
+    """Test that the same inputs always give the same weak ETag."""
+    updated_at = datetime(2024, 1, 1, 12, 0, 0, 123456)
+
+    assert make_etag(1, 3, updated_at) == make_etag(1, 3, updated_at)
+    assert make_etag(1, 3, updated_at).startswith('W/"')
+    assert make_etag(1, 3, updated_at) != make_etag(1, 4, updated_at)
+
+
+def test_etag_matches_header_lists_and_wildcard():
+    """Test weak comparison against If-None-Match values."""
+    etag = make_etag(1, 2)
+
+    assert etag_matches(etag, etag)
+    assert etag_matches('"1-2"', etag)
+    assert etag_matches('W/"other", ' + etag, etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('W/"1-3"', etag)
+
+
+def test_tasks_version_changes_on_every_write(db_session):
+    """Test that the list validator changes after create, update and delete."""
+    task_service = TaskService(db_session)
+    versions = [task_service.get_tasks_version(1)]
+
+    task = Task(title="Task", user_id=1, updated_at=datetime(2024, 1, 1))
+    db_session.add(task)
+    db_session.commit()
+    task_id = task.id
+    versions.append(task_service.get_tasks_version(1))
+
+    task_service.update_task_completion_status(task_id, 1, True)
+    versions.append(task_service.get_tasks_version(1))
+
+    task_service.delete_task(task_id, 1)
+    versions.append(task_service.get_tasks_version(1))
+
+    assert versions[0] == (0, None)
+    assert len(set(versions[:3])) == 3
+    assert versions[3][0] == 0
@@ -0,0 +1,37 @@
+import asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.services import AsyncTaskService
+from backend.app.schemas import TaskCreate
+
+
+async def _create_and_list(session):
+    task_service = AsyncTaskService(session)
+    await task_service.create_task(TaskCreate(title="Async Task", user_id=1))
+    await task_service.create_task(TaskCreate(title="Other Task", user_id=2))
+    return await task_service.get_tasks_by_user(1)
+
+
+def test_async_task_service_with_sync_session(db_session):
+    """Test that AsyncTaskService runs TaskService on a plain Session."""
+    tasks = asyncio.run(_create_and_list(db_session))
+
+    assert [task.title for task in tasks] == ["Async Task"]
+
+
+def test_async_task_service_with_async_session():
+    """Test that AsyncTaskService runs TaskService on an AsyncSession."""
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            tasks = await _create_and_list(session)
+        await engine.dispose()
+        return tasks
+
+    tasks = asyncio.run(run())
+
+    assert [task.title for task in tasks] == ["Async Task"]
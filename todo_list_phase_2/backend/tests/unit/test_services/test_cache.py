@@ -0,0 +1,86 @@
+import pytest
+from unittest.mock import patch
+from backend.app.services import TaskService, LRUTaskListCache, build_task_list_cache
+from backend.app.schemas import TaskCreate, TaskUpdate
+
+
+def test_cache_hit_and_miss_counters():
+    """Test that get counts misses and hits."""
+    cache = LRUTaskListCache()
+    version = cache.version(1)
+
+    assert cache.get(1, version, "key") is None
+    cache.set(1, version, "key", ["task"])
+    assert cache.get(1, version, "key") == ["task"]
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1}
+
+
+def test_cache_entries_expire_after_ttl():
+    """Test that entries are not served after their TTL."""
+    cache = LRUTaskListCache(ttl_seconds=10)
+    with patch("backend.app.services.cache.time.monotonic", return_value=100.0):
+        cache.set(1, 0, "key", "value")
+    with patch("backend.app.services.cache.time.monotonic", return_value=111.0):
+        assert cache.get(1, 0, "key") is None
+
+
+def test_cache_evicts_least_recently_used():
+    """Test that the oldest unused entry is evicted when the cache is full."""
+    cache = LRUTaskListCache(max_entries=2)
+    cache.set(1, 0, "a", "a")
+    cache.set(1, 0, "b", "b")
+    cache.get(1, 0, "a")
+    cache.set(1, 0, "c", "c")
+
+    assert cache.get(1, 0, "b") is None
+    assert cache.get(1, 0, "a") == "a"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_hides_results_computed_before_the_write():
+    """Test that a result loaded before an invalidation is never stored."""
+    cache = LRUTaskListCache()
+    version = cache.version(1)
+    cache.invalidate(1)
+    cache.set(1, version, "key", "stale")
+
+    assert cache.get(1, cache.version(1), "key") is None
+
+
+def test_versions_are_bounded_and_never_reused():
+    """Test that evicting a user's version does not bring back results from before a write."""
+    cache = LRUTaskListCache(max_entries=2)
+    version = cache.version(1)
+    cache.set(1, version, "key", "stale")
+    cache.invalidate(1)
+    cache.invalidate(2)
+    cache.invalidate(3)
+
+    assert len(cache._versions) == 2
+    assert cache.version(1) != version
+    cache.set(1, version, "key", "stale")
+    assert cache.get(1, cache.version(1), "key") is None
+
+
+def test_build_unknown_backend_raises():
+    """Test that an unknown backend name is rejected."""
+    assert build_task_list_cache("none", 10, 1) is None
+    with pytest.raises(ValueError):
+        build_task_list_cache("redis", 10, 1)
+
+
+def test_task_service_invalidates_list_on_write(db_session):
+    """Test that the cached list is refreshed after each kind of write."""
+    task_service = TaskService(db_session, LRUTaskListCache())
+    task = task_service.create_task(TaskCreate(title="First", user_id=1))
+    task_id = task.id
+
+    assert [t.title for t in task_service.get_tasks_by_user(1)] == ["First"]
+    assert [t.title for t in task_service.get_tasks_by_user(1)] == ["First"]
+    assert task_service.cache.stats()["hits"] == 1
+
+    task_service.update_task(task_id, 1, TaskUpdate(title="Renamed"))
+    assert [t.title for t in task_service.get_tasks_page(1, 10)[0]] == ["Renamed"]
+
+    task_service.delete_task(task_id, 1)
+    assert task_service.get_tasks_by_user(1) == []
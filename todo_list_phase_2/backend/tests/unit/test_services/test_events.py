@@ -0,0 +1,137 @@
+import asyncio
+import json
+import threading
+from backend.app.schemas import TaskCreate, TaskUpdate
+from backend.app.services import TaskService, TaskEventBroker, LocalEventBackend
+from backend.app.services.events import OVERFLOW_MESSAGE, format_event, stream_events
+
+
+def parse(message):
+    event_line, data_line = message.strip().split("\n")
+    return event_line[len("event: "):], json.loads(data_line[len("data: "):])
+
+
+async def drain(subscription):
+    messages = []
+    while not subscription.queue.empty():
+        messages.append(parse(subscription.queue.get_nowait()))
+    return messages
+
+
+def test_broker_delivers_to_the_users_subscribers():
+    """Test that events reach every subscriber of the user and nobody else."""
+    async def run():
+        broker = TaskEventBroker(LocalEventBackend())
+        await broker.start()
+        with broker.subscribe(1) as first, broker.subscribe(1) as second, broker.subscribe(2) as other:
+            # Publishing from another thread, as TaskService does
+            thread = threading.Thread(target=broker.publish, args=(1, "task.deleted", {"id": 7}))
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0.01)
+            assert await drain(first) == [("task.deleted", {"id": 7})]
+            assert await drain(second) == [("task.deleted", {"id": 7})]
+            assert await drain(other) == []
+        assert broker.stats()["subscribers"] == 0
+        await broker.stop()
+
+    asyncio.run(run())
+
+
+def test_slow_subscriber_overflows_without_growing():
+    """Test that a full queue is replaced by a single overflow message."""
+    async def run():
+        broker = TaskEventBroker(LocalEventBackend(), queue_size=3)
+        await broker.start()
+        with broker.subscribe(1) as subscription:
+            for i in range(10):
+                broker.publish(1, "task.deleted", {"id": i})
+            await asyncio.sleep(0.01)
+
+            assert subscription.queue.qsize() == 1
+            assert subscription.queue.get_nowait() is OVERFLOW_MESSAGE
+            assert broker.stats()["overflows"] == 1
+        await broker.stop()
+
+    asyncio.run(run())
+
+
+def test_stream_events_sends_heartbeats_and_stops_after_overflow():
+    """Test the SSE body: retry hint, keep-alive comments, then events."""
+    async def run():
+        broker = TaskEventBroker(LocalEventBackend(), queue_size=1)
+        await broker.start()
+
+        async def connected():
+            return False
+
+        with broker.subscribe(1) as subscription:
+            stream = stream_events(subscription, connected, heartbeat_seconds=0.01)
+            assert await stream.__anext__() == "retry: 3000\n\n"
+            assert await stream.__anext__() == ": keep-alive\n\n"
+            broker.publish(1, "task.deleted", {"id": 1})
+            broker.publish(1, "task.deleted", {"id": 2})
+            await asyncio.sleep(0.01)
+            assert await stream.__anext__() is OVERFLOW_MESSAGE
+            assert [chunk async for chunk in stream] == []
+        await broker.stop()
+
+    asyncio.run(run())
+
+
+def test_task_service_publishes_committed_changes(db_session):
+    """Test that TaskService writes are published to the user's subscribers."""
+    async def run():
+        broker = TaskEventBroker(LocalEventBackend())
+        await broker.start()
+        task_service = TaskService(db_session, events=broker)
+        with broker.subscribe(1) as subscription:
+            task_id = task_service.create_task(TaskCreate(title="New", user_id=1)).id
+            task_service.update_task_completion_status(task_id, 1, True)
+            task_service.insert_tasks_batch([TaskCreate(title="Imported", user_id=1)])
+            task_service.delete_task(task_id, 1)
+            await asyncio.sleep(0.01)
+            events = await drain(subscription)
+        await broker.stop()
+        return task_id, events
+
+    task_id, events = asyncio.run(run())
+
+    assert [event_type for event_type, _ in events] == [
+        "task.created", "task.completed", "tasks.imported", "task.deleted"
+    ]
+    assert events[0][1]["task"]["title"] == "New"
+    assert events[1][1]["task"]["completed"] is True
+    assert events[2][1] == {"count": 1}
+    assert events[3][1] == {"id": task_id}
+
+
+def test_unchanged_writes_are_not_published(db_session):
+    """Test that writes that leave the task as it was publish nothing."""
+    async def run():
+        broker = TaskEventBroker(LocalEventBackend())
+        await broker.start()
+        task_service = TaskService(db_session, events=broker)
+        task_id = task_service.create_task(TaskCreate(title="Same", user_id=1, completed=True)).id
+        await asyncio.sleep(0.01)
+        with broker.subscribe(1) as subscription:
+            assert task_service.update_task_completion_status(task_id, 1, True).completed is True
+            assert task_service.update_task(task_id, 1, TaskUpdate(title="Same", completed=True)).title == "Same"
+            task_service.update_task(task_id, 1, TaskUpdate(title="Renamed"))
+            await asyncio.sleep(0.01)
+            events = await drain(subscription)
+        await broker.stop()
+        return events
+
+    events = asyncio.run(run())
+
+    assert [(event_type, data["task"]["title"]) for event_type, data in events] == [("task.updated", "Renamed")]
+
+
+def test_publish_before_start_is_dropped():
+    """Test that publishing without a running broker is a no-op."""
+    broker = TaskEventBroker(LocalEventBackend())
+    broker.publish(1, "task.deleted", {"id": 1})
+
+    assert broker.stats()["published"] == 0
+    assert format_event("x", {"a": 1}) == 'event: x\ndata: {"a": 1}\n\n'
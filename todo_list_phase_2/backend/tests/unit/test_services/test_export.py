@@ -0,0 +1,59 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime
+from backend.app.models import Task
+from backend.app.services import TaskService, AsyncTaskService
+from backend.app.services.export import EXPORT_COLUMNS, encode_export
+
+
+def _add_tasks(session, count, user_id=1):
+    for i in range(count):
+        session.add(Task(title=f"Task {i}", description=f'Say "hi", {i}', user_id=user_id,
+                         created_at=datetime(2024, 1, 1, 0, 0, i)))
+    session.commit()
+
+
+def _export(session, export_format, batch_size=2):
+    async def run():
+        batches = AsyncTaskService(session).iter_task_rows(1, batch_size)
+        return [chunk async for chunk in encode_export(batches, export_format)]
+    return asyncio.run(run())
+
+
+def test_iter_task_rows_yields_bounded_batches(db_session):
+    """Test that rows are streamed in batches of at most batch_size."""
+    _add_tasks(db_session, 5)
+    _add_tasks(db_session, 2, user_id=2)
+
+    batches = list(TaskService(db_session).iter_task_rows(1, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [row["title"] for batch in batches for row in batch] == [f"Task {i}" for i in range(5)]
+
+
+def test_export_ndjson(db_session):
+    """Test that the NDJSON export has one JSON object per task."""
+    _add_tasks(db_session, 3)
+
+    lines = b"".join(_export(db_session, "ndjson")).decode().splitlines()
+
+    rows = [json.loads(line) for line in lines]
+    assert [row["title"] for row in rows] == ["Task 0", "Task 1", "Task 2"]
+    assert list(rows[0]) == EXPORT_COLUMNS
+    assert rows[0]["created_at"] == "2024-01-01T00:00:00"
+
+
+def test_export_csv(db_session):
+    """Test that the CSV export has a header and quotes values as needed."""
+    _add_tasks(db_session, 3)
+
+    chunks = _export(db_session, "csv")
+
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+    assert rows[0] == EXPORT_COLUMNS
+    assert [row[1] for row in rows[1:]] == ["Task 0", "Task 1", "Task 2"]
+    assert rows[1][2] == 'Say "hi", 0'
+    # Header chunk plus one chunk per batch
+    assert len(chunks) == 3
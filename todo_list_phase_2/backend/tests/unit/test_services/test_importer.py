@@ -0,0 +1,69 @@
+import asyncio
+from backend.app.services import TaskService
+from backend.app.services.importer import import_tasks, iter_lines
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def _import(data: bytes, import_format: str, insert_batch, batch_size=2, chunk_size=3):
+    return asyncio.run(import_tasks(_chunks(data, chunk_size), import_format, 1, insert_batch, batch_size))
+
+
+def test_iter_lines_handles_split_multibyte_characters():
+    """Test that lines and UTF-8 characters split across chunks are rejoined."""
+    data = "﻿café\r\nthé\nlast".encode()
+
+    async def collect():
+        return [line async for line in iter_lines(_chunks(data, 1))]
+
+    assert asyncio.run(collect()) == ["café", "thé", "last"]
+
+
+def test_import_ndjson_counts_and_batches():
+    """Test that valid rows are inserted in batches and invalid ones reported."""
+    batches = []
+
+    async def insert_batch(tasks):
+        batches.append([task.title for task in tasks])
+        return len(tasks)
+
+    data = b'{"title": "a"}\n{"title": "b"}\n{oops}\n{"title": "c", "user_id": 7}\n'
+    result = _import(data, "ndjson", insert_batch)
+
+    assert (result.accepted, result.rejected) == (3, 1)
+    assert result.errors[0].line == 3
+    assert batches == [["a", "b"], ["c"]]
+
+
+def test_import_csv_with_multiline_field(db_session):
+    """Test CSV import end to end, including quoted newlines."""
+    task_service = TaskService(db_session)
+
+    async def insert_batch(tasks):
+        assert all(task.user_id == 1 for task in tasks)
+        return task_service.insert_tasks_batch(tasks)
+
+    data = b'title,description,completed\n"Write ""docs""","line one\nline two",true\nShip,,\nbad row\n'
+    result = _import(data, "csv", insert_batch)
+
+    assert (result.accepted, result.rejected) == (2, 1)
+    tasks = sorted(task_service.get_tasks_by_user(1), key=lambda t: t.id)
+    assert [(t.title, t.description, t.completed) for t in tasks] == [
+        ('Write "docs"', "line one\nline two", True),
+        ("Ship", None, False),
+    ]
+
+
+def test_import_ndjson_empty_title_is_a_validation_error():
+    """Test that empty NDJSON values are validated as given, not treated as missing."""
+    async def insert_batch(tasks):
+        return len(tasks)
+
+    result = _import(b'{"title": ""}\n{"description": "no title"}\n', "ndjson", insert_batch)
+
+    assert (result.accepted, result.rejected) == (0, 2)
+    assert result.errors[0].error == "title must not be empty"
+    assert "field required" in result.errors[1].error
@@ -0,0 +1,64 @@
+import pytest
+from datetime import datetime, timedelta
+from backend.app.models import Task
+from backend.app.services import TaskService
+from backend.app.services.pagination import encode_cursor, decode_cursor
+
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes to the position it was encoded from."""
+    created_at = datetime(2024, 1, 2, 3, 4, 5, 678901)
+    cursor = encode_cursor(created_at, 42)
+
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(datetime.utcnow(), 1)[:-3]])
+def test_decode_invalid_cursor_raises(cursor):
+    """Test that malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_get_tasks_page_walks_all_tasks(db_session):
+    """Test that following next cursors yields every task exactly once, in order."""
+    base = datetime(2024, 1, 1)
+    for i in range(7):
+        # Pairs of tasks share a timestamp so the id tie-breaker is exercised
+        db_session.add(Task(title=f"Task {i}", user_id=1, created_at=base + timedelta(seconds=i // 2)))
+    db_session.add(Task(title="Other user", user_id=2, created_at=base))
+    db_session.commit()
+
+    task_service = TaskService(db_session)
+    seen, cursor = [], None
+    while True:
+        tasks, cursor = task_service.get_tasks_page(1, 3, cursor)
+        seen.extend(task.title for task in tasks)
+        if cursor is None:
+            break
+
+    assert seen == [f"Task {i}" for i in range(7)]
+
+
+def test_get_tasks_page_last_page_has_no_cursor(db_session):
+    """Test that an exactly full last page does not return a next cursor."""
+    for i in range(3):
+        db_session.add(Task(title=f"Task {i}", user_id=1))
+    db_session.commit()
+
+    tasks, cursor = TaskService(db_session).get_tasks_page(1, 3)
+
+    assert len(tasks) == 3
+    assert cursor is None
+
+
+def test_get_tasks_page_without_limit_returns_every_task(db_session):
+    """Test that a limit of None returns all matching tasks and no cursor."""
+    for i in range(5):
+        db_session.add(Task(title=f"Task {i}", user_id=1))
+    db_session.commit()
+
+    tasks, cursor = TaskService(db_session).get_tasks_page(1, None)
+
+    assert [task.title for task in tasks] == [f"Task {i}" for i in range(5)]
+    assert cursor is None
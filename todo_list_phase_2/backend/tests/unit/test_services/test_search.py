@@ -0,0 +1,131 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import text
+from sqlmodel import Session
+from backend.app.database import create_db_engine
+from backend.app.models import Task
+from backend.app.models.task import create_task_search
+from backend.app.schemas import TaskFilters
+from backend.app.services import TaskService
+from backend.app.services.pagination import encode_cursor, decode_cursor
+from backend.app.services.search import fts5_query
+
+
+def seed(db_session):
+    base = datetime(2024, 1, 1)
+    titles = ["Buy milk", "Write report", "buy bread", "Call mom", "Fix bike"]
+    for i, title in enumerate(titles):
+        db_session.add(Task(
+            title=title,
+            description="weekly groceries" if "uy" in title else None,
+            completed=i % 2 == 1,
+            user_id=1,
+            created_at=base + timedelta(days=i),
+            updated_at=base + timedelta(days=10 - i)
+        ))
+    db_session.add(Task(title="Buy milk", user_id=2, created_at=base))
+    db_session.commit()
+
+
+def titles_of(db_session, filters=None, sort="created_at", limit=100):
+    tasks, _ = TaskService(db_session).get_tasks_page(1, limit, None, filters, sort)
+    return [task.title for task in tasks]
+
+
+def test_fts5_query_quotes_terms():
+    """Test that search terms are quoted so FTS5 syntax in input is literal."""
+    assert fts5_query('buy "milk" OR') == '"buy" """milk""" "OR"'
+
+
+def test_cursor_is_tied_to_sort():
+    """Test that a cursor issued for one sort is rejected for another."""
+    cursor = encode_cursor("Buy milk", 3, "-title")
+
+    assert decode_cursor(cursor, "-title") == ("Buy milk", 3)
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_filter_by_completed_and_created_range(db_session):
+    """Test completion and created_at range filters."""
+    seed(db_session)
+
+    assert titles_of(db_session, TaskFilters(completed=True)) == ["Write report", "Call mom"]
+    assert titles_of(db_session, TaskFilters(
+        created_after=datetime(2024, 1, 2), created_before=datetime(2024, 1, 4)
+    )) == ["Write report", "buy bread"]
+
+
+def test_search_matches_title_and_description(db_session):
+    """Test that q searches title and description of the user's tasks only."""
+    seed(db_session)
+
+    assert titles_of(db_session, TaskFilters(q="buy")) == ["Buy milk", "buy bread"]
+    assert titles_of(db_session, TaskFilters(q="groceries bread")) == ["buy bread"]
+    assert titles_of(db_session, TaskFilters(q='"')) == []
+
+
+def test_search_follows_updates_and_deletes(db_session):
+    """Test that the search index is kept in sync with the task table."""
+    seed(db_session)
+    task = db_session.get(Task, 4)
+    task.title = "Call plumber"
+    db_session.add(task)
+    db_session.delete(db_session.get(Task, 1))
+    db_session.commit()
+
+    assert titles_of(db_session, TaskFilters(q="plumber")) == ["Call plumber"]
+    assert titles_of(db_session, TaskFilters(q="mom")) == []
+    assert titles_of(db_session, TaskFilters(q="milk")) == []
+
+
+@pytest.mark.parametrize("sort", ["title", "-title", "-created_at", "updated_at"])
+def test_sorted_pages_walk_all_tasks(db_session, sort):
+    """Test that paging with each sort yields the same order as one big page."""
+    seed(db_session)
+    task_service = TaskService(db_session)
+    expected = titles_of(db_session, sort=sort)
+
+    seen, cursor = [], None
+    while True:
+        tasks, cursor = task_service.get_tasks_page(1, 2, cursor, None, sort)
+        seen.extend(task.title for task in tasks)
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert len(seen) == 5
+
+
+def test_unknown_sort_raises(db_session):
+    """Test that sorting by an unsupported column is rejected."""
+    with pytest.raises(ValueError):
+        TaskService(db_session).get_tasks_page(1, 10, sort="description")
+
+
+
+def test_search_on_database_created_before_search(tmp_path):
+    """Test that startup adds the FTS5 table and indexes tasks of an older database."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as connection:
+        # The task table as create_all() made it before search existed
+        connection.execute(text(
+            "CREATE TABLE task (title VARCHAR(255) NOT NULL, description VARCHAR, completed BOOLEAN NOT NULL, "
+            "user_id INTEGER NOT NULL, id INTEGER NOT NULL PRIMARY KEY, created_at DATETIME NOT NULL, "
+            "updated_at DATETIME NOT NULL)"
+        ))
+        connection.execute(text(
+            "INSERT INTO task (title, completed, user_id, created_at, updated_at) "
+            "VALUES ('Buy milk', 0, 1, '2024-01-01 00:00:00', '2024-01-01 00:00:00'), "
+            "('Call mom', 0, 1, '2024-01-02 00:00:00', '2024-01-02 00:00:00')"
+        ))
+
+    for _ in range(2):
+        with engine.begin() as connection:
+            create_task_search(connection)
+
+    with Session(engine) as session:
+        session.add(Task(title="Buy bread", user_id=1, created_at=datetime(2024, 1, 3)))
+        session.commit()
+        assert titles_of(session, TaskFilters(q="buy")) == ["Buy milk", "Buy bread"]
+    engine.dispose()
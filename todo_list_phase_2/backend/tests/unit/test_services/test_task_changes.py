@@ -0,0 +1,59 @@
+import pytest
+from datetime import datetime, timedelta
+from backend.app.models import Task, TaskTombstone
+from backend.app.schemas import TaskCreate
+from backend.app.services import TaskService
+from backend.app.services.pagination import encode_sync_token, decode_sync_token
+
+
+def test_sync_token_round_trip():
+    """Test that a sync token decodes to the time it was encoded from."""
+    synced_at = datetime(2024, 1, 2, 3, 4, 5, 678901)
+
+    assert decode_sync_token(encode_sync_token(synced_at)) == synced_at
+    with pytest.raises(ValueError):
+        decode_sync_token("not-a-token")
+
+
+def test_changes_without_since_returns_everything(db_session):
+    """Test that an initial sync returns all of the user's tasks."""
+    task_service = TaskService(db_session)
+    task_service.create_tasks([TaskCreate(title=f"Task {i}", user_id=1) for i in range(3)])
+    task_service.create_task(TaskCreate(title="Other user", user_id=2))
+
+    tasks, deleted, synced_at = task_service.get_changes(1, lag=timedelta(seconds=5))
+
+    assert [task.title for task in tasks] == ["Task 0", "Task 1", "Task 2"]
+    assert deleted == []
+    assert synced_at < datetime.utcnow() - timedelta(seconds=4)
+
+
+def test_changes_since_returns_updates_and_deletions(db_session):
+    """Test that only tasks written since the token and deleted IDs come back."""
+    old = datetime.utcnow() - timedelta(hours=1)
+    db_session.add(Task(title="Unchanged", user_id=1, created_at=old, updated_at=old))
+    db_session.add(Task(title="Old, completed later", user_id=1, created_at=old, updated_at=old))
+    db_session.add(Task(title="Deleted", user_id=1, created_at=old, updated_at=old))
+    db_session.commit()
+    task_service = TaskService(db_session)
+    since = datetime.utcnow()
+
+    task_service.update_task_completion_status(2, 1, True)
+    task_service.create_task(TaskCreate(title="New", user_id=1))
+    task_service.delete_tasks(1, [3])
+
+    tasks, deleted, _ = task_service.get_changes(1, since)
+
+    assert [task.title for task in tasks] == ["Old, completed later", "New"]
+    assert deleted == [3]
+    assert task_service.get_changes(2, since)[1] == []
+
+
+def test_prune_tombstones(db_session):
+    """Test that deletion records older than the cutoff are removed."""
+    db_session.add(TaskTombstone(task_id=1, user_id=1, deleted_at=datetime(2024, 1, 1)))
+    db_session.add(TaskTombstone(task_id=2, user_id=1, deleted_at=datetime(2024, 3, 1)))
+    db_session.commit()
+
+    assert TaskService(db_session).prune_tombstones(datetime(2024, 2, 1)) == 1
+    assert TaskService(db_session).get_changes(1, datetime(2023, 1, 1))[1] == [2]
@@ -0,0 +1,75 @@
+from backend.app.models import Task, TaskStats
+from backend.app.schemas import TaskCreate, TaskUpdate, TaskBulkUpdate
+from backend.app.services import TaskService
+
+
+def counts(task_service, user_id=1):
+    stats = task_service.get_task_stats(user_id)
+    return stats.total, stats.completed, stats.pending
+
+
+def test_counters_follow_single_task_writes(db_session):
+    """Test that create, completion changes and delete keep the counters exact."""
+    task_service = TaskService(db_session)
+    first = task_service.create_task(TaskCreate(title="First", user_id=1)).id
+    second = task_service.create_task(TaskCreate(title="Second", user_id=1, completed=True)).id
+    assert counts(task_service) == (2, 1, 1)
+
+    task_service.update_task_completion_status(first, 1, True)
+    # Setting the status it already has is not counted twice
+    task_service.update_task(first, 1, TaskUpdate(completed=True, title="Renamed"))
+    assert counts(task_service) == (2, 2, 0)
+
+    task_service.update_task_completion_status(second, 1, False)
+    assert task_service.delete_task(first, 1)
+    assert not task_service.delete_task(first, 1)
+    assert counts(task_service) == (1, 0, 1)
+
+
+def test_counters_follow_batch_writes(db_session):
+    """Test the bulk create, insert, update and delete paths."""
+    task_service = TaskService(db_session)
+    created = task_service.create_tasks([TaskCreate(title=f"Task {i}", user_id=1) for i in range(3)])
+    task_service.insert_tasks_batch([
+        TaskCreate(title="Imported", user_id=1, completed=True),
+        TaskCreate(title="Other user", user_id=2)
+    ])
+    assert counts(task_service) == (4, 1, 3)
+    assert counts(task_service, 2) == (1, 0, 1)
+
+    task_service.update_tasks(1, [
+        TaskBulkUpdate(id=created[0].id, completed=True),
+        TaskBulkUpdate(id=created[1].id, completed=True, title="Done"),
+        TaskBulkUpdate(id=created[2].id, title="Still pending")
+    ])
+    assert counts(task_service) == (4, 3, 1)
+
+    task_service.delete_tasks(1, [created[0].id, created[2].id])
+    assert counts(task_service) == (2, 2, 0)
+
+
+def test_stats_without_counter_row_are_counted(db_session):
+    """Test that tasks written before the counters existed are still counted."""
+    db_session.add(Task(title="Legacy", user_id=1, completed=True))
+    db_session.commit()
+    task_service = TaskService(db_session)
+    assert counts(task_service) == (1, 1, 0)
+
+    # The first write seeds the row from the task table
+    task_service.create_task(TaskCreate(title="New", user_id=1))
+    assert db_session.get(TaskStats, 1).total == 2
+    assert counts(task_service) == (2, 1, 1)
+
+
+def test_reconcile_rebuilds_counters(db_session):
+    """Test that reconciliation repairs drifted counters."""
+    task_service = TaskService(db_session)
+    task_service.create_tasks([TaskCreate(title="Task", user_id=user_id) for user_id in (1, 1, 2)])
+    db_session.add(Task(title="Written directly", user_id=1, completed=True))
+    db_session.commit()
+    assert counts(task_service) == (2, 0, 2)
+
+    assert task_service.reconcile_task_stats(1) == 1
+    assert counts(task_service) == (3, 1, 2)
+    assert task_service.reconcile_task_stats() == 2
+    assert counts(task_service, 2) == (1, 0, 1)
@@ -0,0 +1,131 @@
+from unittest.mock import Mock
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from backend.app.models import Task
+from backend.app.services import TaskService
+from backend.app.schemas import TaskCreate, TaskUpdate, TaskBulkUpdate
+
+
+def _add_task(session, user_id=1, title="Test Task"):
+    task = Task(title=title, user_id=user_id)
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+    return task
+
+
+def test_update_task_applies_only_set_fields(db_session):
+    """Test that update_task changes only the fields that were provided."""
+    task = _add_task(db_session)
+    task_service = TaskService(db_session)
+
+    updated = task_service.update_task(task.id, 1, TaskUpdate(description="New description"))
+
+    assert updated.title == "Test Task"
+    assert updated.description == "New description"
+    assert updated.updated_at >= task.updated_at
+
+
+def test_update_task_of_other_user_returns_none(db_session):
+    """Test that a user cannot update another user's task."""
+    task = _add_task(db_session, user_id=2)
+    task_service = TaskService(db_session)
+
+    assert task_service.update_task(task.id, 1, TaskUpdate(title="Hijacked")) is None
+    assert task_service.update_task_completion_status(task.id, 1, True) is None
+    assert task_service.get_task_by_id(task.id, 2).title == "Test Task"
+
+
+def test_update_task_completion_status(db_session):
+    """Test marking a task as completed."""
+    task = _add_task(db_session)
+
+    updated = TaskService(db_session).update_task_completion_status(task.id, 1, True)
+
+    assert updated.completed is True
+
+
+def test_completion_change_skips_the_main_update(db_session):
+    """Test that a status-only change updates the task row once."""
+    task_id = TaskService(db_session).create_task(TaskCreate(title="Test Task", user_id=1)).id
+    statements = []
+    engine = db_session.get_bind()
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        updated = TaskService(db_session).update_task_completion_status(task_id, 1, True)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert updated.completed is True
+    # The status UPDATE, the counter UPDATE and the reload of the task
+    assert len(statements) == 3
+    assert sum(1 for sql in statements if sql.startswith("UPDATE task ")) == 1
+
+
+def test_delete_task_only_deletes_owned_task(db_session):
+    """Test that delete_task reports whether the user's task was removed."""
+    task_id = _add_task(db_session, user_id=2).id
+    task_service = TaskService(db_session)
+
+    assert task_service.delete_task(task_id, 1) is False
+    assert task_service.delete_task(task_id, 2) is True
+    assert task_service.get_task_by_id(task_id, 2) is None
+
+
+def test_update_task_uses_returning_when_supported():
+    """Test that dialects with UPDATE ... RETURNING get a single statement."""
+    session = Mock()
+    session.get_bind.return_value.dialect = postgresql.dialect()
+    session.execute.return_value.first.return_value = None
+    session.exec.return_value.first.return_value = None
+
+    # A title-only update; completion changes also adjust the task counters
+    assert TaskService(session).update_task(1, 1, TaskUpdate(title="Renamed")) is None
+
+    statement = session.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE task SET")
+    assert "RETURNING task.title" in sql
+    assert "IS DISTINCT FROM" in sql
+    session.execute.assert_called_once()
+
+
+def test_create_tasks_returns_loaded_tasks(db_session):
+    """Test that bulk created tasks come back with IDs and defaults."""
+    tasks = TaskService(db_session).create_tasks(
+        [TaskCreate(title=f"Task {i}", user_id=1) for i in range(3)]
+    )
+
+    assert [task.title for task in tasks] == ["Task 0", "Task 1", "Task 2"]
+    assert all(task.id is not None and task.completed is False for task in tasks)
+
+
+def test_update_tasks_reports_only_owned_tasks(db_session):
+    """Test that bulk updates apply to the user's tasks and skip others."""
+    own = _add_task(db_session, user_id=1)
+    other = _add_task(db_session, user_id=2)
+    own_id, other_id = own.id, other.id
+
+    updated = TaskService(db_session).update_tasks(1, [
+        TaskBulkUpdate(id=own_id, completed=True),
+        TaskBulkUpdate(id=other_id, completed=True),
+    ])
+
+    assert list(updated) == [own_id]
+    assert updated[own_id].completed is True
+    assert TaskService(db_session).get_task_by_id(other_id, 2).completed is False
+
+
+def test_delete_tasks_returns_deleted_ids(db_session):
+    """Test that bulk deletes remove only the user's tasks."""
+    own_id = _add_task(db_session, user_id=1).id
+    other_id = _add_task(db_session, user_id=2).id
+
+    deleted = TaskService(db_session).delete_tasks(1, [own_id, other_id, 999])
+
+    assert deleted == {own_id}
+    assert TaskService(db_session).get_task_by_id(other_id, 2) is not None
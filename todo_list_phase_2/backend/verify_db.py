@@ -1,45 +1,203 @@
 """
-Script to verify data in the Neon PostgreSQL database
+Script to verify data in the database and report on it
+
+Every check is a single set-based query, so the report takes seconds even
+with millions of rows:
+- totals and a per-user task count distribution from one GROUP BY;
+- tasks whose user does not exist (broken foreign keys);
+- per-user counters in task_stats that disagree with the task table;
+- tasks updated before they were created.
+
+Exits with status 1 if any consistency check fails.
+
+Usage (from the backend directory):
+    python verify_db.py
+    python verify_db.py --per-user --sample 20
 """
 
+import argparse
+import heapq
+import random
+import sys
+
+from sqlalchemy import case, func, or_, select
+
 from app.database import Session, engine
-from app.models import User, Task
-from sqlmodel import SQLModel
+from app.models import User, Task, TaskStats
+
+
+STREAM_BATCH_SIZE = 10_000
+# Upper bounds of the tasks-per-user histogram buckets
+COUNT_BUCKETS = (0, 1, 10, 100, 1_000, 10_000)
+
+
+def completed_sum(column):
+    return func.coalesce(func.sum(case((column, 1), else_=0)), 0)
+
+
+def bucket_labels():
+    labels, lower = [], 0
+    for bound in COUNT_BUCKETS:
+        labels.append(f"{bound:,}" if bound == lower else f"{lower:,}-{bound:,}")
+        lower = bound + 1
+    labels.append(f">{COUNT_BUCKETS[-1]:,}")
+    return labels
+
+
+def per_user_counts():
+    """One row per user with their task and completed counts."""
+    return (
+        select(User.id, User.email, func.count(Task.id), completed_sum(Task.completed))
+        .select_from(User)
+        .outerjoin(Task, Task.user_id == User.id)
+        .group_by(User.id, User.email)
+        .order_by(User.id)
+    )
 
 
-def verify_database_content():
-    """Verify that data exists in the database."""
+def report_users(session, per_user: bool, top: int) -> None:
+    """Stream the per-user aggregate and print totals, a histogram and the top users."""
+    users = tasks = completed = 0
+    histogram = [0] * (len(COUNT_BUCKETS) + 1)
+    largest = []
+    rows = session.execute(
+        per_user_counts().execution_options(stream_results=True, max_row_buffer=STREAM_BATCH_SIZE)
+    )
+    for user_id, email, task_count, completed_count in rows:
+        users += 1
+        tasks += task_count
+        completed += completed_count
+        histogram[next((i for i, bound in enumerate(COUNT_BUCKETS) if task_count <= bound), len(COUNT_BUCKETS))] += 1
+        if len(largest) < top:
+            heapq.heappush(largest, (task_count, user_id, email))
+        else:
+            heapq.heappushpop(largest, (task_count, user_id, email))
+        if per_user:
+            print(f"   - User {user_id} ({email}): {task_count} tasks, {completed_count} completed")
+
+    print(f"[INFO] Total users in database: {users:,}")
+    print(f"[INFO] Tasks owned by existing users: {tasks:,} ({completed:,} completed, {tasks - completed:,} pending)")
+    print("[INFO] Users by number of tasks:")
+    for label, count in zip(bucket_labels(), histogram):
+        print(f"   {label:>13}: {count:,}")
+    if largest:
+        print("[INFO] Users with the most tasks:")
+        for task_count, user_id, email in sorted(largest, reverse=True):
+            print(f"   - User {user_id} ({email}): {task_count:,} tasks")
+
+
+def check_orphan_tasks(session, limit: int = 10) -> bool:
+    """Report tasks whose user_id does not reference an existing user."""
+    orphans = session.execute(
+        select(Task.user_id, func.count(Task.id))
+        .select_from(Task)
+        .outerjoin(User, User.id == Task.user_id)
+        .where(User.id.is_(None))
+        .group_by(Task.user_id)
+        .order_by(func.count(Task.id).desc())
+    ).all()
+    if not orphans:
+        print("[OK] Every task belongs to an existing user")
+        return True
+    total = sum(count for _, count in orphans)
+    print(f"[FAIL] {total:,} tasks reference {len(orphans):,} missing users:")
+    for user_id, count in orphans[:limit]:
+        print(f"   - user_id {user_id}: {count:,} tasks")
+    return False
+
+
+def check_task_counters(session, limit: int = 10) -> bool:
+    """Report task_stats rows that disagree with the task table."""
+    actual = (
+        select(Task.user_id, func.count(Task.id).label("total"), completed_sum(Task.completed).label("completed"))
+        .group_by(Task.user_id)
+        .subquery()
+    )
+    actual_total = func.coalesce(actual.c.total, 0)
+    actual_completed = func.coalesce(actual.c.completed, 0)
+    mismatches = session.execute(
+        select(TaskStats.user_id, TaskStats.total, TaskStats.completed, actual_total, actual_completed)
+        .select_from(TaskStats)
+        .outerjoin(actual, actual.c.user_id == TaskStats.user_id)
+        .where(or_(TaskStats.total != actual_total, TaskStats.completed != actual_completed))
+        .order_by(TaskStats.user_id)
+        .limit(limit + 1)
+    ).all()
+    if not mismatches:
+        print("[OK] Task counters match the task table")
+        return True
+    more = f" (showing the first {limit})" if len(mismatches) > limit else ""
+    print(f"[FAIL] Task counters disagree with the task table{more}; run reconcile_task_stats.py:")
+    for user_id, total, completed, real_total, real_completed in mismatches[:limit]:
+        print(f"   - User {user_id}: counters {total}/{completed}, actual {real_total}/{real_completed} (total/completed)")
+    return False
+
+
+def check_timestamps(session) -> bool:
+    """Report tasks whose updated_at is before their created_at."""
+    count = session.execute(select(func.count(Task.id)).where(Task.updated_at < Task.created_at)).scalar()
+    if not count:
+        print("[OK] No task was updated before it was created")
+        return True
+    print(f"[FAIL] {count:,} tasks have updated_at before created_at")
+    return False
+
+
+def print_sample(session, size: int, seed: int) -> None:
+    """Print tasks at random positions in the ID range, one index lookup each."""
+    low, high = session.execute(select(func.min(Task.id), func.max(Task.id))).one()
+    if low is None:
+        return
+    rng = random.Random(seed)
+    print(f"\n[SAMPLE] {size} random tasks:")
+    for _ in range(size):
+        task = session.execute(
+            select(Task.id, Task.user_id, Task.completed, Task.title)
+            .where(Task.id >= rng.randint(low, high))
+            .order_by(Task.id)
+            .limit(1)
+        ).first()
+        status = "[DONE]" if task.completed else "[TODO]"
+        print(f"   {status} [User: {task.user_id}] #{task.id} {task.title}")
+
+
+def verify_database_content(per_user: bool = False, top: int = 10, sample: int = 0, seed: int = 0) -> bool:
+    """Verify the database and print the report. Returns whether all checks passed."""
 
     print("[CHECK] Verifying database content...")
 
     with Session(engine) as session:
-        # Count users
-        user_count = session.query(User).count()
-        print(f"[INFO] Total users in database: {user_count}")
-
-        # Get all users
-        users = session.query(User).all()
-        for user in users:
-            print(f"   - User: {user.email} (ID: {user.id})")
+        task_count = session.execute(select(func.count(Task.id))).scalar()
+        print(f"[INFO] Total tasks in database: {task_count:,}")
+        report_users(session, per_user, top)
 
-        # Count tasks
-        task_count = session.query(Task).count()
-        print(f"[INFO] Total tasks in database: {task_count}")
+        print("\n[CHECK] Consistency checks...")
+        results = [
+            check_orphan_tasks(session),
+            check_task_counters(session),
+            check_timestamps(session),
+        ]
 
-        # Get tasks grouped by user
-        for user in users:
-            user_tasks = session.query(Task).filter(Task.user_id == user.id).all()
-            print(f"   - Tasks for {user.email}: {len(user_tasks)}")
-            for task in user_tasks:
-                status = "[DONE]" if task.completed else "[TODO]"
-                print(f"      {status} {task.title}")
+        if sample:
+            print_sample(session, sample, seed)
 
-        print(f"\n[SUCCESS] Database verification complete!")
-        print(f"[CONFIRMED] Your data is successfully stored in Neon PostgreSQL database")
-        print(f"[RECORDS] {user_count} users and {task_count} tasks are in your Neon database")
+    passed = all(results)
+    if passed:
+        print("\n[SUCCESS] Database verification complete!")
+    else:
+        print(f"\n[FAILED] {results.count(False)} consistency check(s) failed")
+    return passed
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--per-user", action="store_true", help="Stream one line per user")
+    parser.add_argument("--top", type=int, default=10, help="Show the users with the most tasks (default: 10)")
+    parser.add_argument("--sample", type=int, default=0, help="Print this many random tasks")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --sample")
+    args = parser.parse_args()
+
     print("[VERIFY] Starting database verification...")
-    verify_database_content()
-    print("[DONE] Verification completed successfully!")
\ No newline at end of file
+    ok = verify_database_content(args.per_user, args.top, args.sample, args.seed)
+    print("[DONE] Verification completed successfully!" if ok else "[DONE] Verification found problems")
+    sys.exit(0 if ok else 1)
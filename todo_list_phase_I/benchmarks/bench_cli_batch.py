@@ -0,0 +1,94 @@
+"""
+Throughput benchmark of the CLI --batch mode.
+
+Runs the same generated NDJSON operation stream (adds, status changes,
+edits and deletes) through run_batch, and applies the same operations
+without JSON decoding and encoding, for the in-memory list and for
+SqliteTodoList, to show the overhead batch mode adds on top of the
+library.
+
+Usage (from the todo_list_phase_I directory):
+    python -m benchmarks.bench_cli_batch
+    python -m benchmarks.bench_cli_batch --operations 1000000
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# commands.py imports its siblings the way main.py runs them, from src/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from commands import apply_operation, run_batch  # noqa: E402
+from sqlite_todo import SqliteTodoList  # noqa: E402
+from todo import TodoList  # noqa: E402
+
+
+def generate(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    operations, next_id = [], 1
+    for i in range(count):
+        if next_id == 1 or rng.random() < 0.5:
+            operations.append({"op": "add", "title": f"Task {i}", "description": "Generated" if i % 2 else None})
+            next_id += 1
+            continue
+        task_id = rng.randrange(1, next_id)
+        kind = rng.random()
+        if kind < 0.5:
+            operations.append({"op": "done", "id": task_id, "completed": rng.random() < 0.7})
+        elif kind < 0.8:
+            operations.append({"op": "update", "id": task_id, "title": f"Edited {i}"})
+        else:
+            operations.append({"op": "rm", "id": task_id})
+    return operations
+
+
+def direct(todo_list, operations) -> None:
+    for operation in operations:
+        try:
+            apply_operation(todo_list, operation)
+        except ValueError:
+            pass
+
+
+def batch(todo_list, lines: str) -> None:
+    run_batch(todo_list, io.StringIO(lines), io.StringIO())
+
+
+def run(count: int, seed: int):
+    operations = generate(count, seed)
+    lines = "".join(json.dumps(operation) + "\n" for operation in operations)
+    print(f"{'list':<16} {'mode':<8} {'ops/sec':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, factory in (
+            ("TodoList", TodoList),
+            ("SqliteTodoList", lambda: SqliteTodoList(os.path.join(directory, f"{time.monotonic_ns()}.db"))),
+        ):
+            for mode in ("direct", "batch"):
+                todo_list = factory()
+                start = time.perf_counter()
+                if mode == "direct":
+                    if hasattr(todo_list, "batch"):
+                        with todo_list.batch():
+                            direct(todo_list, operations)
+                    else:
+                        direct(todo_list, operations)
+                else:
+                    batch(todo_list, lines)
+                elapsed = time.perf_counter() - start
+                print(f"{name:<16} {mode:<8} {count / elapsed:>12,.0f}")
+                if hasattr(todo_list, "close"):
+                    todo_list.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.operations, args.seed)
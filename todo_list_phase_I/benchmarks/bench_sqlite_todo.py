@@ -0,0 +1,71 @@
+"""
+Bulk load and interactive latency benchmark of SqliteTodoList.
+
+Loads N tasks into a temporary database in batches, then times the
+operations the CLI performs one at a time, each in its own transaction:
+lookups, status changes, edits and deletes of random tasks, and reading
+the first page of the pending view.
+
+Usage (from the todo_list_phase_I directory):
+    python -m benchmarks.bench_sqlite_todo
+    python -m benchmarks.bench_sqlite_todo --tasks 10000000 --batch-size 100000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from itertools import islice
+
+from src.sqlite_todo import SqliteTodoList
+
+
+TITLES = ["Buy groceries", "Call the dentist", "Write the report", "Review the budget", "Plan the trip"]
+
+
+def per_op_us(func, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1_000_000
+
+
+def run(tasks: int, batch_size: int, operations: int, seed: int):
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.db")
+        with SqliteTodoList(path) as todo_list:
+            start = time.perf_counter()
+            for first in range(0, tasks, batch_size):
+                with todo_list.batch():
+                    for i in range(first, min(first + batch_size, tasks)):
+                        task_id = todo_list.add_task(TITLES[i % len(TITLES)], f"Note {i}" if i % 2 else None)
+                        if i % 3 == 0:
+                            todo_list.mark_completed(task_id)
+            elapsed = time.perf_counter() - start
+            print(f"load      {tasks:,} tasks in batches of {batch_size:,}: {elapsed:.2f} s "
+                  f"({tasks / elapsed:,.0f} tasks/sec), {os.path.getsize(path) / 2**20:.1f} MB")
+
+            def random_id():
+                return rng.randint(1, tasks)
+
+            results = {
+                "get_task": per_op_us(lambda: todo_list.get_task(random_id()), operations),
+                "mark_completed": per_op_us(lambda: todo_list.mark_completed(random_id(), rng.random() < 0.5), operations),
+                "update_task": per_op_us(lambda: todo_list.update_task(random_id(), description="Edited"), operations),
+                "delete_task": per_op_us(lambda: todo_list.delete_task(random_id()), operations),
+                "first 50 pending": per_op_us(lambda: list(islice(todo_list.iter_tasks(completed=False), 50)), operations),
+            }
+            for name, microseconds in results.items():
+                print(f"{name:<18} {microseconds:>9.1f} us/op")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Tasks per transaction while loading")
+    parser.add_argument("--operations", type=int, default=2000, help="Timed operations of each kind")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.tasks, args.batch_size, args.operations, args.seed)
@@ -0,0 +1,97 @@
+"""
+Memory benchmark of TodoList storage layouts.
+
+Builds N tasks in each layout and reports the memory they hold, measured
+with tracemalloc:
+- dict Task: the previous Task, with an instance __dict__ and a datetime;
+- TodoList: slotted Task objects with a float timestamp;
+- ColumnarTodoList: column buffers and interned strings, no Task objects.
+
+Titles are drawn from a small vocabulary, as real todo titles repeat;
+pass --unique-titles to give every task its own title.
+
+Usage (from the todo_list_phase_I directory):
+    python -m benchmarks.bench_todo_memory
+    python -m benchmarks.bench_todo_memory --sizes 100000 1000000 --unique-titles
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from datetime import datetime
+
+from src.todo import ColumnarTodoList, TodoList
+
+
+VERBS = ["Buy", "Call", "Write", "Review", "Plan", "Book", "Fix", "Pay"]
+OBJECTS = ["groceries", "report", "dentist", "presentation", "rent", "flight", "newsletter", "car"]
+
+
+class DictTask:
+    """The Task layout before __slots__: an instance dict and a datetime per task."""
+
+    def __init__(self, task_id: int, title: str, description=None, completed: bool = False):
+        self.id = task_id
+        self.title = title.strip()
+        self.description = description
+        self.completed = completed
+        self.created_at = datetime.now()
+
+
+class DictTodoList(TodoList):
+    def add_task(self, title: str, description=None) -> int:
+        task_id = self.next_id
+        self.tasks[task_id] = DictTask(task_id, title, description)
+        self._pending_ids.add(task_id)
+        self.next_id += 1
+        return task_id
+
+
+LAYOUTS = {
+    "dict Task": DictTodoList,
+    "TodoList": TodoList,
+    "ColumnarTodoList": ColumnarTodoList,
+}
+
+
+def titles(size: int, unique: bool, seed: int):
+    rng = random.Random(seed)
+    for i in range(size):
+        # Build a new string each time, as input() would
+        title = f"{rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+        yield f"{title} {i}" if unique else " ".join(title.split(" "))
+
+
+def measure(layout, size: int, unique: bool, seed: int):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    todo_list = layout()
+    for i, title in enumerate(titles(size, unique, seed)):
+        task_id = todo_list.add_task(title)
+        if i % 3 == 0:
+            todo_list.mark_completed(task_id)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del todo_list
+    return current, elapsed
+
+
+def run(sizes, unique: bool, seed: int):
+    print(f"{'tasks':>10} {'layout':<18} {'memory':>10} {'bytes/task':>11} {'build':>9}")
+    for size in sizes:
+        for name, layout in LAYOUTS.items():
+            current, elapsed = measure(layout, size, unique, seed)
+            print(f"{size:>10,} {name:<18} {current / 2**20:>7.1f} MB {current / size:>11.1f} {elapsed:>7.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--unique-titles", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.unique_titles, args.seed)
@@ -0,0 +1,91 @@
+"""
+Write and startup benchmark of the append-only task log.
+
+Adds N tasks (a third of them then completed) through a
+PersistentTodoList in a temporary directory, then measures startup:
+- replaying the whole log, as if compaction were disabled;
+- loading the snapshot written by compaction;
+- loading the snapshot plus a log just below the compaction threshold,
+  the slowest startup with the default settings.
+
+Usage (from the todo_list_phase_I directory):
+    python -m benchmarks.bench_todo_storage
+    python -m benchmarks.bench_todo_storage --tasks 1000000 --sync-every 1000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.storage import PersistentTodoList, TaskLog
+
+
+TITLES = ["Buy groceries", "Call the dentist", "Write the report", "Review the budget", "Plan the trip"]
+
+
+def open_list(directory: str, sync_every: int, compact: bool = False) -> PersistentTodoList:
+    if compact:
+        return PersistentTodoList(TaskLog(directory, sync_every=sync_every))
+    # Never compact on its own, so each startup path can be measured
+    return PersistentTodoList(TaskLog(directory, sync_every=sync_every, compact_min_records=2**62))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def size_mb(path: str) -> float:
+    return os.path.getsize(path) / 2**20
+
+
+def run(tasks: int, sync_every: int):
+    with tempfile.TemporaryDirectory() as directory:
+        todo_list = open_list(directory, sync_every)
+
+        def write():
+            for i in range(tasks):
+                task_id = todo_list.add_task(TITLES[i % len(TITLES)], f"Note {i % 100}" if i % 2 else None)
+                if i % 3 == 0:
+                    todo_list.mark_completed(task_id)
+            todo_list.close()
+
+        _, elapsed = timed(write)
+        log_path = os.path.join(directory, "tasks.0.log")
+        print(f"write     {tasks:,} tasks: {elapsed:.2f} s ({tasks / elapsed:,.0f} tasks/sec), "
+              f"log {size_mb(log_path):.1f} MB")
+
+        todo_list, elapsed = timed(lambda: open_list(directory, sync_every))
+        print(f"startup   replay {todo_list.storage.records:,} operations: {elapsed:.3f} s")
+
+        _, elapsed = timed(lambda: todo_list.storage.compact(todo_list))
+        todo_list.close()
+        snapshot_path = os.path.join(directory, "tasks.snapshot")
+        print(f"compact   snapshot {size_mb(snapshot_path):.1f} MB: {elapsed:.3f} s")
+
+        todo_list, elapsed = timed(lambda: open_list(directory, sync_every))
+        print(f"startup   load snapshot of {len(todo_list):,} tasks: {elapsed:.3f} s")
+
+        # Fill the log up to just below the default compaction threshold
+        defaults = TaskLog(directory)
+        threshold = max(defaults.compact_min_records, int(len(todo_list) * defaults.compact_ratio))
+        for i in range(threshold - 1):
+            task_id = i % len(todo_list) + 1
+            if i % 2:
+                todo_list.update_task(task_id, description=f"Edited {i}")
+            else:
+                todo_list.mark_completed(task_id, i % 4 == 0)
+        todo_list.close()
+        todo_list, elapsed = timed(lambda: open_list(directory, sync_every, compact=True))
+        print(f"startup   load snapshot and replay {todo_list.storage.records:,} operations: {elapsed:.3f} s")
+        todo_list.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--sync-every", type=int, default=100, help="Operations per fsync (default: 100)")
+    args = parser.parse_args()
+    run(args.tasks, args.sync_every)
@@ -0,0 +1,85 @@
+"""
+Scaling benchmark of TodoList views and status changes.
+
+Fills a TodoList with N tasks (a fixed share completed) and times the
+all/pending/completed views against the previous approach of filtering
+and sorting the whole task dict on every call, plus the cost of
+mark_completed and delete_task, which now maintain the status indexes.
+
+Usage (from the todo_list_phase_I directory):
+    python -m benchmarks.bench_todo_views
+    python -m benchmarks.bench_todo_views --sizes 10000 100000 1000000 --repeat 5
+"""
+
+import argparse
+import random
+import time
+
+from src.todo import TodoList
+
+
+def best_ms(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def sort_and_filter_views(todo_list: TodoList):
+    """The views as computed before the status indexes existed."""
+    tasks = todo_list.tasks
+    return (
+        sorted(tasks.values(), key=lambda x: x.id),
+        sorted([task for task in tasks.values() if not task.completed], key=lambda x: x.id),
+        sorted([task for task in tasks.values() if task.completed], key=lambda x: x.id),
+    )
+
+
+def indexed_views(todo_list: TodoList):
+    return todo_list.get_all_tasks(), todo_list.get_pending_tasks(), todo_list.get_completed_tasks()
+
+
+def build(size: int, completed_ratio: float, rng: random.Random) -> TodoList:
+    todo_list = TodoList()
+    for i in range(size):
+        todo_list.add_task(f"Task {i}")
+    for task_id in rng.sample(range(1, size + 1), int(size * completed_ratio)):
+        todo_list.mark_completed(task_id, True)
+    return todo_list
+
+
+def per_op_us(func, ids) -> float:
+    start = time.perf_counter()
+    for task_id in ids:
+        func(task_id)
+    return (time.perf_counter() - start) / len(ids) * 1_000_000
+
+
+def run(sizes, completed_ratio: float, repeat: int, operations: int, seed: int):
+    rng = random.Random(seed)
+    print(f"{'tasks':>10} {'sort+filter':>13} {'indexed':>10} {'speedup':>8} {'complete':>10} {'delete':>10}")
+    for size in sizes:
+        todo_list = build(size, completed_ratio, rng)
+        baseline = best_ms(lambda: sort_and_filter_views(todo_list), repeat)
+        indexed = best_ms(lambda: indexed_views(todo_list), repeat)
+
+        ids = rng.sample(range(1, size + 1), min(operations, size))
+        complete = per_op_us(lambda task_id: todo_list.mark_completed(task_id, not todo_list.tasks[task_id].completed), ids)
+        delete = per_op_us(todo_list.delete_task, ids)
+        print(
+            f"{size:>10,} {baseline:>10.2f} ms {indexed:>7.2f} ms {baseline / indexed:>7.1f}x"
+            f" {complete:>7.2f} us {delete:>7.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--completed-ratio", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=3, help="Best of this many runs per view")
+    parser.add_argument("--operations", type=int, default=1000, help="Status changes and deletes timed per size")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.completed_ratio, args.repeat, args.operations, args.seed)
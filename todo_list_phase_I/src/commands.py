@@ -0,0 +1,256 @@
+"""
+Non-interactive commands for the todo application.
+Contains the one-shot subcommands (add, list, done, rm, import) and the
+--batch mode, which applies NDJSON operations read from a stream.
+
+Batch operations, one JSON object per line:
+    {"op": "add", "title": "Buy milk", "description": "2 litres"}
+    {"op": "update", "id": 1, "title": "Buy oat milk"}
+    {"op": "done", "id": 1}                      ("completed": false to reopen)
+    {"op": "rm", "id": 1}
+    {"op": "list", "status": "pending"}          ("all", "pending" or "completed")
+
+Each operation produces one JSON result line, {"ok": true, ...} or
+{"ok": false, "error": "..."}, and a failed operation does not stop the
+ones after it.
+"""
+
+import json
+from contextlib import nullcontext
+from typing import Any, Dict, Iterable, List, TextIO
+
+try:
+    from .utils import display_error
+except ImportError:
+    # Run as a script with src/ on sys.path (see main.py)
+    from utils import display_error
+
+
+# json.dumps builds a new encoder per call for non-default options, and
+# json.loads adds a layer of argument handling on top of decode
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+_decode = json.JSONDecoder().decode
+# Result of every operation except list, written without the encoder
+OK_ID_RESULT = '{"ok": true, "id": %d}\n'
+
+STATUS_VIEWS = {
+    "all": "get_all_tasks",
+    "pending": "get_pending_tasks",
+    "completed": "get_completed_tasks",
+}
+# The completed argument of iter_tasks() for each view
+STATUS_FILTERS = {"all": None, "pending": False, "completed": True}
+
+
+def transaction(todo_list):
+    """Group changes into one transaction when the list supports it (SqliteTodoList.batch)."""
+    batch = getattr(todo_list, "batch", None)
+    return batch() if batch is not None else nullcontext()
+
+
+def iter_view(todo_list, status: str) -> Iterable:
+    """Stream a status view when the list supports it (SqliteTodoList.iter_tasks), else build it."""
+    iter_tasks = getattr(todo_list, "iter_tasks", None)
+    if iter_tasks is not None:
+        return iter_tasks(STATUS_FILTERS[status])
+    return getattr(todo_list, STATUS_VIEWS[status])()
+
+
+def task_to_dict(task) -> Dict[str, Any]:
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "completed": task.completed,
+        "created_at": task.created_at.isoformat(),
+    }
+
+
+def _task_id(operation: Dict[str, Any]) -> int:
+    task_id = operation.get("id")
+    if not isinstance(task_id, int) or isinstance(task_id, bool):
+        raise ValueError("'id' must be an integer")
+    return task_id
+
+
+def _optional_str(operation: Dict[str, Any], key: str):
+    value = operation.get(key)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"'{key}' must be a string")
+    return value
+
+
+def _bool(operation: Dict[str, Any], key: str, default: bool) -> bool:
+    value = operation.get(key, default)
+    if not isinstance(value, bool):
+        raise ValueError(f"'{key}' must be true or false")
+    return value
+
+
+def apply_operation(todo_list, operation: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply one batch operation.
+
+    Args:
+        todo_list: The todo list to change
+        operation (dict): Decoded operation, see the module docstring
+
+    Returns:
+        dict: Result fields to report besides "ok"; "tasks" is an iterable
+            of task dicts, read as the result is written
+
+    Raises:
+        ValueError: If the operation is invalid or its task does not exist
+    """
+    op = operation.get("op")
+    if op == "add":
+        title = _optional_str(operation, "title")
+        return {"id": todo_list.add_task(title, _optional_str(operation, "description"))}
+    if op == "update":
+        task_id = _task_id(operation)
+        title, description = _optional_str(operation, "title"), _optional_str(operation, "description")
+        if not todo_list.update_task(task_id, title, description):
+            raise ValueError(f"Task with ID {task_id} does not exist")
+        return {"id": task_id}
+    if op == "done":
+        task_id = _task_id(operation)
+        if not todo_list.mark_completed(task_id, _bool(operation, "completed", True)):
+            raise ValueError(f"Task with ID {task_id} does not exist")
+        return {"id": task_id}
+    if op == "rm":
+        task_id = _task_id(operation)
+        if not todo_list.delete_task(task_id):
+            raise ValueError(f"Task with ID {task_id} does not exist")
+        return {"id": task_id}
+    if op == "list":
+        status = operation.get("status", "all")
+        if not isinstance(status, str) or status not in STATUS_VIEWS:
+            raise ValueError("'status' must be one of: " + ", ".join(STATUS_VIEWS))
+        return {"tasks": map(task_to_dict, iter_view(todo_list, status))}
+    raise ValueError(f"Unknown operation: {op!r}")
+
+
+def run_batch(todo_list, lines: Iterable[str], out: TextIO) -> int:
+    """
+    Apply NDJSON operations in one pass and write one result line per operation.
+
+    Results are written to the (buffered) output stream as they are
+    produced, without flushing per line. Blank lines are skipped.
+
+    Args:
+        todo_list: The todo list to change
+        lines (Iterable[str]): Operation lines, e.g. sys.stdin
+        out (TextIO): Stream for the result lines
+
+    Returns:
+        int: Exit status, 1 if any operation failed and 0 otherwise
+    """
+    failed = False
+    write = out.write
+    with transaction(todo_list):
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                operation = _decode(line)
+                if not isinstance(operation, dict):
+                    raise ValueError("Operation must be a JSON object")
+                result = apply_operation(todo_list, operation)
+            except Exception as e:
+                # Any failure is reported on its own line, so one bad
+                # operation cannot abort (and roll back) the whole batch
+                failed = True
+                write(_encode({"ok": False, "error": str(e)}) + "\n")
+                continue
+            if "tasks" in result:
+                _write_tasks(write, result["tasks"])
+            else:
+                write(OK_ID_RESULT % result["id"])
+    return 1 if failed else 0
+
+
+def _write_tasks(write, tasks: Iterable[Dict[str, Any]]) -> None:
+    """Write a list result one task at a time, so the view is never held in memory."""
+    write('{"ok": true, "tasks": [')
+    separator = ""
+    for task in tasks:
+        write(separator + _encode(task))
+        separator = ", "
+    write("]}\n")
+
+
+def import_tasks(todo_list, lines: Iterable[str]) -> int:
+    """
+    Add tasks from NDJSON lines of {"title", "description", "completed"} objects.
+
+    On a SqliteTodoList the import is one transaction and a bad line adds
+    nothing; other lists keep the tasks added before it.
+
+    Args:
+        todo_list: The todo list to add to
+        lines (Iterable[str]): Task lines
+
+    Returns:
+        int: Number of tasks imported
+
+    Raises:
+        ValueError: If a line is not a valid task, with its line number
+    """
+    count = 0
+    with transaction(todo_list):
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                task = json.loads(line)
+                if not isinstance(task, dict):
+                    raise ValueError("expected a JSON object")
+                completed = _bool(task, "completed", False)
+                task_id = todo_list.add_task(_optional_str(task, "title"), _optional_str(task, "description"))
+            except ValueError as e:
+                raise ValueError(f"Line {line_number}: invalid task ({e})") from e
+            if completed:
+                todo_list.mark_completed(task_id, True)
+            count += 1
+    return count
+
+
+def run_command(todo_list, args, out: TextIO) -> int:
+    """
+    Run one subcommand parsed by main().
+
+    Args:
+        todo_list: The todo list to use
+        args: Parsed arguments with a "command" attribute
+        out (TextIO): Stream for the command output
+
+    Returns:
+        int: Exit status
+    """
+    try:
+        if args.command == "add":
+            task_id = todo_list.add_task(args.title, args.description)
+            out.write(f"{task_id}\n")
+        elif args.command == "list":
+            write = out.write
+            for task in iter_view(todo_list, args.status):
+                write(f"{task}\n")
+        elif args.command == "done":
+            missing = [task_id for task_id in args.ids if not todo_list.mark_completed(task_id, not args.undo)]
+            return _report_missing(missing)
+        elif args.command == "rm":
+            missing = [task_id for task_id in args.ids if not todo_list.delete_task(task_id)]
+            return _report_missing(missing)
+        elif args.command == "import":
+            count = import_tasks(todo_list, args.file)
+            out.write(f"Imported {count} tasks\n")
+    except ValueError as e:
+        display_error(str(e))
+        return 1
+    return 0
+
+
+def _report_missing(missing: List[int]) -> int:
+    for task_id in missing:
+        display_error(f"Task with ID {task_id} does not exist")
+    return 1 if missing else 0
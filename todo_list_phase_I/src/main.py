@@ -4,6 +4,7 @@ Main CLI entry point for the Todo application.
 Provides a command-line interface for managing todo tasks.
 """
 
+import argparse
 import sys
 import os
 from typing import Optional
@@ -12,6 +13,9 @@ from typing import Optional
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from todo import TodoList, Task
+from storage import PersistentTodoList, TaskLog
+from sqlite_todo import SqliteTodoList
+from commands import iter_view, run_batch, run_command
 from utils import display_error, display_success, safe_int_input, confirm_action
 
 
@@ -20,9 +24,15 @@ class TodoApp:
     Main application class that manages the CLI interface for the todo app.
     """
 
-    def __init__(self):
-        """Initialize the Todo application."""
-        self.todo_list = TodoList()
+    def __init__(self, todo_list: Optional[TodoList] = None):
+        """
+        Initialize the Todo application.
+
+        Args:
+            todo_list (TodoList, optional): Task storage to use, e.g. a
+                ColumnarTodoList for very large task sets (default: a new TodoList)
+        """
+        self.todo_list = todo_list if todo_list is not None else TodoList()
 
     def display_menu(self):
         """Display the main menu options."""
@@ -60,45 +70,48 @@ class TodoApp:
 
     def view_all_tasks(self):
         """View all tasks in the list."""
-        tasks = self.todo_list.get_all_tasks()
-        if not tasks:
-            print("No tasks in the list.")
-            return
-
-        print("\nAll Tasks:")
-        print("-" * 60)
-        for task in tasks:
+        shown = False
+        for task in iter_view(self.todo_list, "all"):
+            if not shown:
+                print("\nAll Tasks:")
+                print("-" * 60)
+                shown = True
             status = "✓" if task.completed else "○"
             desc = f"\n   Description: {task.description}" if task.description else ""
             print(f"[{status}] {task.id}. {task.title}{desc}")
+        if not shown:
+            print("No tasks in the list.")
+            return
         print("-" * 60)
 
     def view_pending_tasks(self):
         """View pending tasks only."""
-        tasks = self.todo_list.get_pending_tasks()
-        if not tasks:
-            print("No pending tasks.")
-            return
-
-        print("\nPending Tasks:")
-        print("-" * 60)
-        for task in tasks:
+        shown = False
+        for task in iter_view(self.todo_list, "pending"):
+            if not shown:
+                print("\nPending Tasks:")
+                print("-" * 60)
+                shown = True
             desc = f"\n   Description: {task.description}" if task.description else ""
             print(f"○ {task.id}. {task.title}{desc}")
+        if not shown:
+            print("No pending tasks.")
+            return
         print("-" * 60)
 
     def view_completed_tasks(self):
         """View completed tasks only."""
-        tasks = self.todo_list.get_completed_tasks()
-        if not tasks:
-            print("No completed tasks.")
-            return
-
-        print("\nCompleted Tasks:")
-        print("-" * 60)
-        for task in tasks:
+        shown = False
+        for task in iter_view(self.todo_list, "completed"):
+            if not shown:
+                print("\nCompleted Tasks:")
+                print("-" * 60)
+                shown = True
             desc = f"\n   Description: {task.description}" if task.description else ""
             print(f"✓ {task.id}. {task.title}{desc}")
+        if not shown:
+            print("No completed tasks.")
+            return
         print("-" * 60)
 
     def update_task(self):
@@ -165,15 +178,16 @@ class TodoApp:
 
     def mark_task_complete(self):
         """Mark a task as complete."""
-        pending_tasks = self.todo_list.get_pending_tasks()
-        if not pending_tasks:
+        shown = False
+        for task in iter_view(self.todo_list, "pending"):
+            if not shown:
+                print("\nPending Tasks:")
+                shown = True
+            print(f"{task.id}. {task.title}")
+        if not shown:
             print("No pending tasks to mark as complete.")
             return
 
-        print("\nPending Tasks:")
-        for task in pending_tasks:
-            print(f"{task.id}. {task.title}")
-
         try:
             task_id = safe_int_input("Enter task ID to mark as complete: ", 1)
 
@@ -191,15 +205,16 @@ class TodoApp:
 
     def mark_task_incomplete(self):
         """Mark a task as incomplete."""
-        completed_tasks = self.todo_list.get_completed_tasks()
-        if not completed_tasks:
+        shown = False
+        for task in iter_view(self.todo_list, "completed"):
+            if not shown:
+                print("\nCompleted Tasks:")
+                shown = True
+            print(f"{task.id}. {task.title}")
+        if not shown:
             print("No completed tasks to mark as incomplete.")
             return
 
-        print("\nCompleted Tasks:")
-        for task in completed_tasks:
-            print(f"{task.id}. {task.title}")
-
         try:
             task_id = safe_int_input("Enter task ID to mark as incomplete: ", 1)
 
@@ -252,11 +267,76 @@ class TodoApp:
                 sys.exit(0)
 
 
-def main():
-    """Main entry point for the application."""
-    app = TodoApp()
-    app.run()
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser: storage options, --batch and the subcommands."""
+    parser = argparse.ArgumentParser(
+        description="CLI Todo App. Without a subcommand or --batch, starts the interactive menu."
+    )
+    storage = parser.add_mutually_exclusive_group()
+    storage.add_argument(
+        "--data-dir",
+        help="Directory to keep tasks in between sessions (default: keep tasks in memory only)"
+    )
+    storage.add_argument(
+        "--db",
+        help="SQLite database file to keep tasks in, for task sets larger than memory"
+    )
+    parser.add_argument(
+        "--batch", action="store_true",
+        help="Apply NDJSON operations from stdin and print one JSON result per line"
+    )
+
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    add = commands.add_parser("add", help="Add a task and print its ID")
+    add.add_argument("title")
+    add.add_argument("-d", "--description")
+    list_ = commands.add_parser("list", help="Print tasks")
+    list_.add_argument("status", nargs="?", choices=["all", "pending", "completed"], default="all")
+    done = commands.add_parser("done", help="Mark tasks complete")
+    done.add_argument("ids", type=int, nargs="+", metavar="id")
+    done.add_argument("--undo", action="store_true", help="Mark the tasks incomplete instead")
+    rm = commands.add_parser("rm", help="Delete tasks")
+    rm.add_argument("ids", type=int, nargs="+", metavar="id")
+    import_ = commands.add_parser("import", help="Add tasks from an NDJSON file ('-' for stdin)")
+    import_.add_argument("file", type=argparse.FileType("r", encoding="utf-8"))
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Main entry point for the application.
+
+    Args:
+        argv (list, optional): Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        int: Exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.batch and args.command:
+        parser.error("--batch cannot be combined with a subcommand")
+    if (args.batch or args.command) and not (args.data_dir or args.db):
+        # An in-memory list would be thrown away when the command exits
+        parser.error("--batch and subcommands require --data-dir or --db")
+
+    if args.data_dir:
+        todo_list = PersistentTodoList(TaskLog(args.data_dir))
+    elif args.db:
+        todo_list = SqliteTodoList(args.db)
+    else:
+        todo_list = None
+    try:
+        if args.batch:
+            return run_batch(todo_list, sys.stdin, sys.stdout)
+        if args.command:
+            return run_command(todo_list, args, sys.stdout)
+        TodoApp(todo_list).run()
+        return 0
+    finally:
+        if todo_list is not None:
+            todo_list.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,261 @@
+"""
+SQLite storage for the todo application.
+Contains SqliteTodoList, a TodoList kept in a SQLite database file so task
+sets larger than memory stay fast to browse and change.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+from datetime import datetime
+
+try:
+    from .todo import Task, _TaskMapping
+except ImportError:
+    # Run as a script with src/ on sys.path (see main.py)
+    from todo import Task, _TaskMapping
+
+
+SCHEMA = (
+    # AUTOINCREMENT so IDs of deleted tasks are never reused, as in TodoList
+    """CREATE TABLE IF NOT EXISTS task (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT,
+        completed INTEGER NOT NULL DEFAULT 0,
+        created_at REAL NOT NULL
+    )""",
+    # Pending and completed views read this index in ID order, no sort step
+    "CREATE INDEX IF NOT EXISTS ix_task_completed_id ON task (completed, id)",
+)
+
+# Statement texts are reused verbatim so sqlite3's statement cache keeps
+# each one prepared for the lifetime of the connection
+TASK_COLUMNS = "id, title, description, completed, created_at"
+SELECT_TASK = f"SELECT {TASK_COLUMNS} FROM task WHERE id = ?"
+SELECT_ALL = f"SELECT {TASK_COLUMNS} FROM task ORDER BY id"
+SELECT_BY_STATUS = f"SELECT {TASK_COLUMNS} FROM task WHERE completed = ? ORDER BY id"
+SELECT_IDS = "SELECT id FROM task ORDER BY id"
+SELECT_EXISTS = "SELECT 1 FROM task WHERE id = ?"
+SELECT_COUNT = "SELECT COUNT(*) FROM task"
+SELECT_NEXT_ID = "SELECT seq + 1 FROM sqlite_sequence WHERE name = 'task'"
+INSERT_TASK = "INSERT INTO task (title, description, completed, created_at) VALUES (?, ?, 0, ?)"
+UPDATE_TASK = "UPDATE task SET title = COALESCE(?, title), description = COALESCE(?, description) WHERE id = ?"
+UPDATE_COMPLETED = "UPDATE task SET completed = ? WHERE id = ?"
+DELETE_TASK = "DELETE FROM task WHERE id = ?"
+
+
+def _task_from_row(row) -> Task:
+    task = Task.__new__(Task)
+    task.id, task.title, task.description, completed, task._created_at = row
+    task.completed = bool(completed)
+    return task
+
+
+class SqliteTodoList:
+    """
+    Manages a collection of tasks in a SQLite database.
+
+    Offers the same methods as TodoList. The database runs in WAL mode with
+    synchronous=NORMAL, so each change is a cheap commit that is not lost
+    if the process dies (only the last commits can be lost on power loss),
+    and readers never wait for the writer. Wrap bulk changes in batch() to
+    apply them in a single transaction.
+
+    Only the pages being read are held in memory (up to cache_size_kib), so
+    the task set can be far larger than RAM. Lookups go through the primary
+    key and the status views through an index on (completed, id).
+    Use iter_tasks() to stream a view instead of building a list.
+
+    Attributes:
+        path (str): Database file, or ":memory:"
+        tasks (Mapping): Read-only mapping of task IDs to Task objects, in ID order
+    """
+
+    def __init__(self, path: str, cache_size_kib: int = 65536):
+        """
+        Open or create a task database.
+
+        Args:
+            path (str): Database file to use, created if missing
+            cache_size_kib (int): Page cache size in KiB (default: 65536)
+        """
+        self.path = path
+        # Autocommit mode: transactions are opened explicitly in batch()
+        self._connection = sqlite3.connect(path, isolation_level=None, cached_statements=64)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.execute(f"PRAGMA cache_size = -{int(cache_size_kib)}")
+        for statement in SCHEMA:
+            self._connection.execute(statement)
+        self._in_batch = False
+        self.tasks = _TaskMapping(self)
+
+    def __enter__(self) -> "SqliteTodoList":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute(SELECT_COUNT).fetchone()[0]
+
+    @property
+    def next_id(self) -> int:
+        """The ID the next added task will get."""
+        row = self._connection.execute(SELECT_NEXT_ID).fetchone()
+        return row[0] if row else 1
+
+    @contextmanager
+    def batch(self) -> Iterator["SqliteTodoList"]:
+        """
+        Apply every change made in the block in one transaction.
+
+        The changes are committed together when the block exits, or rolled
+        back if it raises. Nested batches join the outermost one.
+        """
+        if self._in_batch:
+            yield self
+            return
+        self._connection.execute("BEGIN")
+        self._in_batch = True
+        try:
+            yield self
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        else:
+            self._connection.execute("COMMIT")
+        finally:
+            self._in_batch = False
+
+    def _has_task(self, task_id: int) -> bool:
+        return self._connection.execute(SELECT_EXISTS, (task_id,)).fetchone() is not None
+
+    def _iter_ids(self) -> Iterator[int]:
+        return (task_id for task_id, in self._connection.execute(SELECT_IDS))
+
+    def add_task(self, title: str, description: Optional[str] = None) -> int:
+        """
+        Add a new task to the list.
+
+        Args:
+            title (str): Title of the task (must be non-empty)
+            description (str, optional): Description of the task
+
+        Returns:
+            int: The ID of the newly created task
+
+        Raises:
+            ValueError: If title is empty
+        """
+        if not title or not title.strip():
+            raise ValueError("Task title cannot be empty")
+
+        cursor = self._connection.execute(INSERT_TASK, (title.strip(), description, datetime.now().timestamp()))
+        return cursor.lastrowid
+
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """
+        Get a task by its ID.
+
+        Args:
+            task_id (int): ID of the task to retrieve
+
+        Returns:
+            Task or None: A copy of the task if found, None otherwise
+        """
+        row = self._connection.execute(SELECT_TASK, (task_id,)).fetchone()
+        return _task_from_row(row) if row else None
+
+    def update_task(self, task_id: int, title: Optional[str] = None, description: Optional[str] = None) -> bool:
+        """
+        Update an existing task's title or description.
+
+        Args:
+            task_id (int): ID of the task to update
+            title (str, optional): New title for the task
+            description (str, optional): New description for the task
+
+        Returns:
+            bool: True if task was updated, False if task doesn't exist
+        """
+        if title is not None:
+            if not title or not title.strip():
+                raise ValueError("Task title cannot be empty")
+            title = title.strip()
+
+        cursor = self._connection.execute(UPDATE_TASK, (title, description, task_id))
+        return cursor.rowcount > 0
+
+    def delete_task(self, task_id: int) -> bool:
+        """
+        Delete a task by its ID.
+
+        Args:
+            task_id (int): ID of the task to delete
+
+        Returns:
+            bool: True if task was deleted, False if task doesn't exist
+        """
+        return self._connection.execute(DELETE_TASK, (task_id,)).rowcount > 0
+
+    def mark_completed(self, task_id: int, completed: bool = True) -> bool:
+        """
+        Mark a task as completed or incomplete.
+
+        Args:
+            task_id (int): ID of the task to update
+            completed (bool): Whether the task is completed (default: True)
+
+        Returns:
+            bool: True if task was updated, False if task doesn't exist
+        """
+        return self._connection.execute(UPDATE_COMPLETED, (int(bool(completed)), task_id)).rowcount > 0
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[Task]:
+        """
+        Stream tasks in ID order without loading them all into memory.
+
+        Args:
+            completed (bool, optional): Only tasks with this status (default: all tasks)
+
+        Returns:
+            Iterator[Task]: Copies of the matching tasks, read from the database as consumed
+        """
+        if completed is None:
+            cursor = self._connection.execute(SELECT_ALL)
+        else:
+            cursor = self._connection.execute(SELECT_BY_STATUS, (int(completed),))
+        return map(_task_from_row, cursor)
+
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Get all tasks in the list.
+
+        Returns:
+            List[Task]: List of all tasks, sorted by ID
+        """
+        return list(self.iter_tasks())
+
+    def get_pending_tasks(self) -> List[Task]:
+        """
+        Get all pending (not completed) tasks.
+
+        Returns:
+            List[Task]: List of pending tasks, sorted by ID
+        """
+        return list(self.iter_tasks(completed=False))
+
+    def get_completed_tasks(self) -> List[Task]:
+        """
+        Get all completed tasks.
+
+        Returns:
+            List[Task]: List of completed tasks, sorted by ID
+        """
+        return list(self.iter_tasks(completed=True))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
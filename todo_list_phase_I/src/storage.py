@@ -0,0 +1,402 @@
+"""
+Persistent storage for the todo application.
+Contains TaskLog, an append-only operation log with snapshots, and
+PersistentTodoList, a ColumnarTodoList that records every change in it.
+
+A data directory holds at most one snapshot and one log:
+    tasks.snapshot      every task as column buffers, tagged with generation G
+    tasks.G.log         operations applied after that snapshot, one JSON array per line
+
+Startup loads the snapshot and replays the log. Compaction writes a new
+snapshot with generation G + 1 next to the old one, atomically renames it
+into place, then starts tasks.(G + 1).log and removes tasks.G.log, so a
+crash at any point leaves either the old or the new pair to recover from.
+"""
+
+import json
+import os
+import struct
+import sys
+import time
+from array import array
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+try:
+    from .todo import ColumnarTodoList
+except ImportError:
+    # Run as a script with src/ on sys.path (see main.py)
+    from todo import ColumnarTodoList
+
+
+SNAPSHOT_NAME = "tasks.snapshot"
+SNAPSHOT_MAGIC = b"TODOSNAP"
+SNAPSHOT_VERSION = 1
+# magic, version, byte order, generation, next_id, rows, strings, text bytes
+SNAPSHOT_HEADER = struct.Struct("<8sIcQQQQQ")
+# Titles may hold lone surrogates (e.g. from undecodable file names), so
+# text is encoded the same way in the log and the snapshot
+TEXT_ERRORS = "surrogatepass"
+
+
+def _log_name(generation: int) -> str:
+    return f"tasks.{generation}.log"
+
+
+def _read_array(f, typecode: str, count: int, swap: bool) -> array:
+    values = array(typecode)
+    values.fromfile(f, count)
+    if swap:
+        values.byteswap()
+    return values
+
+
+class TaskLog:
+    """
+    Append-only operation log and snapshot of a ColumnarTodoList.
+
+    Each append is flushed to the OS, and fsynced in groups: after
+    sync_every operations or sync_interval seconds, whichever comes first,
+    and on close. Up to that many of the latest operations can be lost if
+    the machine dies. The log is compacted into a new snapshot once it holds
+    compact_ratio times as many operations as there are tasks (and at least
+    compact_min_records). Loading a snapshot costs far less per task than
+    replaying an operation, so this keeps startup close to snapshot speed.
+
+    Attributes:
+        directory (str): Directory holding the snapshot and log
+        generation (int): Generation of the current snapshot and log
+        records (int): Operations in the current log
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        sync_every: int = 100,
+        sync_interval: float = 1.0,
+        compact_ratio: float = 0.125,
+        compact_min_records: int = 10_000
+    ):
+        """
+        Initialize a TaskLog. Call load() before appending.
+
+        Args:
+            directory (str): Directory for the data files, created if missing
+            sync_every (int): Operations per fsync (default: 100)
+            sync_interval (float): Maximum seconds between fsyncs (default: 1.0)
+            compact_ratio (float): Log operations per task that trigger compaction (default: 0.125)
+            compact_min_records (int): Smallest log that is compacted (default: 10000)
+        """
+        self.directory = directory
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.compact_ratio = compact_ratio
+        self.compact_min_records = compact_min_records
+        self.generation = 0
+        self.records = 0
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def load(self, todo_list: ColumnarTodoList) -> Iterator[list]:
+        """
+        Load the snapshot into an empty todo list and yield the logged operations to replay.
+
+        Afterwards the log is open for appending. A partial last line, left
+        by a crash in the middle of a write, is discarded.
+
+        Args:
+            todo_list (ColumnarTodoList): Empty list to load the snapshot into
+
+        Yields:
+            list: Logged operations, oldest first
+        """
+        snapshot_path = self._path(SNAPSHOT_NAME)
+        if os.path.exists(snapshot_path):
+            self.generation = self._read_snapshot(snapshot_path, todo_list)
+
+        # Logs of older generations are left over from an interrupted compaction
+        current_log = _log_name(self.generation)
+        for name in os.listdir(self.directory):
+            if name.startswith("tasks.") and name.endswith(".log") and name != current_log:
+                os.remove(self._path(name))
+
+        log_path = self._path(current_log)
+        if os.path.exists(log_path):
+            with open(log_path, "rb") as f:
+                data = f.read()
+            records, good_size = self._parse_log(data)
+            if good_size != len(data):
+                os.truncate(log_path, good_size)
+            self.records = len(records)
+            yield from records
+
+        self._file = open(log_path, "ab")
+
+    @staticmethod
+    def _parse_log(data: bytes):
+        """Return the complete, valid records at the start of a log and their size in bytes."""
+        # Everything after the last newline is a partially written record
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return [], 0
+        try:
+            # One JSON document for the whole log is several times faster
+            # than parsing line by line
+            return json.loads((b"[" + data[:end - 1].replace(b"\n", b",") + b"]").decode("utf-8", TEXT_ERRORS)), end
+        except ValueError:
+            pass
+        records, good_size = [], 0
+        for line in data[:end].splitlines(keepends=True):
+            try:
+                records.append(json.loads(line.decode("utf-8", TEXT_ERRORS)))
+            except ValueError:
+                break
+            good_size += len(line)
+        return records, good_size
+
+    def append(self, record: list) -> None:
+        """
+        Log one operation, fsyncing when the current group is full or old enough.
+
+        The record is flushed to the OS before this returns, so callers can
+        apply the change once it is logged and a failed write changes nothing.
+
+        Args:
+            record (list): JSON-serializable operation
+        """
+        self._file.write(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8", TEXT_ERRORS) + b"\n"
+        )
+        self._file.flush()
+        self.records += 1
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Write buffered operations to disk and fsync the log."""
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def needs_compaction(self, task_count: int) -> bool:
+        """Return True if the log has grown large relative to the number of tasks."""
+        return self.records >= max(self.compact_min_records, task_count * self.compact_ratio)
+
+    def compact(self, todo_list: ColumnarTodoList) -> None:
+        """
+        Replace the snapshot and log with a snapshot of the current state.
+
+        Args:
+            todo_list (ColumnarTodoList): The list whose operations are logged here
+        """
+        generation = self.generation + 1
+        temp_path = self._path(SNAPSHOT_NAME + ".tmp")
+        self._write_snapshot(temp_path, todo_list, generation)
+        os.replace(temp_path, self._path(SNAPSHOT_NAME))
+        self._fsync_directory()
+
+        old_log = self._path(_log_name(self.generation))
+        self._file.close()
+        self.generation = generation
+        self.records = 0
+        self._unsynced = 0
+        self._file = open(self._path(_log_name(generation)), "ab")
+        os.remove(old_log)
+
+    def close(self) -> None:
+        """Fsync and close the log."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def _fsync_directory(self) -> None:
+        # Make the rename itself durable; not supported on Windows
+        if hasattr(os, "O_DIRECTORY"):
+            fd = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    @staticmethod
+    def _write_snapshot(path: str, todo_list: ColumnarTodoList, generation: int) -> None:
+        """Write the list's columns, with titles and descriptions as indexes into a string table."""
+        if todo_list._deleted:
+            todo_list._compact()
+
+        table: Dict[str, int] = {}
+        strings: List[str] = []
+
+        def index_of(value: Optional[str]) -> int:
+            if value is None:
+                return -1
+            index = table.get(value)
+            if index is None:
+                index = table[value] = len(strings)
+                strings.append(value)
+            return index
+
+        titles = array("q", map(index_of, todo_list._titles))
+        descriptions = array("q", map(index_of, todo_list._descriptions))
+        lengths = array("q", map(len, strings))
+        text = "".join(strings).encode("utf-8", TEXT_ERRORS)
+
+        with open(path, "wb") as f:
+            f.write(SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, sys.byteorder[0].encode(), generation,
+                todo_list.next_id, len(todo_list._ids), len(strings), len(text)
+            ))
+            todo_list._ids.tofile(f)
+            f.write(todo_list._status)
+            todo_list._created_at.tofile(f)
+            titles.tofile(f)
+            descriptions.tofile(f)
+            lengths.tofile(f)
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _read_snapshot(path: str, todo_list: ColumnarTodoList) -> int:
+        """Load a snapshot into an empty list and return its generation."""
+        with open(path, "rb") as f:
+            magic, version, byteorder, generation, next_id, rows, string_count, text_size = (
+                SNAPSHOT_HEADER.unpack(f.read(SNAPSHOT_HEADER.size))
+            )
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} task snapshot")
+            swap = byteorder != sys.byteorder[0].encode()
+
+            ids = _read_array(f, "q", rows, swap)
+            status = bytearray(f.read(rows))
+            created_at = _read_array(f, "d", rows, swap)
+            title_indexes = _read_array(f, "q", rows, swap)
+            description_indexes = _read_array(f, "q", rows, swap)
+            lengths = _read_array(f, "q", string_count, swap)
+            text = f.read(text_size).decode("utf-8", TEXT_ERRORS)
+
+        strings = []
+        offset = 0
+        for length in lengths:
+            strings.append(sys.intern(text[offset:offset + length]))
+            offset += length
+        # Index -1 (no description) picks the trailing None
+        strings.append(None)
+
+        todo_list._ids = ids
+        todo_list._status = status
+        todo_list._created_at = created_at
+        todo_list._titles = [strings[index] for index in title_indexes]
+        todo_list._descriptions = [strings[index] for index in description_indexes]
+        todo_list._deleted = 0
+        todo_list.next_id = next_id
+        return generation
+
+
+class PersistentTodoList(ColumnarTodoList):
+    """
+    A ColumnarTodoList whose changes survive restarts.
+
+    Every successful add, update, delete and status change is appended to
+    a TaskLog before it is applied, so a failed write leaves the list
+    unchanged, and the log is compacted into a snapshot as it grows.
+    Call close() (or use it as a context manager) to flush the log.
+
+    Attributes:
+        storage (TaskLog): The log the changes are recorded in
+    """
+
+    def __init__(self, storage: TaskLog):
+        """
+        Load the tasks stored in a TaskLog.
+
+        Args:
+            storage (TaskLog): Log to load from and record changes in
+        """
+        super().__init__()
+        self.storage = storage
+        for record in storage.load(self):
+            self._replay(record)
+
+    def __enter__(self) -> "PersistentTodoList":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _replay(self, record: list) -> None:
+        operation, task_id = record[0], record[1]
+        if operation == "add":
+            _, _, created_at, title, description = record
+            self._append_row(task_id, title, description, False, created_at)
+        elif operation == "update":
+            super().update_task(task_id, record[2], record[3])
+        elif operation == "complete":
+            super().mark_completed(task_id, record[2])
+        elif operation == "delete":
+            super().delete_task(task_id)
+        else:
+            raise ValueError(f"Unknown operation in task log: {operation!r}")
+
+    def _compact_if_needed(self) -> None:
+        if self.storage.needs_compaction(len(self)):
+            self.storage.compact(self)
+
+    def add_task(self, title: str, description: Optional[str] = None) -> int:
+        """Log a new task, then add it to the list. See TodoList.add_task."""
+        if not title or not title.strip():
+            raise ValueError("Task title cannot be empty")
+
+        task_id, title, created_at = self.next_id, title.strip(), datetime.now().timestamp()
+        self.storage.append(["add", task_id, created_at, title, description])
+        self._append_row(task_id, title, description, False, created_at)
+        self._compact_if_needed()
+        return task_id
+
+    def update_task(self, task_id: int, title: Optional[str] = None, description: Optional[str] = None) -> bool:
+        """Log a change to a task's title or description, then apply it. See TodoList.update_task."""
+        if not self._has_task(task_id):
+            return False
+        if title is not None:
+            if not title or not title.strip():
+                raise ValueError("Task title cannot be empty")
+            title = title.strip()
+
+        self.storage.append(["update", task_id, title, description])
+        super().update_task(task_id, title, description)
+        self._compact_if_needed()
+        return True
+
+    def delete_task(self, task_id: int) -> bool:
+        """Log a task's deletion, then delete it. See TodoList.delete_task."""
+        if not self._has_task(task_id):
+            return False
+
+        self.storage.append(["delete", task_id])
+        super().delete_task(task_id)
+        self._compact_if_needed()
+        return True
+
+    def mark_completed(self, task_id: int, completed: bool = True) -> bool:
+        """Log a status change, then apply it. See TodoList.mark_completed."""
+        if not self._has_task(task_id):
+            return False
+
+        self.storage.append(["complete", task_id, bool(completed)])
+        super().mark_completed(task_id, completed)
+        self._compact_if_needed()
+        return True
+
+    def close(self) -> None:
+        """Fsync and close the log."""
+        self.storage.close()
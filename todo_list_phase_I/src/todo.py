@@ -1,9 +1,14 @@
 """
 Todo application core functionality.
-Contains Task and TodoList classes for managing todo items.
+Contains Task and TodoList classes for managing todo items, and
+ColumnarTodoList, a compact drop-in TodoList for very large task sets.
 """
 
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+import sys
 import uuid
 from datetime import datetime
 
@@ -17,9 +22,21 @@ class Task:
         title (str): Required title of the task (non-empty string)
         description (str): Optional description of the task (nullable string)
         completed (bool): Boolean indicating completion status (default: False)
+        created_at (datetime): When the task was created
     """
 
-    def __init__(self, task_id: int, title: str, description: Optional[str] = None, completed: bool = False):
+    # No per-instance __dict__, and created_at is stored as a POSIX
+    # timestamp float rather than a datetime object
+    __slots__ = ("id", "title", "description", "completed", "_created_at")
+
+    def __init__(
+        self,
+        task_id: int,
+        title: str,
+        description: Optional[str] = None,
+        completed: bool = False,
+        created_at: Optional[datetime] = None
+    ):
         """
         Initialize a new Task.
 
@@ -28,6 +45,7 @@ class Task:
             title (str): Title of the task (must be non-empty)
             description (str, optional): Description of the task
             completed (bool): Completion status (default: False)
+            created_at (datetime, optional): Creation time (default: now)
 
         Raises:
             ValueError: If title is empty
@@ -39,7 +57,16 @@ class Task:
         self.title = title.strip()
         self.description = description
         self.completed = completed
-        self.created_at = datetime.now()
+        self.created_at = created_at if created_at is not None else datetime.now()
+
+    @property
+    def created_at(self) -> datetime:
+        """When the task was created, as a local naive datetime."""
+        return datetime.fromtimestamp(self._created_at)
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at = value.timestamp()
 
     def __repr__(self):
         """String representation of the Task."""
@@ -52,12 +79,57 @@ class Task:
         return f"[{status}] {self.id}. {self.title}{desc}"
 
 
+class _OrderedIdSet:
+    """
+    Set of task IDs that iterates in ascending order.
+
+    Adding an ID larger than every ID seen so far (the common case, since
+    new tasks get the next ID) keeps the set sorted; any other add marks it
+    for a re-sort on the next iteration. Add and discard are O(1).
+    """
+
+    def __init__(self):
+        """Initialize an empty set."""
+        self._ids: Dict[int, None] = {}
+        self._last = 0
+        self._sorted = True
+
+    def add(self, task_id: int) -> None:
+        """Add an ID to the set."""
+        if task_id < self._last:
+            self._sorted = False
+        else:
+            self._last = task_id
+        self._ids[task_id] = None
+
+    def discard(self, task_id: int) -> None:
+        """Remove an ID if present."""
+        self._ids.pop(task_id, None)
+
+    def __iter__(self):
+        if not self._sorted:
+            # Mostly-sorted input, which Timsort handles in close to linear time
+            self._ids = dict.fromkeys(sorted(self._ids))
+            self._last = next(reversed(self._ids), 0)
+            self._sorted = True
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+
 class TodoList:
     """
     Manages a collection of tasks in memory.
 
+    IDs are assigned in increasing order, so `tasks` is always ordered by
+    ID. Pending and completed IDs are kept in two ordered ID sets that the
+    mutating methods update incrementally, which makes every view cost
+    O(k) in the number of tasks it returns instead of a full sort.
+    Completion status must therefore be changed through mark_completed.
+
     Attributes:
-        tasks (dict): Dictionary mapping task IDs to Task objects
+        tasks (dict): Dictionary mapping task IDs to Task objects, in ID order
         next_id (int): Counter for assigning next available ID (starts at 1)
     """
 
@@ -65,6 +137,8 @@ class TodoList:
         """Initialize an empty TodoList."""
         self.tasks: Dict[int, Task] = {}
         self.next_id = 1
+        self._pending_ids = _OrderedIdSet()
+        self._completed_ids = _OrderedIdSet()
 
     def add_task(self, title: str, description: Optional[str] = None) -> int:
         """
@@ -86,6 +160,7 @@ class TodoList:
         task_id = self.next_id
         task = Task(task_id=task_id, title=title, description=description)
         self.tasks[task_id] = task
+        self._pending_ids.add(task_id)
         self.next_id += 1
         return task_id
 
@@ -138,10 +213,11 @@ class TodoList:
         Returns:
             bool: True if task was deleted, False if task doesn't exist
         """
-        if task_id not in self.tasks:
+        task = self.tasks.pop(task_id, None)
+        if task is None:
             return False
 
-        del self.tasks[task_id]
+        (self._completed_ids if task.completed else self._pending_ids).discard(task_id)
         return True
 
     def mark_completed(self, task_id: int, completed: bool = True) -> bool:
@@ -155,10 +231,17 @@ class TodoList:
         Returns:
             bool: True if task was updated, False if task doesn't exist
         """
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             return False
 
-        self.tasks[task_id].completed = completed
+        if task.completed != completed:
+            source, target = (
+                (self._pending_ids, self._completed_ids) if completed else (self._completed_ids, self._pending_ids)
+            )
+            source.discard(task_id)
+            target.add(task_id)
+            task.completed = completed
         return True
 
     def get_all_tasks(self) -> List[Task]:
@@ -168,7 +251,252 @@ class TodoList:
         Returns:
             List[Task]: List of all tasks, sorted by ID
         """
-        return sorted(self.tasks.values(), key=lambda x: x.id)
+        return list(self.tasks.values())
+
+    def get_pending_tasks(self) -> List[Task]:
+        """
+        Get all pending (not completed) tasks.
+
+        Returns:
+            List[Task]: List of pending tasks, sorted by ID
+        """
+        tasks = self.tasks
+        return [tasks[task_id] for task_id in self._pending_ids]
+
+    def get_completed_tasks(self) -> List[Task]:
+        """
+        Get all completed tasks.
+
+        Returns:
+            List[Task]: List of completed tasks, sorted by ID
+        """
+        tasks = self.tasks
+        return [tasks[task_id] for task_id in self._completed_ids]
+
+
+class _TaskMapping(Mapping):
+    """
+    Read-only ``tasks`` mapping for todo lists that do not hold Task objects.
+
+    Task objects are materialized on access. The list provides get_task,
+    __len__, _has_task(task_id) and _iter_ids() in ID order.
+    """
+
+    def __init__(self, todo_list):
+        self._todo_list = todo_list
+
+    def __getitem__(self, task_id: int) -> Task:
+        task = self._todo_list.get_task(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        return task
+
+    def __contains__(self, task_id) -> bool:
+        return self._todo_list._has_task(task_id)
+
+    def __iter__(self) -> Iterator[int]:
+        return self._todo_list._iter_ids()
+
+    def __len__(self) -> int:
+        return len(self._todo_list)
+
+    def __bool__(self) -> bool:
+        # Cheaper than counting every task when the count is not stored
+        return next(iter(self), None) is not None
+
+
+class ColumnarTodoList:
+    """
+    Manages a collection of tasks in column buffers instead of Task objects.
+
+    Offers the same methods as TodoList at a fraction of the memory for
+    large task sets. Each task is a row across parallel columns: IDs in an
+    ``array('q')``, status flags in a ``bytearray``, creation timestamps in
+    an ``array('d')``, and titles and descriptions in lists of interned
+    strings, so repeated text is stored once. Rows are kept in ID order and
+    looked up by binary search; deleted rows are compacted away once they
+    make up half of the buffers.
+
+    Task objects are only built when read, so a returned Task is a copy:
+    change tasks through update_task and mark_completed. The status views
+    scan the status column, which is O(n) but touches one byte per task.
+
+    Attributes:
+        tasks (Mapping): Read-only mapping of task IDs to Task objects, in ID order
+        next_id (int): Counter for assigning next available ID (starts at 1)
+    """
+
+    _DELETED, _PENDING, _COMPLETED = 0, 1, 2
+
+    def __init__(self):
+        """Initialize an empty ColumnarTodoList."""
+        self.next_id = 1
+        self._ids = array("q")
+        self._status = bytearray()
+        self._created_at = array("d")
+        self._titles: List[str] = []
+        self._descriptions: List[Optional[str]] = []
+        self._deleted = 0
+        self.tasks = _TaskMapping(self)
+
+    def __len__(self) -> int:
+        return len(self._ids) - self._deleted
+
+    def _has_task(self, task_id: int) -> bool:
+        return self._row(task_id) is not None
+
+    def _iter_ids(self) -> Iterator[int]:
+        return (task_id for task_id, status in zip(self._ids, self._status) if status)
+
+    def _row(self, task_id: int) -> Optional[int]:
+        """Return the row of a live task, or None."""
+        row = bisect_left(self._ids, task_id)
+        if row < len(self._ids) and self._ids[row] == task_id and self._status[row]:
+            return row
+        return None
+
+    def _task_at(self, row: int) -> Task:
+        task = Task.__new__(Task)
+        task.id = self._ids[row]
+        task.title = self._titles[row]
+        task.description = self._descriptions[row]
+        task.completed = self._status[row] == self._COMPLETED
+        task._created_at = self._created_at[row]
+        return task
+
+    def _compact(self) -> None:
+        """Drop deleted rows from every column."""
+        live = [row for row, status in enumerate(self._status) if status]
+        self._ids = array("q", (self._ids[row] for row in live))
+        self._status = bytearray(self._status[row] for row in live)
+        self._created_at = array("d", (self._created_at[row] for row in live))
+        self._titles = [self._titles[row] for row in live]
+        self._descriptions = [self._descriptions[row] for row in live]
+        self._deleted = 0
+
+    def add_task(self, title: str, description: Optional[str] = None) -> int:
+        """
+        Add a new task to the list.
+
+        Args:
+            title (str): Title of the task (must be non-empty)
+            description (str, optional): Description of the task
+
+        Returns:
+            int: The ID of the newly created task
+
+        Raises:
+            ValueError: If title is empty
+        """
+        if not title or not title.strip():
+            raise ValueError("Task title cannot be empty")
+
+        task_id = self.next_id
+        self._append_row(task_id, title.strip(), description, False, datetime.now().timestamp())
+        return task_id
+
+    def _append_row(
+        self, task_id: int, title: str, description: Optional[str], completed: bool, created_at: float
+    ) -> None:
+        """Append a task with an ID above every existing ID, keeping the rows in ID order."""
+        self._ids.append(task_id)
+        self._status.append(self._COMPLETED if completed else self._PENDING)
+        self._created_at.append(created_at)
+        self._titles.append(sys.intern(title))
+        self._descriptions.append(sys.intern(description) if description is not None else None)
+        self.next_id = max(self.next_id, task_id + 1)
+
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """
+        Get a task by its ID.
+
+        Args:
+            task_id (int): ID of the task to retrieve
+
+        Returns:
+            Task or None: A copy of the task if found, None otherwise
+        """
+        row = self._row(task_id)
+        return self._task_at(row) if row is not None else None
+
+    def update_task(self, task_id: int, title: Optional[str] = None, description: Optional[str] = None) -> bool:
+        """
+        Update an existing task's title or description.
+
+        Args:
+            task_id (int): ID of the task to update
+            title (str, optional): New title for the task
+            description (str, optional): New description for the task
+
+        Returns:
+            bool: True if task was updated, False if task doesn't exist
+        """
+        row = self._row(task_id)
+        if row is None:
+            return False
+
+        if title is not None:
+            if not title or not title.strip():
+                raise ValueError("Task title cannot be empty")
+            self._titles[row] = sys.intern(title.strip())
+
+        if description is not None:
+            self._descriptions[row] = sys.intern(description)
+
+        return True
+
+    def delete_task(self, task_id: int) -> bool:
+        """
+        Delete a task by its ID.
+
+        Args:
+            task_id (int): ID of the task to delete
+
+        Returns:
+            bool: True if task was deleted, False if task doesn't exist
+        """
+        row = self._row(task_id)
+        if row is None:
+            return False
+
+        self._status[row] = self._DELETED
+        self._titles[row] = self._descriptions[row] = None
+        self._deleted += 1
+        if self._deleted * 2 >= len(self._ids):
+            self._compact()
+        return True
+
+    def mark_completed(self, task_id: int, completed: bool = True) -> bool:
+        """
+        Mark a task as completed or incomplete.
+
+        Args:
+            task_id (int): ID of the task to update
+            completed (bool): Whether the task is completed (default: True)
+
+        Returns:
+            bool: True if task was updated, False if task doesn't exist
+        """
+        row = self._row(task_id)
+        if row is None:
+            return False
+
+        self._status[row] = self._COMPLETED if completed else self._PENDING
+        return True
+
+    def _tasks_with_status(self, wanted: int) -> List[Task]:
+        task_at = self._task_at
+        return [task_at(row) for row, status in enumerate(self._status) if status == wanted]
+
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Get all tasks in the list.
+
+        Returns:
+            List[Task]: List of all tasks, sorted by ID
+        """
+        task_at = self._task_at
+        return [task_at(row) for row, status in enumerate(self._status) if status]
 
     def get_pending_tasks(self) -> List[Task]:
         """
@@ -177,7 +505,7 @@ class TodoList:
         Returns:
             List[Task]: List of pending tasks, sorted by ID
         """
-        return sorted([task for task in self.tasks.values() if not task.completed], key=lambda x: x.id)
+        return self._tasks_with_status(self._PENDING)
 
     def get_completed_tasks(self) -> List[Task]:
         """
@@ -186,4 +514,4 @@ class TodoList:
         Returns:
             List[Task]: List of completed tasks, sorted by ID
         """
-        return sorted([task for task in self.tasks.values() if task.completed], key=lambda x: x.id)
\ No newline at end of file
+        return self._tasks_with_status(self._COMPLETED)
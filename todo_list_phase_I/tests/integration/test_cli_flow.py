@@ -3,9 +3,11 @@ Integration tests for the CLI workflow.
 Tests the end-to-end functionality of the CLI interface.
 """
 
+import io
+
 import pytest
 from unittest.mock import patch, MagicMock
-from src.main import TodoApp
+from src.main import TodoApp, main
 from src.todo import Task
 
 
@@ -144,4 +146,42 @@ class TestCliFlow:
 
         # Try to update with empty title
         with pytest.raises(ValueError, match="Task title cannot be empty"):
-            self.app.todo_list.update_task(1, "")
\ No newline at end of file
+            self.app.todo_list.update_task(1, "")
+
+
+class TestCliCommands:
+    """Integration tests for the non-interactive command line."""
+
+    def test_subcommands_share_a_database(self, tmp_path, capsys):
+        """Test add, done, list and rm as separate invocations on one database."""
+        db = str(tmp_path / "tasks.db")
+        assert main(["--db", db, "add", "First Task", "-d", "Description 1"]) == 0
+        assert main(["--db", db, "add", "Second Task"]) == 0
+        assert capsys.readouterr().out == "1\n2\n"
+
+        assert main(["--db", db, "done", "1"]) == 0
+        assert main(["--db", db, "list", "pending"]) == 0
+        assert capsys.readouterr().out == "[○] 2. Second Task\n"
+
+        assert main(["--db", db, "rm", "2"]) == 0
+        assert main(["--db", db, "list"]) == 0
+        assert capsys.readouterr().out == "[✓] 1. First Task - Description 1\n"
+
+    def test_batch_mode_reads_stdin(self, tmp_path, capsys):
+        """Test --batch applying operations from stdin to a persistent list."""
+        data_dir = str(tmp_path / "data")
+        operations = '{"op": "add", "title": "Task 1"}\n{"op": "done", "id": 1}\n'
+        with patch('sys.stdin', io.StringIO(operations)):
+            assert main(["--data-dir", data_dir, "--batch"]) == 0
+        assert capsys.readouterr().out == '{"ok": true, "id": 1}\n{"ok": true, "id": 1}\n'
+
+        assert main(["--data-dir", data_dir, "list", "completed"]) == 0
+        assert capsys.readouterr().out == "[✓] 1. Task 1\n"
+
+    @pytest.mark.parametrize("argv", [["add", "Task"], ["list"], ["--batch"]])
+    def test_commands_require_storage(self, argv, capsys):
+        """Test that subcommands and --batch refuse to run on a throwaway in-memory list."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+        assert exc_info.value.code == 2
+        assert "require --data-dir or --db" in capsys.readouterr().err
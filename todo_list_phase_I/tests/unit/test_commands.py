@@ -0,0 +1,145 @@
+"""
+Unit tests for the commands module.
+Tests the batch mode, import and subcommand functions.
+"""
+
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from src.commands import import_tasks, run_batch, run_command
+from src.sqlite_todo import SqliteTodoList
+from src.todo import TodoList
+
+
+def batch(todo_list, *operations):
+    """Run operations (dicts or raw lines) through run_batch; return the exit status and decoded results."""
+    lines = [op if isinstance(op, str) else json.dumps(op) for op in operations]
+    out = io.StringIO()
+    status = run_batch(todo_list, io.StringIO("\n".join(lines) + "\n"), out)
+    return status, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+class TestRunBatch:
+    """Test cases for the run_batch function."""
+
+    def test_applies_every_operation_in_order(self):
+        """Test a successful batch of every operation type."""
+        todo_list = TodoList()
+        status, results = batch(
+            todo_list,
+            {"op": "add", "title": "Task 1", "description": "Description 1"},
+            {"op": "add", "title": "Task 2"},
+            {"op": "update", "id": 1, "title": "Updated Task 1"},
+            {"op": "done", "id": 1},
+            {"op": "rm", "id": 2},
+            {"op": "list", "status": "completed"},
+        )
+        assert status == 0
+        assert results[:5] == [
+            {"ok": True, "id": 1}, {"ok": True, "id": 2}, {"ok": True, "id": 1},
+            {"ok": True, "id": 1}, {"ok": True, "id": 2},
+        ]
+        assert [(task["id"], task["title"], task["completed"]) for task in results[5]["tasks"]] == [
+            (1, "Updated Task 1", True)
+        ]
+
+    def test_failed_operations_are_reported_and_skipped(self):
+        """Test that invalid lines produce error results without stopping the batch."""
+        todo_list = TodoList()
+        status, results = batch(
+            todo_list,
+            "not json",
+            {"op": "add", "title": "   "},
+            {"op": "done", "id": 99},
+            {"op": "rm", "id": "1"},
+            {"op": "list", "status": "later"},
+            {"op": "list", "status": ["pending"]},
+            {"op": "archive", "id": 1},
+            "",
+            {"op": "add", "title": "Valid Task"},
+            {"op": "done", "id": 1, "completed": "false"},
+            {"op": "done", "id": 1, "completed": 0},
+        )
+        assert status == 1
+        assert [result["ok"] for result in results] == [False] * 7 + [True, False, False]
+        assert results[8]["error"] == "'completed' must be true or false"
+        assert results[1]["error"] == "Task title cannot be empty"
+        assert results[2]["error"] == "Task with ID 99 does not exist"
+        assert [(task.title, task.completed) for task in todo_list.get_all_tasks()] == [("Valid Task", False)]
+
+    def test_sqlite_batch_keeps_successful_operations(self):
+        """Test that a SqliteTodoList batch commits the operations that succeeded."""
+        with SqliteTodoList(":memory:") as todo_list:
+            status, _ = batch(todo_list, {"op": "add", "title": "Task 1"}, {"op": "done", "id": 5})
+            assert status == 1
+            assert [task.title for task in todo_list.get_all_tasks()] == ["Task 1"]
+
+    def test_unexpected_errors_do_not_abort_the_batch(self):
+        """Test that an exception other than ValueError is reported like any failed operation."""
+        class FailingTodoList(SqliteTodoList):
+            def delete_task(self, task_id):
+                raise OSError("disk full")
+
+        with FailingTodoList(":memory:") as todo_list:
+            status, results = batch(todo_list, {"op": "add", "title": "Task 1"}, {"op": "rm", "id": 1})
+            assert status == 1
+            assert results == [{"ok": True, "id": 1}, {"ok": False, "error": "disk full"}]
+            assert [task.title for task in todo_list.get_all_tasks()] == ["Task 1"]
+
+    def test_sqlite_list_is_streamed(self):
+        """Test that list reads a SqliteTodoList through iter_tasks instead of building the view."""
+        class StreamingOnly(SqliteTodoList):
+            def get_all_tasks(self):
+                raise AssertionError("view was built in memory")
+
+            get_pending_tasks = get_completed_tasks = get_all_tasks
+
+        with StreamingOnly(":memory:") as todo_list:
+            todo_list.add_task("Task 1")
+            todo_list.add_task("Task 2")
+            todo_list.mark_completed(2)
+            status, results = batch(todo_list, {"op": "list"}, {"op": "list", "status": "pending"})
+            assert status == 0
+            assert [[task["title"] for task in result["tasks"]] for result in results] == [
+                ["Task 1", "Task 2"], ["Task 1"]
+            ]
+
+            out = io.StringIO()
+            assert run_command(todo_list, SimpleNamespace(command="list", status="completed"), out) == 0
+            assert out.getvalue() == "[✓] 2. Task 2\n"
+
+
+class TestImportAndCommands:
+    """Test cases for import_tasks and run_command."""
+
+    def test_import_tasks(self):
+        """Test importing tasks with their status."""
+        todo_list = TodoList()
+        lines = io.StringIO('{"title": "Task 1", "completed": true}\n\n{"title": "Task 2", "description": "Note"}\n')
+        assert import_tasks(todo_list, lines) == 2
+        assert [(task.title, task.description, task.completed) for task in todo_list.get_all_tasks()] == [
+            ("Task 1", None, True), ("Task 2", "Note", False)
+        ]
+
+    def test_import_reports_bad_line(self):
+        """Test that an invalid task line is reported with its line number."""
+        with pytest.raises(ValueError, match="Line 2: invalid task"):
+            import_tasks(TodoList(), io.StringIO('{"title": "Task 1"}\n{"description": "No title"}\n'))
+
+    def test_import_rejects_non_boolean_completed(self):
+        """Test that "completed" must be a JSON boolean, not a truthy string."""
+        todo_list = TodoList()
+        with pytest.raises(ValueError, match="Line 1: invalid task .'completed' must be true or false"):
+            import_tasks(todo_list, io.StringIO('{"title": "Task 1", "completed": "false"}\n'))
+        assert todo_list.get_all_tasks() == []
+
+    def test_run_command_done_reports_missing_tasks(self, capsys):
+        """Test that done marks existing tasks and fails for missing ones."""
+        todo_list = TodoList()
+        todo_list.add_task("Task 1")
+        status = run_command(todo_list, SimpleNamespace(command="done", ids=[1, 2], undo=False), io.StringIO())
+        assert status == 1
+        assert todo_list.get_task(1).completed is True
+        assert "Task with ID 2 does not exist" in capsys.readouterr().err
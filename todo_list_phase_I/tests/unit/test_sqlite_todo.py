@@ -0,0 +1,119 @@
+"""
+Unit tests for the sqlite_todo module.
+Tests the SqliteTodoList class functionality.
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+from src.sqlite_todo import SqliteTodoList
+from src.todo import TodoList
+
+
+def snapshot_of(tasks):
+    return [(task.id, task.title, task.description, task.completed) for task in tasks]
+
+
+class TestSqliteTodoList:
+    """Test cases for the SqliteTodoList class."""
+
+    def setup_method(self):
+        """Set up a fresh in-memory database for each test."""
+        self.todo_list = SqliteTodoList(":memory:")
+
+    def teardown_method(self):
+        """Close the database."""
+        self.todo_list.close()
+
+    def test_add_and_get_task(self):
+        """Test adding a task and reading it back."""
+        task_id = self.todo_list.add_task("  Test Task  ", "Test Description")
+        task = self.todo_list.get_task(task_id)
+        assert task_id == 1
+        assert task.title == "Test Task"
+        assert task.description == "Test Description"
+        assert task.completed is False
+        assert isinstance(task.created_at, datetime)
+        assert self.todo_list.tasks[task_id].title == "Test Task"
+        assert task_id in self.todo_list.tasks
+        assert self.todo_list.next_id == 2
+
+    def test_missing_task(self):
+        """Test that operations on a non-existent task report failure."""
+        assert self.todo_list.get_task(1) is None
+        assert 1 not in self.todo_list.tasks
+        assert not self.todo_list.tasks
+        assert self.todo_list.update_task(1, "Title") is False
+        assert self.todo_list.mark_completed(1) is False
+        assert self.todo_list.delete_task(1) is False
+
+    def test_empty_title_raises_error(self):
+        """Test that empty titles are rejected on add and update."""
+        with pytest.raises(ValueError, match="Task title cannot be empty"):
+            self.todo_list.add_task("   ")
+        task_id = self.todo_list.add_task("Test Task")
+        with pytest.raises(ValueError, match="Task title cannot be empty"):
+            self.todo_list.update_task(task_id, "")
+
+    def test_deleted_ids_are_not_reused(self):
+        """Test that a new task never takes the ID of a deleted one."""
+        self.todo_list.add_task("Task 1")
+        task_id = self.todo_list.add_task("Task 2")
+        self.todo_list.delete_task(task_id)
+        assert self.todo_list.add_task("Task 3") == 3
+
+    def test_batch_commits_or_rolls_back_together(self):
+        """Test that a batch is applied in one transaction."""
+        with self.todo_list.batch():
+            self.todo_list.add_task("Task 1")
+            self.todo_list.add_task("Task 2")
+        with pytest.raises(ValueError):
+            with self.todo_list.batch():
+                self.todo_list.mark_completed(1)
+                self.todo_list.add_task("")
+
+        assert len(self.todo_list) == 2
+        assert snapshot_of(self.todo_list.get_pending_tasks()) == [(1, "Task 1", None, False), (2, "Task 2", None, False)]
+
+    def test_status_views_use_index(self):
+        """Test that the pending view is read from the status index without sorting."""
+        plan = self.todo_list._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM task WHERE completed = ? ORDER BY id", (0,)
+        ).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        assert "ix_task_completed_id" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_tasks_persist_in_wal_mode(self, tmp_path):
+        """Test that a database file is in WAL mode and keeps tasks after reopening."""
+        path = str(tmp_path / "tasks.db")
+        with SqliteTodoList(path) as todo_list:
+            assert todo_list._connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            task_id = todo_list.add_task("Saved Task", "Saved Description")
+            todo_list.mark_completed(task_id)
+
+        with SqliteTodoList(path) as todo_list:
+            assert snapshot_of(todo_list.get_completed_tasks()) == [(task_id, "Saved Task", "Saved Description", True)]
+
+    def test_matches_todo_list_for_random_operations(self):
+        """Test that SqliteTodoList behaves like TodoList for a random mix of operations."""
+        rng = random.Random(11)
+        expected, actual = TodoList(), self.todo_list
+        for step in range(1000):
+            task_id = rng.randint(1, expected.next_id)
+            operation = rng.random()
+            if operation < 0.4:
+                assert actual.add_task(f"Task {step}") == expected.add_task(f"Task {step}")
+            elif operation < 0.6:
+                assert actual.mark_completed(task_id, step % 3 > 0) == expected.mark_completed(task_id, step % 3 > 0)
+            elif operation < 0.8:
+                assert actual.update_task(task_id, description=f"Note {step}") == \
+                    expected.update_task(task_id, description=f"Note {step}")
+            else:
+                assert actual.delete_task(task_id) == expected.delete_task(task_id)
+
+        assert snapshot_of(actual.get_all_tasks()) == snapshot_of(expected.get_all_tasks())
+        assert snapshot_of(actual.get_pending_tasks()) == snapshot_of(expected.get_pending_tasks())
+        assert snapshot_of(actual.get_completed_tasks()) == snapshot_of(expected.get_completed_tasks())
+        assert list(actual.tasks) == list(expected.tasks)
@@ -0,0 +1,138 @@
+"""
+Unit tests for the storage module.
+Tests the TaskLog and PersistentTodoList classes functionality.
+"""
+
+import os
+
+import pytest
+from src.storage import PersistentTodoList, TaskLog
+
+
+def open_list(directory, **options) -> PersistentTodoList:
+    return PersistentTodoList(TaskLog(str(directory), **options))
+
+
+def snapshot_of(todo_list):
+    return [(task.id, task.title, task.description, task.completed) for task in todo_list.get_all_tasks()]
+
+
+class TestPersistentTodoList:
+    """Test cases for the PersistentTodoList class."""
+
+    def test_new_directory_starts_empty(self, tmp_path):
+        """Test opening an empty data directory."""
+        with open_list(tmp_path / "data") as todo_list:
+            assert todo_list.get_all_tasks() == []
+            assert todo_list.next_id == 1
+
+    def test_changes_survive_reopen(self, tmp_path):
+        """Test that every kind of change is replayed from the log."""
+        with open_list(tmp_path) as todo_list:
+            first = todo_list.add_task("First Task", "Description 1")
+            second = todo_list.add_task("Second Task")
+            third = todo_list.add_task("Third Task")
+            todo_list.update_task(first, "Updated First Task")
+            todo_list.mark_completed(second, True)
+            todo_list.delete_task(third)
+            created_at = todo_list.get_task(first).created_at
+            expected = snapshot_of(todo_list)
+
+        with open_list(tmp_path) as todo_list:
+            assert snapshot_of(todo_list) == expected
+            assert todo_list.get_task(first).created_at == created_at
+            # IDs of deleted tasks are not reused
+            assert todo_list.add_task("Fourth Task") == 4
+
+    def test_failed_operations_are_not_logged(self, tmp_path):
+        """Test that operations on missing tasks leave the log untouched."""
+        with open_list(tmp_path) as todo_list:
+            assert todo_list.update_task(99, "Title") is False
+            assert todo_list.mark_completed(99) is False
+            assert todo_list.delete_task(99) is False
+            assert todo_list.storage.records == 0
+
+    def test_failed_log_write_leaves_list_unchanged(self, tmp_path, monkeypatch):
+        """Test that a change is applied only after its record is written."""
+        with open_list(tmp_path) as todo_list:
+            task_id = todo_list.add_task("Task 1")
+            expected = snapshot_of(todo_list)
+
+            def fail(record):
+                raise OSError("No space left on device")
+
+            monkeypatch.setattr(todo_list.storage, "append", fail)
+            for change in (
+                lambda: todo_list.add_task("Task 2"),
+                lambda: todo_list.update_task(task_id, "Renamed"),
+                lambda: todo_list.mark_completed(task_id),
+                lambda: todo_list.delete_task(task_id),
+            ):
+                with pytest.raises(OSError):
+                    change()
+            assert snapshot_of(todo_list) == expected
+            assert todo_list.next_id == 2
+
+    def test_lone_surrogates_survive_log_and_snapshot(self, tmp_path):
+        """Test that text the snapshot can store can also be logged."""
+        title = "bad name \udcff"
+        with open_list(tmp_path) as todo_list:
+            todo_list.add_task(title, "\ud800")
+        with open_list(tmp_path) as todo_list:
+            assert snapshot_of(todo_list) == [(1, title, "\ud800", False)]
+            todo_list.storage.compact(todo_list)
+        with open_list(tmp_path) as todo_list:
+            assert snapshot_of(todo_list) == [(1, title, "\ud800", False)]
+
+    def test_compaction_writes_snapshot_and_starts_new_log(self, tmp_path):
+        """Test that a log longer than the task count is compacted into a snapshot."""
+        with open_list(tmp_path, compact_min_records=10) as todo_list:
+            for i in range(4):
+                todo_list.add_task(f"Task {i + 1}", "Same description")
+            for _ in range(3):
+                todo_list.mark_completed(1, True)
+                todo_list.mark_completed(1, False)
+            todo_list.delete_task(2)
+            todo_list.update_task(3, "Renamed")
+            expected = snapshot_of(todo_list)
+            assert todo_list.storage.generation == 1
+            assert todo_list.storage.records == 2
+
+        assert sorted(os.listdir(tmp_path)) == ["tasks.1.log", "tasks.snapshot"]
+        with open_list(tmp_path) as todo_list:
+            assert snapshot_of(todo_list) == expected
+            assert todo_list.next_id == 5
+
+    def test_partial_last_line_is_discarded(self, tmp_path):
+        """Test recovery from a crash in the middle of writing a log line."""
+        with open_list(tmp_path) as todo_list:
+            todo_list.add_task("Kept Task")
+        with open(tmp_path / "tasks.0.log", "ab") as f:
+            f.write(b'["add",2,17000')
+
+        with open_list(tmp_path) as todo_list:
+            assert [task.title for task in todo_list.get_all_tasks()] == ["Kept Task"]
+            assert todo_list.add_task("Next Task") == 2
+
+        with open_list(tmp_path) as todo_list:
+            assert [task.title for task in todo_list.get_all_tasks()] == ["Kept Task", "Next Task"]
+
+    def test_log_left_by_interrupted_compaction_is_ignored(self, tmp_path):
+        """Test that a log older than the snapshot is not replayed again."""
+        with open_list(tmp_path) as todo_list:
+            todo_list.add_task("Task 1")
+            todo_list.storage.compact(todo_list)
+        # As if the process died between renaming the snapshot and removing the old log
+        with open(tmp_path / "tasks.0.log", "w") as f:
+            f.write('["add",1,1700000000.0,"Task 1",null]\n')
+
+        with open_list(tmp_path) as todo_list:
+            assert [task.id for task in todo_list.get_all_tasks()] == [1]
+        assert not (tmp_path / "tasks.0.log").exists()
+
+    def test_unknown_operation_raises_error(self, tmp_path):
+        """Test that a log written by something else is rejected."""
+        with open(tmp_path / "tasks.0.log", "w") as f:
+            f.write('["rename",1,"Task"]\n')
+        with pytest.raises(ValueError, match="Unknown operation"):
+            open_list(tmp_path)
@@ -3,8 +3,11 @@ Unit tests for the todo module.
 Tests the Task and TodoList classes functionality.
 """
 
+import random
+from datetime import datetime
+
 import pytest
-from src.todo import Task, TodoList
+from src.todo import ColumnarTodoList, Task, TodoList
 
 
 class TestTask:
@@ -47,6 +50,15 @@ class TestTask:
         assert "[✓]" in str(completed_task)
         assert "[○]" in str(pending_task)
 
+    def test_task_has_no_instance_dict(self):
+        """Test that tasks use __slots__ and keep created_at as a datetime."""
+        created_at = datetime(2024, 5, 1, 12, 30)
+        task = Task(task_id=1, title="Test Task", created_at=created_at)
+        assert not hasattr(task, "__dict__")
+        assert task.created_at == created_at
+        with pytest.raises(AttributeError):
+            task.priority = "high"
+
 
 class TestTodoList:
     """Test cases for the TodoList class."""
@@ -209,4 +221,120 @@ class TestTodoList:
 
         completed_tasks = todo_list.get_completed_tasks()
         assert len(completed_tasks) == 1
-        assert completed_tasks[0].id == task_id_2
\ No newline at end of file
+        assert completed_tasks[0].id == task_id_2
+
+    def test_status_views_stay_sorted_after_status_changes(self):
+        """Test that pending and completed views stay in ID order as tasks move between them."""
+        todo_list = TodoList()
+        for i in range(1, 6):
+            todo_list.add_task(f"Task {i}")
+        todo_list.mark_completed(4, True)
+        todo_list.mark_completed(2, True)
+        todo_list.mark_completed(5, True)
+        todo_list.mark_completed(4, False)
+
+        assert [task.id for task in todo_list.get_pending_tasks()] == [1, 3, 4]
+        assert [task.id for task in todo_list.get_completed_tasks()] == [2, 5]
+
+    def test_mark_completed_twice_keeps_single_entry(self):
+        """Test that repeating a status change does not duplicate the task in a view."""
+        todo_list = TodoList()
+        task_id = todo_list.add_task("Test Task")
+        todo_list.mark_completed(task_id, True)
+        todo_list.mark_completed(task_id, True)
+
+        assert [task.id for task in todo_list.get_completed_tasks()] == [task_id]
+        assert todo_list.get_pending_tasks() == []
+
+    def test_delete_task_removes_it_from_status_views(self):
+        """Test that deleted tasks disappear from the pending and completed views."""
+        todo_list = TodoList()
+        pending_id = todo_list.add_task("Pending Task")
+        completed_id = todo_list.add_task("Completed Task")
+        todo_list.mark_completed(completed_id, True)
+
+        todo_list.delete_task(pending_id)
+        todo_list.delete_task(completed_id)
+
+        assert todo_list.get_all_tasks() == []
+        assert todo_list.get_pending_tasks() == []
+        assert todo_list.get_completed_tasks() == []
+
+
+class TestColumnarTodoList:
+    """Test cases for the ColumnarTodoList class."""
+
+    def test_add_and_get_task(self):
+        """Test adding a task and reading it back."""
+        todo_list = ColumnarTodoList()
+        task_id = todo_list.add_task("  Test Task  ", "Test Description")
+        task = todo_list.get_task(task_id)
+        assert task_id == 1
+        assert task.title == "Test Task"
+        assert task.description == "Test Description"
+        assert task.completed is False
+        assert isinstance(task.created_at, datetime)
+        assert todo_list.tasks[task_id].title == "Test Task"
+        assert task_id in todo_list.tasks
+
+    def test_missing_task(self):
+        """Test that operations on a non-existent task report failure."""
+        todo_list = ColumnarTodoList()
+        assert todo_list.get_task(1) is None
+        assert 1 not in todo_list.tasks
+        assert todo_list.update_task(1, "Title") is False
+        assert todo_list.mark_completed(1) is False
+        assert todo_list.delete_task(1) is False
+        with pytest.raises(KeyError):
+            todo_list.tasks[1]
+
+    def test_empty_title_raises_error(self):
+        """Test that empty titles are rejected on add and update."""
+        todo_list = ColumnarTodoList()
+        with pytest.raises(ValueError, match="Task title cannot be empty"):
+            todo_list.add_task("   ")
+        task_id = todo_list.add_task("Test Task")
+        with pytest.raises(ValueError, match="Task title cannot be empty"):
+            todo_list.update_task(task_id, "")
+
+    def test_titles_are_interned(self):
+        """Test that equal titles share one string object."""
+        todo_list = ColumnarTodoList()
+        first = todo_list.add_task("".join(["Buy ", "milk"]))
+        second = todo_list.add_task("".join(["Buy", " milk"]))
+        assert todo_list.get_task(first).title is todo_list.get_task(second).title
+
+    def test_deleted_ids_are_not_reused_after_compaction(self):
+        """Test that compaction keeps IDs and order intact."""
+        todo_list = ColumnarTodoList()
+        for i in range(10):
+            todo_list.add_task(f"Task {i + 1}")
+        for task_id in range(1, 7):
+            todo_list.delete_task(task_id)
+
+        assert len(todo_list.tasks) == 4
+        assert [task.id for task in todo_list.get_all_tasks()] == [7, 8, 9, 10]
+        assert todo_list.add_task("Task 11") == 11
+        assert todo_list.get_task(8).title == "Task 8"
+
+    def test_matches_todo_list_for_random_operations(self):
+        """Test that ColumnarTodoList behaves like TodoList for a random mix of operations."""
+        rng = random.Random(7)
+        expected, actual = TodoList(), ColumnarTodoList()
+        for step in range(2000):
+            task_id = rng.randint(1, max(1, expected.next_id))
+            operation = rng.random()
+            if operation < 0.4:
+                assert actual.add_task(f"Task {step % 50}") == expected.add_task(f"Task {step % 50}")
+            elif operation < 0.6:
+                assert actual.mark_completed(task_id, step % 3 > 0) == expected.mark_completed(task_id, step % 3 > 0)
+            elif operation < 0.8:
+                assert actual.update_task(task_id, description=f"Note {step}") == \
+                    expected.update_task(task_id, description=f"Note {step}")
+            else:
+                assert actual.delete_task(task_id) == expected.delete_task(task_id)
+
+        for view in ("get_all_tasks", "get_pending_tasks", "get_completed_tasks"):
+            assert [(task.id, task.title, task.description, task.completed) for task in getattr(actual, view)()] == \
+                [(task.id, task.title, task.description, task.completed) for task in getattr(expected, view)()]
+        assert list(actual.tasks) == list(expected.tasks)